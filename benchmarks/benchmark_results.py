@@ -0,0 +1,170 @@
+"""Mesure, enregistrement JSON et comparaison des résultats de la suite de benchmarks.
+
+Le sens d'une métrique se lit à son suffixe : `_ns`, `_us`, `_ms`, `_s` et `_rate` (durées,
+taux d'erreur) doivent baisser, `_per_s` (débits) doit monter. Les autres valeurs (nombre
+d'exécutions, paramètres) sont descriptives et ne sont pas comparées.
+"""
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+LOWER_IS_BETTER = ("_ns", "_us", "_ms", "_s", "_rate")
+HIGHER_IS_BETTER = ("_per_s",)
+
+
+def measure(func: Callable[[], Any], min_time_s: float = 0.2, repeat: int = 5) -> float:
+    """Durée médiane d'un appel, en secondes, sur `repeat` boucles calibrées pour durer `min_time_s` au total"""
+    loops = 1
+    while (elapsed := _time_loop(func, loops)) < min_time_s / repeat:
+        loops = _next_loops(loops, elapsed, min_time_s / repeat)
+    return statistics.median(_time_loop(func, loops) / loops for _ in range(repeat))
+
+
+async def measure_async(func: Callable[[], Awaitable[Any]], min_time_s: float = 0.2, repeat: int = 5) -> float:
+    """Comme `measure`, pour une coroutine attendue en séquence"""
+
+    async def time_loop(loops: int) -> float:
+        started_at = time.perf_counter()
+        for _ in range(loops):
+            await func()
+        return time.perf_counter() - started_at
+
+    loops = 1
+    while (elapsed := await time_loop(loops)) < min_time_s / repeat:
+        loops = _next_loops(loops, elapsed, min_time_s / repeat)
+    return statistics.median([await time_loop(loops) / loops for _ in range(repeat)])
+
+
+def _time_loop(func: Callable[[], Any], loops: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return time.perf_counter() - started_at
+
+
+def _next_loops(loops: int, elapsed: float, target_s: float) -> int:
+    if elapsed <= 0:
+        return loops * 10
+    return max(loops * 2, min(loops * 10, math.ceil(loops * target_s / elapsed)))
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Percentile au rang le plus proche d'échantillons triés"""
+    if not sorted_samples:
+        return math.nan
+    return sorted_samples[min(len(sorted_samples) - 1, max(0, math.ceil(q * len(sorted_samples)) - 1))]
+
+
+def latency_summary(samples_s: Sequence[float]) -> Dict[str, float]:
+    """p50/p90/p99 et moyenne, en millisecondes"""
+    ordered = sorted(samples_s)
+    return {
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(ordered, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3) if ordered else math.nan,
+    }
+
+
+class BenchmarkResults:
+    """Résultats d'une exécution de la suite : métriques par cas ("groupe/cas") et contexte de mesure"""
+
+    def __init__(self, results: Optional[Dict[str, Dict[str, Any]]] = None, meta: Optional[Dict[str, Any]] = None):
+        self.results: Dict[str, Dict[str, Any]] = results or {}
+        self.meta: Dict[str, Any] = meta or _environment()
+
+    def add(self, case: str, **metrics: Any) -> None:
+        self.results[case] = metrics
+        print(f"{case:<56} " + "  ".join(f"{key}={_format(value)}" for key, value in metrics.items()), flush=True)
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"meta": self.meta, "results": self.results}, file, indent=2, ensure_ascii=False)
+            file.write("\n")
+
+    @classmethod
+    def load(cls, path: str) -> "BenchmarkResults":
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["results"], data.get("meta", {}))
+
+
+@dataclass(frozen=True, slots=True)
+class MetricChange:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Variation relative, positive quand la métrique se dégrade"""
+        if self.baseline == 0:
+            return 0.0 if self.current == 0 else math.inf
+        delta = (self.current - self.baseline) / abs(self.baseline)
+        return -delta if self.metric.endswith(HIGHER_IS_BETTER) else delta
+
+
+def compare(baseline: BenchmarkResults, current: BenchmarkResults) -> List[MetricChange]:
+    """Métriques comparables présentes dans les deux résultats"""
+    changes = []
+    for case, metrics in current.results.items():
+        reference = baseline.results.get(case, {})
+        for metric, value in metrics.items():
+            if metric not in reference or not metric.endswith(LOWER_IS_BETTER + HIGHER_IS_BETTER):
+                continue
+            if _is_number(value) and _is_number(reference[metric]):
+                changes.append(MetricChange(case, metric, float(reference[metric]), float(value)))
+    return changes
+
+
+def print_comparison(baseline: BenchmarkResults, current: BenchmarkResults, threshold: float) -> int:
+    """Affiche les variations et retourne le nombre de régressions au-delà de `threshold`"""
+    regressions = 0
+    for change in compare(baseline, current):
+        marker = ""
+        if change.change > threshold:
+            regressions += 1
+            marker = "  ⚠️ régression"
+        elif change.change < -threshold:
+            marker = "  ✅ amélioration"
+        print(
+            f"{change.case:<56} {change.metric:<18} {_format(change.baseline):>12} → {_format(change.current):>12}"
+            f"  {change.change * 100:+7.1f} %{marker}"
+        )
+    missing = sorted(set(baseline.results) - set(current.results))
+    if missing:
+        print(f"Cas absents des résultats courants : {', '.join(missing)}")
+    print(f"{regressions} régression(s) au-delà de {threshold * 100:g} %")
+    return regressions
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": commit or None,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}" if abs(value) < 1000 else f"{value:,.0f}".replace(",", " ")
+    return str(value)
@@ -0,0 +1,85 @@
+"""Débit et latence de bout en bout de chaque blueprint, à plusieurs niveaux de concurrence.
+
+Les modèles sont simulés (`sim:`, latence fixe `--model-latency-ms`) : la mesure porte sur
+l'exécuteur, les agents et pydantic-ai, sans réseau. Chaque niveau lance `max(concurrence,
+--min-runs)` exécutions, au plus `concurrence` à la fois, après une exécution d'échauffement.
+
+Utilisé par `python -m benchmarks.suite` ; exécutable seul :
+python -m benchmarks.blueprint_benchmark --blueprints writer hiring --concurrency 1 10 100
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.benchmark_results import BenchmarkResults, latency_summary
+from src.application.services import WorkflowService
+from src.blueprints import BLUEPRINTS, SAMPLE_INPUTS
+
+CONCURRENCY_LEVELS = (1, 10, 100, 1000)
+
+
+async def run_level(service: WorkflowService, blueprint: str, concurrency: int, runs: int) -> Dict[str, Any]:
+    definition, initial_data = BLUEPRINTS[blueprint], SAMPLE_INPUTS[blueprint]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    steps = errors = 0
+
+    async def run_once() -> None:
+        nonlocal steps, errors
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                result = await service.execute_workflow_from_json(definition, initial_data)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started_at)
+            steps += len(result["execution_history"])
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(run_once() for _ in range(runs)))
+    elapsed = time.perf_counter() - started_at
+    return {
+        "concurrency": concurrency,
+        "runs": runs,
+        "runs_per_s": round(runs / elapsed, 2),
+        "steps_per_s": round(steps / elapsed, 1),
+        **latency_summary(latencies),
+        "error_rate": round(errors / runs, 4),
+    }
+
+
+async def run(
+    results: BenchmarkResults,
+    blueprints: Sequence[str] = tuple(BLUEPRINTS),
+    concurrency_levels: Sequence[int] = CONCURRENCY_LEVELS,
+    min_runs: int = 20,
+    model_latency_ms: float = 10.0,
+    simulation: Optional[Dict[str, Any]] = None,
+) -> None:
+    for blueprint in blueprints:
+        # Un service par blueprint : métriques et modèles simulés indépendants
+        service = WorkflowService(simulation=simulation or {"latency": model_latency_ms / 1000})
+        try:
+            await service.execute_workflow_from_json(BLUEPRINTS[blueprint], SAMPLE_INPUTS[blueprint])
+            for concurrency in concurrency_levels:
+                level = await run_level(service, blueprint, concurrency, max(concurrency, min_runs))
+                results.add(f"blueprint/{blueprint}/c={concurrency}", **level)
+        finally:
+            await service.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blueprints", nargs="+", choices=sorted(BLUEPRINTS), default=list(BLUEPRINTS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(CONCURRENCY_LEVELS))
+    parser.add_argument("--min-runs", type=int, default=20, help="Nombre minimum d'exécutions par niveau")
+    parser.add_argument("--model-latency-ms", type=float, default=10.0, help="Latence des modèles simulés")
+    args = parser.parse_args()
+    await run(BenchmarkResults(), args.blueprints, args.concurrency, args.min_runs, args.model_latency_ms)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
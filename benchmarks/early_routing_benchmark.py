@@ -0,0 +1,175 @@
+"""Latence gagnée par le routage anticipé dans une boucle writer → reviewer.
+
+Le reviewer simulé donne son verdict dans les premiers tokens puis streame lentement son
+feedback. Deux mesures, routage anticipé désactivé puis activé :
+- l'avance de la décision : délai entre la réception du verdict et la fin de la réponse ;
+- la durée d'une itération de la boucle (entre deux démarrages du writer), sans quota puis
+  avec un quota RPM sur le modèle du writer partagé avec un trafic de fond.
+
+Usage : python -m benchmarks.early_routing_benchmark --iterations 6 --feedback-s 0.4
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+from src.application.services.workflow_service import WorkflowService
+from src.core.execution_events import NodeFinished, NodeStarted
+from src.infrastructure.resilience.rate_limiter import rate_limit_scope
+
+REVIEW_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "approved": {"type": "boolean"},
+        "final_review": {"type": "boolean", "default": False},
+        "feedback": {"type": "string"},
+    },
+    "required": ["approved", "feedback"],
+}
+
+
+class SlowModels:
+    """Writer à latence fixe et reviewer qui rejette jusqu'à la dernière itération"""
+
+    def __init__(self, iterations: int, writer_s: float, verdict_s: float, feedback_s: float, chunks: int = 40):
+        self.iterations = iterations
+        self.writer_s = writer_s
+        self.verdict_s = verdict_s
+        self.feedback_s = feedback_s
+        self.chunks = chunks
+        self.reviews = 0
+        # Instant de réception du verdict, par revue
+        self.verdict_at: List[float] = []
+        self.writer = FunctionModel(self._write, stream_function=self._write_stream, model_name="writer")
+        self.reviewer = FunctionModel(self._review, stream_function=self._review_stream, model_name="reviewer")
+
+    async def _write(self, messages, info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(self.writer_s)
+        return ModelResponse(parts=[TextPart("draft")])
+
+    async def _write_stream(self, messages, info: AgentInfo):
+        await asyncio.sleep(self.writer_s)
+        yield "draft"
+
+    def _verdict(self) -> Dict[str, bool]:
+        self.reviews += 1
+        return {"approved": self.reviews % self.iterations == 0, "final_review": False}
+
+    async def _review(self, messages, info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(self.verdict_s + self.feedback_s)
+        args = {**self._verdict(), "feedback": "x" * self.chunks}
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, args)])
+
+    async def _review_stream(self, messages, info: AgentInfo):
+        await asyncio.sleep(self.verdict_s)
+        verdict = json.dumps(self._verdict())[:-1]
+        yield {0: DeltaToolCall(name=info.output_tools[0].name, json_args=f'{verdict}, "feedback": "')}
+        self.verdict_at.append(time.perf_counter())
+        for _ in range(self.chunks):
+            await asyncio.sleep(self.feedback_s / self.chunks)
+            yield {0: DeltaToolCall(json_args="x")}
+        yield {0: DeltaToolCall(json_args='"}')}
+
+
+def loop_workflow(models: SlowModels) -> Dict:
+    return {
+        "name": "early_routing_benchmark",
+        "description": "Boucle writer → reviewer",
+        "start_node": "writer",
+        "nodes": [
+            {"id": "writer", "name": "Writer", "type": "process", "agent_config": {"name": "Writer", "system_prompt": "Write.", "model": models.writer}},
+            {
+                "id": "reviewer",
+                "name": "Reviewer",
+                "type": "decision",
+                "agent_config": {
+                    "name": "Reviewer",
+                    "node_type": "decision",
+                    "system_prompt": "Review.",
+                    "model": models.reviewer,
+                    "output_schema": REVIEW_SCHEMA,
+                },
+            },
+            {"id": "end", "name": "End", "type": "end", "agent_config": {}},
+        ],
+        "edges": [
+            {"from_node": "writer", "to_node": "reviewer"},
+            {"from_node": "reviewer", "to_node": "end", "condition": "approved"},
+            {"from_node": "reviewer", "to_node": "writer", "condition": "rejected_not_final"},
+        ],
+    }
+
+
+async def background_load(service: WorkflowService, model: str, stop: asyncio.Event) -> None:
+    """Autre workflow qui consomme en continu le quota du modèle"""
+    limiter = service.rate_limiter.limiter(model)
+    with rate_limit_scope("background"):
+        while not stop.is_set():
+            await limiter.acquire(0)
+
+
+async def measure(args: argparse.Namespace, early_routing: bool, requests_per_minute: float = None) -> Dict[str, float]:
+    rate_limits = {"writer": {"requests_per_minute": requests_per_minute}} if requests_per_minute else None
+    service = WorkflowService(rate_limits=rate_limits, early_routing=early_routing)
+    models = SlowModels(args.iterations, args.writer_s, args.verdict_s, args.feedback_s)
+    workflow = loop_workflow(models)
+
+    stop = asyncio.Event()
+    background = asyncio.create_task(background_load(service, "writer", stop)) if rate_limits else None
+    iterations: List[float] = []
+    leads: List[float] = []
+    try:
+        for _ in range(args.runs):
+            writer_starts: List[float] = []
+            async for event in service.execute_stream_from_json(workflow, "Sujet"):
+                if isinstance(event, NodeStarted) and event.node_id == "writer":
+                    writer_starts.append(time.perf_counter())
+                elif isinstance(event, NodeFinished) and event.node_id == "reviewer":
+                    leads.append(time.perf_counter() - models.verdict_at[-1])
+            iterations.extend(b - a for a, b in zip(writer_starts, writer_starts[1:]))
+    finally:
+        stop.set()
+        if background is not None:
+            await background
+        await service.aclose()
+
+    return {
+        "iteration_ms": statistics.mean(iterations) * 1000,
+        "iteration_p90_ms": statistics.quantiles(iterations, n=10)[-1] * 1000,
+        "decision_lead_ms": statistics.mean(leads) * 1000,
+        "early_routes": sum(sample["value"] for sample in service.get_metrics().get("workflow_node_early_routes_total", [])),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=6, help="Itérations de la boucle par exécution")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--writer-s", type=float, default=0.1, help="Latence du writer")
+    parser.add_argument("--verdict-s", type=float, default=0.05, help="Délai avant le verdict du reviewer")
+    parser.add_argument("--feedback-s", type=float, default=0.4, help="Durée de streaming du feedback")
+    parser.add_argument("--rpm", type=float, default=120, help="Quota RPM du writer pour le scénario avec contention")
+    args = parser.parse_args()
+
+    results = {}
+    for scenario, rpm in (("no_quota", None), (f"shared_quota_{args.rpm:g}rpm", args.rpm)):
+        for early_routing in (False, True):
+            name = f"{scenario}/{'early' if early_routing else 'baseline'}"
+            results[name] = await measure(args, early_routing, rpm)
+            row = results[name]
+            print(
+                f"{name:<32} itération {row['iteration_ms']:7.1f} ms (p90 {row['iteration_p90_ms']:7.1f} ms)"
+                f"  avance de la décision {row['decision_lead_ms']:6.1f} ms  routages anticipés {row['early_routes']:g}"
+            )
+        baseline, early = results[f"{scenario}/baseline"], results[f"{scenario}/early"]
+        print(f"{scenario:<32} gain par itération {baseline['iteration_ms'] - early['iteration_ms']:+.1f} ms\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
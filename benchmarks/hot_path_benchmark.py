@@ -0,0 +1,196 @@
+"""Coût du chemin critique, hors modèle : exécuteur, conditions, outils et construction d'agents.
+
+- `executor` : surcoût par étape de l'exécuteur (agents instantanés) selon le nombre de nœuds
+  et d'arêtes sortantes par nœud ;
+- `conditions` : débit de ConditionEvaluator.evaluate par forme de condition et de résultat ;
+- `tools` : recherche dans le ToolRegistry, appel d'un outil enregistré (avec et sans span actif)
+  et appel d'outil complet par un agent au modèle simulé ;
+- `agents` : construction d'un agent par configuration, et agent partagé déjà construit.
+
+Utilisé par `python -m benchmarks.suite` ; exécutable seul : python -m benchmarks.hot_path_benchmark
+"""
+
+import asyncio
+import inspect
+from typing import Any, Dict, Optional, Sequence
+
+from benchmarks.benchmark_results import BenchmarkResults, measure, measure_async
+from src.core.compiled_workflow import CompiledWorkflow
+from src.core.condition_evaluator import ConditionEvaluator
+from src.domain.entities.workflow_node import WorkflowNode
+from src.domain.interfaces.i_agent import IAgent
+from src.infrastructure.converters.workflow_converter import WorkflowConverter
+from src.infrastructure.executors.workflow_executor import WorkflowExecutor
+from src.infrastructure.factories.agent_factory import AgentFactory
+from src.infrastructure.metrics.workflow_metrics import WorkflowMetrics
+from src.infrastructure.tools import tool_registry
+from src.infrastructure.tracing.memory_span_exporter import MemorySpanExporter
+from src.infrastructure.tracing.tracer import Tracer
+
+GROUPS = ("executor", "conditions", "tools", "agents")
+SIM_MODEL = "sim:openai:gpt-4o-mini"
+
+# Condition évaluée et résultat du nœud, par cas
+CONDITION_CASES = {
+    "unconditional": (None, {"approved": True}),
+    "field": ("approved", {"approved": True, "feedback": "ok"}),
+    "negative": ("rejected", {"approved": False, "feedback": "à revoir"}),
+    "status": ("status_done", {"status": "done"}),
+    "special": ("rejected_not_final", {"approved": False, "final_review": False}),
+    "json_string": ("approved", '{"approved": true, "feedback": "ok"}'),
+    "plain_text": ("approved", "Texte libre renvoyé par le modèle, sans JSON."),
+}
+
+REVIEW_SCHEMA = {
+    "type": "object",
+    "properties": {"approved": {"type": "boolean"}, "score": {"type": "integer"}, "feedback": {"type": "string"}},
+    "required": ["approved", "feedback"],
+}
+
+AGENT_CONFIGS = {
+    "plain": {"name": "Writer", "model": SIM_MODEL, "system_prompt": "Write."},
+    "tools": {"name": "Assistant", "model": SIM_MODEL, "system_prompt": "Help."},
+    "typed_output": {"name": "Reviewer", "model": SIM_MODEL, "node_type": "decision", "output_schema": REVIEW_SCHEMA},
+    "resilient_cascade": {
+        "name": "Reviewer",
+        "model": SIM_MODEL,
+        "node_type": "decision",
+        "retry": {"max_attempts": 3},
+        "fallback_model": "sim:anthropic:claude-3-5-haiku-latest",
+        "cascade": {"models": ["sim:groq:llama-3.1-8b-instant"], "required_fields": ["approved"]},
+    },
+}
+TOOL_NAMES = ["word_count", "current_time", "grammar_check"]
+
+
+class InstantAgent(IAgent):
+    """Agent sans modèle qui renvoie son entrée : la durée d'une exécution est celle de l'exécuteur"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return input_data
+
+    def get_name(self) -> str:
+        return self.name
+
+
+class InstantAgentFactory(AgentFactory):
+    def create_agent(self, agent_config: Dict[str, Any], node: WorkflowNode = None) -> IAgent:
+        return InstantAgent(agent_config.get("name", "Instant"))
+
+
+def chain_workflow(nodes: int, edges_per_node: int) -> Dict[str, Any]:
+    """Chaîne de `nodes` nœuds ; chacun a `edges_per_node - 1` arêtes conditionnelles jamais vraies, puis l'arête suivante"""
+    definition_nodes = [
+        {"id": f"n{index}", "name": f"Node {index}", "type": "process", "agent_config": {"name": f"Agent{index}", "model": SIM_MODEL}}
+        for index in range(nodes)
+    ]
+    definition_nodes.append({"id": "end", "name": "End", "type": "end", "agent_config": {}})
+    edges = []
+    for index in range(nodes):
+        edges.extend({"from_node": f"n{index}", "to_node": "n0", "condition": f"status_skip_{branch}"} for branch in range(edges_per_node - 1))
+        edges.append({"from_node": f"n{index}", "to_node": f"n{index + 1}" if index + 1 < nodes else "end"})
+    return {
+        "name": f"chain_{nodes}x{edges_per_node}",
+        "description": "Chaîne de nœuds pour mesurer l'exécuteur",
+        "start_node": "n0",
+        "max_total_iterations": nodes + 1,
+        "nodes": definition_nodes,
+        "edges": edges,
+    }
+
+
+async def bench_executor(results: BenchmarkResults, node_counts: Sequence[int], edge_counts: Sequence[int], min_time_s: float) -> None:
+    factory = InstantAgentFactory()
+    # Métriques activées comme dans le WorkflowService
+    executor = WorkflowExecutor(factory, metrics=WorkflowMetrics())
+    converter = WorkflowConverter(factory)
+    for nodes in node_counts:
+        for edges_per_node in edge_counts:
+            definition = chain_workflow(nodes, edges_per_node)
+            workflow = CompiledWorkflow.from_definition(converter.json_to_workflow(definition), source=definition)
+            run_s = await measure_async(lambda: executor.execute(workflow, {"topic": "benchmark"}), min_time_s)
+            # Le nœud end compte comme une étape
+            results.add(
+                f"executor/nodes={nodes},edges={edges_per_node}",
+                steps=nodes + 1,
+                run_us=round(run_s * 1e6, 2),
+                step_us=round(run_s / (nodes + 1) * 1e6, 3),
+            )
+
+
+def bench_conditions(results: BenchmarkResults, min_time_s: float) -> None:
+    evaluate = ConditionEvaluator.evaluate
+    context: Dict[str, Any] = {}
+    for name, (condition, result) in CONDITION_CASES.items():
+        call_s = measure(lambda: evaluate(condition, result, context), min_time_s)
+        results.add(f"conditions/{name}", call_ns=round(call_s * 1e9, 1), calls_per_s=round(1 / call_s))
+
+
+async def bench_tools(results: BenchmarkResults, min_time_s: float) -> None:
+    call_s = measure(lambda: tool_registry.get_tools(TOOL_NAMES), min_time_s)
+    results.add("tools/registry_lookup", tools=len(TOOL_NAMES), call_ns=round(call_s * 1e9, 1))
+
+    # Appel de la fonction enregistrée (wrappers cancellable et traced) contre la fonction nue
+    function = tool_registry.get_tools(["word_count"])[0].function
+    raw_function = inspect.unwrap(function)
+    text = "Les agents collaborent dans un workflow"
+    raw_s = await measure_async(lambda: raw_function(text=text), min_time_s)
+    wrapped_s = await measure_async(lambda: function(text=text), min_time_s)
+    with Tracer(MemorySpanExporter(max_spans=1000)).span("benchmark"):
+        traced_s = await measure_async(lambda: function(text=text), min_time_s)
+    results.add(
+        "tools/dispatch",
+        raw_call_us=round(raw_s * 1e6, 3),
+        call_us=round(wrapped_s * 1e6, 3),
+        traced_call_us=round(traced_s * 1e6, 3),
+    )
+
+    # Appel d'outil complet via pydantic-ai : requête, appel d'outil, retour, réponse
+    factory = AgentFactory()
+    node = WorkflowNode(id="assistant", name="Assistant", type="process", agent_config={}, tools=["word_count"])
+    plain = factory.create_agent(AGENT_CONFIGS["plain"])
+    with_tool = factory.create_agent({**AGENT_CONFIGS["tools"], "simulation": {"tool_calls": ["word_count"]}}, node)
+    plain_s = await measure_async(lambda: plain.execute({"text": text}, {}), min_time_s)
+    tool_s = await measure_async(lambda: with_tool.execute({"text": text}, {}), min_time_s)
+    results.add("tools/agent_tool_call", agent_call_us=round(plain_s * 1e6, 1), agent_tool_call_us=round(tool_s * 1e6, 1))
+    await factory.aclose()
+
+
+def bench_agents(results: BenchmarkResults, min_time_s: float) -> None:
+    factory = AgentFactory()
+    tool_node = WorkflowNode(id="assistant", name="Assistant", type="process", agent_config={}, tools=TOOL_NAMES)
+    for name, config in AGENT_CONFIGS.items():
+        node: Optional[WorkflowNode] = tool_node if name == "tools" else None
+        call_s = measure(lambda: factory.create_agent(config, node), min_time_s)
+        results.add(f"agents/create_{name}", call_us=round(call_s * 1e6, 2))
+
+    definition = chain_workflow(1, 1)
+    workflow = CompiledWorkflow.from_definition(WorkflowConverter(factory).json_to_workflow(definition))
+    compiled_node = workflow.get_node("n0")
+    factory.get_agent(compiled_node)
+    call_s = measure(lambda: factory.get_agent(compiled_node), min_time_s)
+    results.add("agents/get_shared", call_ns=round(call_s * 1e9, 1))
+
+
+async def run(
+    results: BenchmarkResults,
+    groups: Sequence[str],
+    node_counts: Sequence[int] = (2, 8, 32),
+    edge_counts: Sequence[int] = (1, 4, 16),
+    min_time_s: float = 0.2,
+) -> None:
+    if "executor" in groups:
+        await bench_executor(results, node_counts, edge_counts, min_time_s)
+    if "conditions" in groups:
+        bench_conditions(results, min_time_s)
+    if "tools" in groups:
+        await bench_tools(results, min_time_s)
+    if "agents" in groups:
+        bench_agents(results, min_time_s)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(BenchmarkResults(), GROUPS))
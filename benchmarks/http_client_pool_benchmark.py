@@ -0,0 +1,136 @@
+"""Coût de connexion par appel au modèle, contre un serveur local compatible OpenAI.
+
+Compare trois configurations de client HTTP pour les mêmes appels d'agent :
+- `client_per_call` : un nouveau client (donc une nouvelle connexion) par appel ;
+- `pydantic_ai_default` : le client mis en cache par pydantic-ai (limites httpx par défaut) ;
+- `shared_pool` : le HttpClientPool de l'AgentFactory.
+
+Usage : python -m benchmarks.http_client_pool_benchmark --calls 200 --concurrency 1 50 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from src.infrastructure.agents.pydantic_agent import PydanticAgent
+from src.infrastructure.http.http_client_pool import HttpClientPool
+
+COMPLETION = json.dumps(
+    {
+        "id": "bench",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": "ok"}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+    }
+).encode()
+
+
+MODES = ("client_per_call", "pydantic_ai_default", "shared_pool")
+
+
+class StandInServer:
+    """Serveur HTTP/1.1 keep-alive minimal qui répond à tout POST par une complétion fixe"""
+
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.connections = 0
+        self._server = None
+        self._writers = set()
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers = dict(line.split(": ", 1) for line in head.decode("latin-1").split("\r\n")[1:] if ": " in line)
+                length = int(next((value for key, value in headers.items() if key.lower() == "content-length"), 0))
+                await reader.readexactly(length)
+                if self.latency_s:
+                    await asyncio.sleep(self.latency_s)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(COMPLETION)}\r\n\r\n".encode()
+                    + COMPLETION
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def stop(self) -> None:
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+
+
+async def run_mode(mode: str, server: StandInServer, calls: int, concurrency: int) -> dict:
+    config = {"name": "Bench", "model": "openai:gpt-4o-mini"}
+    pool = HttpClientPool(http2=False) if mode == "shared_pool" else None
+    shared_agent = PydanticAgent(config, http_clients=pool) if mode != "client_per_call" else None
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def call(index: int) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            if shared_agent is not None:
+                await shared_agent.execute({"i": index}, {})
+            else:
+                own_pool = HttpClientPool(http2=False)
+                await PydanticAgent(config, http_clients=own_pool).execute({"i": index}, {})
+                await own_pool.aclose()
+            latencies.append(time.perf_counter() - started_at)
+
+    connections_before = server.connections
+    started_at = time.perf_counter()
+    await asyncio.gather(*(call(index) for index in range(calls)))
+    elapsed = time.perf_counter() - started_at
+    if pool is not None:
+        await pool.aclose()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "calls_per_s": round(calls / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        "connections": server.connections - connections_before,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 50, 200])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Latence simulée du serveur par requête")
+    args = parser.parse_args()
+
+    server = StandInServer(args.latency_ms / 1000)
+    port = await server.start()
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+    try:
+        for concurrency in args.concurrency:
+            for mode in args.modes:
+                print(json.dumps(await run_mode(mode, server, args.calls, concurrency)))
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
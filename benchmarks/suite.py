@@ -0,0 +1,77 @@
+"""Suite de benchmarks hors ligne (modèles simulés) : résultats JSON et comparaison à une référence.
+
+Groupes : executor, conditions, tools, agents (chemin critique, voir hot_path_benchmark) et
+blueprints (bout en bout, voir blueprint_benchmark).
+
+Usage :
+  python -m benchmarks.suite run --output baseline.json
+  python -m benchmarks.suite run --groups executor conditions --output current.json
+  python -m benchmarks.suite compare baseline.json current.json --threshold 0.15
+  python -m benchmarks.suite run --quick --output current.json --baseline baseline.json
+
+`compare` (et `run --baseline`) sort avec le code 1 si une métrique se dégrade au-delà du seuil.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from benchmarks import blueprint_benchmark, hot_path_benchmark
+from benchmarks.benchmark_results import BenchmarkResults, print_comparison
+from src.blueprints import BLUEPRINTS
+from src.infrastructure.logs.log_setup import configure_logging
+
+GROUPS = hot_path_benchmark.GROUPS + ("blueprints",)
+
+
+async def run_suite(args: argparse.Namespace) -> BenchmarkResults:
+    results = BenchmarkResults()
+    results.meta["args"] = {key: value for key, value in vars(args).items() if key not in ("command", "output", "baseline")}
+    await hot_path_benchmark.run(results, args.groups, args.nodes, args.edges, args.min_time_s)
+    if "blueprints" in args.groups:
+        await blueprint_benchmark.run(results, args.blueprints, args.concurrency, args.min_runs, args.model_latency_ms)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Exécute la suite et écrit les résultats en JSON")
+    run.add_argument("--output", "-o", default="benchmark-results.json")
+    run.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS))
+    run.add_argument("--quick", action="store_true", help="Mesures courtes et concurrence limitée à 100 (vérification rapide)")
+    run.add_argument("--min-time-s", type=float, default=0.5, help="Durée de mesure de chaque micro-benchmark")
+    run.add_argument("--nodes", type=int, nargs="+", default=[2, 8, 32], help="Nombres de nœuds du benchmark de l'exécuteur")
+    run.add_argument("--edges", type=int, nargs="+", default=[1, 4, 16], help="Arêtes sortantes par nœud")
+    run.add_argument("--blueprints", nargs="+", choices=sorted(BLUEPRINTS), default=list(BLUEPRINTS))
+    run.add_argument("--concurrency", type=int, nargs="+", default=list(blueprint_benchmark.CONCURRENCY_LEVELS))
+    run.add_argument("--min-runs", type=int, default=20, help="Nombre minimum d'exécutions par niveau de concurrence")
+    run.add_argument("--model-latency-ms", type=float, default=10.0, help="Latence des modèles simulés")
+    run.add_argument("--baseline", help="Résultats de référence à comparer à la fin de l'exécution")
+    run.add_argument("--threshold", type=float, default=0.10, help="Dégradation relative tolérée (0.10 = 10 %%)")
+
+    compare = commands.add_parser("compare", help="Compare deux fichiers de résultats")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Dégradation relative tolérée (0.10 = 10 %%)")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return 1 if print_comparison(BenchmarkResults.load(args.baseline), BenchmarkResults.load(args.current), args.threshold) else 0
+
+    if args.quick:
+        args.min_time_s = min(args.min_time_s, 0.1)
+        args.concurrency = [level for level in args.concurrency if level <= 100]
+    # Les logs d'exécution des workflows fausseraient les mesures
+    configure_logging("WARNING")
+    results = asyncio.run(run_suite(args))
+    results.save(args.output)
+    print(f"📄 Résultats écrits dans {args.output}")
+    if args.baseline:
+        return 1 if print_comparison(BenchmarkResults.load(args.baseline), results, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
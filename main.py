@@ -1,16 +1,26 @@
 import argparse
 import asyncio
+import itertools
+import json
+import os
 
 from dotenv import load_dotenv
 
-from src.application.services import WorkflowService
+from src.application.services import LoadGenerator, LoadProfile, LoadTarget, WorkflowService
 from src.blueprints import (
     ADVANCED_CONTENT_WORKFLOW,
+    BLUEPRINTS,
     DEVELOPMENT_WORKFLOW,
     HIRING_WORKFLOW,
+    MONO_AGENT_WITH_TOOLS,
+    PARALLEL_HIRING_WORKFLOW,
+    REQUIREMENTS_MAP_WORKFLOW,
+    SAMPLE_INPUTS,
     TOOLS_TEST_WORKFLOW,
     WRITER_REVIEWER_WORKFLOW,
 )
+from src.infrastructure.logs.log_setup import configure_logging
+from src.infrastructure.simulation.cassette import Cassette
 
 load_dotenv()
 
@@ -131,6 +141,145 @@ async def run_hiring_workflow_junior(workflow_service):
     return result
 
 
+def read_jsonl(path, skip=0):
+    """Lit un fichier JSONL ligne par ligne (une entrée par ligne non vide)"""
+    with open(path, "r", encoding="utf-8") as f:
+        entries = (json.loads(line) for line in f if line.strip())
+        yield from itertools.islice(entries, skip, None)
+
+
+def count_completed(path):
+    """Nombre de résultats complets d'un fichier JSONL.
+
+    Une ligne tronquée par une écriture interrompue (sans fin de ligne ou JSON invalide) est
+    supprimée du fichier, avec ce qui la suit : son entrée sera ré-exécutée.
+    """
+    if not os.path.exists(path):
+        return 0
+    completed = valid_size = 0
+    with open(path, "rb+") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                completed += 1
+            valid_size += len(line)
+        f.truncate(valid_size)
+    return completed
+
+
+async def run_batch(workflow_service, args):
+    """Exécute un blueprint sur chaque ligne d'un fichier JSONL, avec reprise possible"""
+    output_path = args.batch_output or f"{args.batch}.results.jsonl"
+
+    # Les résultats sont écrits dans l'ordre des entrées : le nombre de lignes complètes
+    # déjà écrites est donc l'offset de la première entrée à exécuter
+    offset = count_completed(output_path) if args.resume else 0
+    if offset:
+        print(f"⏩ Reprise à partir de l'entrée {offset}")
+
+    succeeded = failed = 0
+    with open(output_path, "a" if args.resume else "w", encoding="utf-8") as output:
+        async for item in workflow_service.execute_many(
+            BLUEPRINTS[args.workflow],
+            read_jsonl(args.batch, skip=offset),
+            concurrency=args.concurrency,
+            preserve_order=True,
+            start_index=offset,
+        ):
+            record = {"index": item.index}
+            if item.succeeded:
+                succeeded += 1
+                record.update(
+                    final_result=item.result["final_result"],
+                    node_iterations=item.result["node_iterations"],
+                    total_iterations=item.result["total_iterations"],
+                )
+            else:
+                failed += 1
+                record["error"] = f"{type(item.error).__name__}: {item.error}"
+            output.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            output.flush()
+
+    print(f"📦 Lot terminé: {succeeded} succès, {failed} échecs → {output_path}")
+
+
+def format_ms(latency_s):
+    return "-" if latency_s is None else f"{latency_s * 1000:.1f}"
+
+
+def print_load_progress(report):
+    """Ligne du rapport en direct"""
+    percentiles = report.percentiles(report.latencies_s())
+    waiting = f", {report.queued} en attente" if report.queued else ""
+    print(
+        f"⏱️  {report.elapsed_s:6.1f}s | {report.finished} terminées ({report.failed} erreurs) | {report.in_flight} en cours{waiting}"
+        f" | {report.throughput:.1f} exéc/s | p50 {format_ms(percentiles['p50'])} ms p99 {format_ms(percentiles['p99'])} ms"
+        f" | {report.tokens_per_s:.0f} tokens/s",
+        flush=True,
+    )
+
+
+def print_load_report(report):
+    """Rapport final : débit, latences par blueprint et par nœud, erreurs et tokens"""
+    print("\n📈 RAPPORT DE CHARGE:")
+    print(f"   • Durée: {report.elapsed_s:.1f} s, {report.finished} exécutions ({report.throughput:.1f}/s), {report.max_in_flight} simultanées au plus")
+    error_rate = report.failed / report.finished if report.finished else 0.0
+    print(f"   • Erreurs: {report.failed} ({error_rate:.1%})")
+    tokens = " + ".join(f"{value:.0f} {kind}" for kind, value in sorted(report.tokens.items())) or "0"
+    print(f"   • Tokens: {tokens} → {report.tokens_per_s:.0f} tokens/s")
+
+    print("\n🔁 Par exécution (latence en ms):")
+    print(f"   {'blueprint':<20} {'exéc.':>7} {'erreurs':>8} {'p50':>9} {'p90':>9} {'p99':>9}")
+    for name, stats in report.targets.items():
+        percentiles = report.percentiles(stats.latencies_s)
+        print(
+            f"   {name:<20} {stats.finished:>7} {stats.error_rate:>8.1%} {format_ms(percentiles['p50']):>9}"
+            f" {format_ms(percentiles['p90']):>9} {format_ms(percentiles['p99']):>9}"
+        )
+        for error, count in stats.errors.most_common():
+            print(f"      ⚠️ {error}: {count}")
+
+    print("\n🧩 Par nœud (durée en ms):")
+    print(f"   {'blueprint / nœud':<40} {'exéc.':>7} {'erreurs':>8} {'p50':>9} {'p90':>9} {'p99':>9}")
+    for name, stats in report.targets.items():
+        for node_id in dict.fromkeys([*stats.node_latencies_s, *stats.node_errors]):
+            latencies = stats.node_latencies_s.get(node_id, [])
+            percentiles = report.percentiles(latencies)
+            print(
+                f"   {name + ' / ' + node_id:<40} {len(latencies):>7} {stats.node_errors.get(node_id, 0):>8.0f}"
+                f" {format_ms(percentiles['p50']):>9} {format_ms(percentiles['p90']):>9} {format_ms(percentiles['p99']):>9}"
+            )
+
+
+async def run_load(workflow_service, args):
+    """Génère une charge concurrente sur les blueprints sélectionnés (tous par défaut)"""
+    names = args.load or list(BLUEPRINTS)
+    targets = [LoadTarget(name, BLUEPRINTS[name], SAMPLE_INPUTS[name]) for name in names]
+    runs = args.runs if args.runs is not None or args.duration is not None else 100
+    profile = LoadProfile(concurrency=args.concurrency, runs=runs, duration_s=args.duration, rate=args.rate)
+
+    mode = f"boucle ouverte à {args.rate:g} exéc/s" if args.rate else "boucle fermée"
+    limit = " et ".join(part for part in (runs and f"{runs} exécutions", args.duration and f"{args.duration:g} s") if part)
+    print(f"🚦 Charge sur {', '.join(names)} : {mode}, concurrence {args.concurrency}, jusqu'à {limit}")
+    report = await LoadGenerator(workflow_service).run(targets, profile, print_load_progress, args.report_interval)
+    print_load_report(report)
+    return report
+
+
+def build_service(args):
+    """Service des exécutions : modèles simulés (--sim) et cassette d'échanges (--record / --replay)"""
+    cassette = None
+    if args.record or args.replay:
+        cassette = Cassette(args.record or args.replay, "record" if args.record else "replay")
+    simulation = {"latency": args.sim_latency_ms / 1000} if args.sim_latency_ms else {}
+    return WorkflowService(simulation=simulation if args.sim else None, cassette=cassette)
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description="Test des workflows avec options de sélection",
@@ -142,6 +291,12 @@ Exemples d'utilisation:
   python main.py --dev --hiring-senior    # Lance Development et Hiring senior
   python main.py --hiring                 # Lance les deux tests de hiring
   python main.py --detailed               # Lance tous les tests avec détails
+  python main.py --batch candidats.jsonl --workflow hiring --concurrency 20 --resume
+  python main.py --all --sim              # Hors ligne, avec des modèles simulés déterministes
+  python main.py --writer --record writer.jsonl   # Enregistre les échanges avec le modèle
+  python main.py --writer --replay writer.jsonl   # Les rejoue sans réseau
+  python main.py --load --sim --sim-latency-ms 800 --concurrency 50 --duration 30   # Charge sur tous les blueprints
+  python main.py --load writer hiring --sim --rate 20 --runs 500      # Arrivées à 20 exéc/s (boucle ouverte)
         """,
     )
 
@@ -159,13 +314,61 @@ Exemples d'utilisation:
     parser.add_argument("--detailed", action="store_true", help="Affiche l'historique détaillé de chaque workflow")
     parser.add_argument("--separator", default="=" * 60, help="Caractère de séparation entre les tests")
 
+    # Mode lot (JSONL)
+    parser.add_argument("--batch", metavar="INPUT.jsonl", help="Exécute --workflow sur chaque ligne d'un fichier JSONL")
+    parser.add_argument("--batch-output", metavar="OUTPUT.jsonl", help="Fichier de résultats (défaut: INPUT.jsonl.results.jsonl)")
+    parser.add_argument("--workflow", choices=sorted(BLUEPRINTS), default="hiring", help="Blueprint utilisé en mode lot")
+    parser.add_argument("--concurrency", type=int, default=10, help="Nombre d'exécutions simultanées en mode lot ou charge")
+    parser.add_argument("--resume", action="store_true", help="Reprend un lot à partir de la dernière entrée terminée")
+
+    # Mode charge
+    parser.add_argument(
+        "--load", nargs="*", choices=sorted(BLUEPRINTS), metavar="BLUEPRINT", help="Génère une charge sur ces blueprints (tous par défaut)"
+    )
+    parser.add_argument("--runs", type=int, help="Nombre d'exécutions en mode charge (100 par défaut sans --duration)")
+    parser.add_argument("--duration", type=float, metavar="SECONDS", help="Durée de la charge")
+    parser.add_argument("--rate", type=float, metavar="RUNS/S", help="Arrivées par seconde, indépendantes des fins d'exécution (boucle ouverte)")
+    parser.add_argument("--report-interval", type=float, default=1.0, metavar="SECONDS", help="Période du rapport en direct")
+
+    # Exécution hors ligne
+    parser.add_argument("--sim", action="store_true", help="Remplace tous les modèles par des modèles simulés (sim:)")
+    parser.add_argument("--sim-latency-ms", type=float, default=0.0, help="Latence de réponse des modèles simulés")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="CASSETTE.jsonl", help="Enregistre les échanges avec les modèles")
+    cassette.add_argument("--replay", metavar="CASSETTE.jsonl", help="Rejoue les échanges enregistrés, sans réseau")
+
+    # Logs d'exécution (sur stderr)
+    parser.add_argument(
+        "--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Niveau des logs d'exécution (INFO, WARNING en mode charge)"
+    )
+    parser.add_argument("--log-json", action="store_true", help="Logs au format JSON (une ligne par événement)")
+    parser.add_argument("--log-sample-rate", type=float, default=1.0, help="Fraction des exécutions dont les logs sous WARNING sont gardés")
+
     args = parser.parse_args()
+    log_level = args.log_level or ("WARNING" if args.load is not None else "INFO")
+    configure_logging(log_level, json_format=args.log_json, sample_rate=args.log_sample_rate)
+
+    if args.load is not None:
+        workflow_service = build_service(args)
+        try:
+            await run_load(workflow_service, args)
+        finally:
+            await workflow_service.aclose()
+        return
+
+    if args.batch:
+        workflow_service = build_service(args)
+        try:
+            await run_batch(workflow_service, args)
+        finally:
+            await workflow_service.aclose()
+        return
 
     # Si aucun flag n'est spécifié, lancer tous les tests par défaut
     if not any([args.writer, args.content_tools, args.tools_test, args.hiring_senior, args.hiring_junior, args.hiring, args.all]):
         args.all = True
 
-    workflow_service = WorkflowService()
+    workflow_service = build_service(args)
     results = []
 
     # Définir quels tests lancer
@@ -222,6 +425,8 @@ Exemples d'utilisation:
             steps = len(result["execution_history"])
             print(f"   • {test_name}: {steps} étapes, {total_iterations} itérations")
 
+    await workflow_service.aclose()
+
 
 def print_workflow_summary(result):
     """Affiche un résumé du workflow"""
@@ -1,3 +1,5 @@
+from .batch_runner import BatchItemResult
+from .load_generator import LoadGenerator, LoadProfile, LoadReport, LoadTarget
 from .workflow_service import WorkflowService
 
-__all__ = ["WorkflowService"]
+__all__ = ["BatchItemResult", "LoadGenerator", "LoadProfile", "LoadReport", "LoadTarget", "WorkflowService"]
@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Optional, Set, Union
+
+from ...core.compiled_workflow import CompiledWorkflow
+from ...domain.interfaces.i_workflow_executor import IWorkflowExecutor
+
+BatchInputs = Union[Iterable[Any], AsyncIterable[Any]]
+
+
+@dataclass(slots=True)
+class BatchItemResult:
+    """Résultat d'une entrée d'un lot : index dans le flux, résultat ou erreur"""
+
+    index: int
+    input_data: Any
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class BatchRunner:
+    """Exécute un workflow compilé sur un flux d'entrées avec une concurrence bornée.
+
+    Les entrées sont consommées à la demande : au plus `concurrency` exécutions
+    (en cours ou en attente d'émission ordonnée) sont en mémoire à tout instant.
+    """
+
+    def __init__(self, executor: IWorkflowExecutor):
+        self.executor = executor
+
+    async def run(
+        self,
+        workflow: CompiledWorkflow,
+        inputs: BatchInputs,
+        concurrency: int = 10,
+        preserve_order: bool = False,
+        start_index: int = 0,
+    ) -> AsyncIterator[BatchItemResult]:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        iterator = self._as_async_iterator(inputs)
+        pending: Set[asyncio.Task] = set()
+        completed: Dict[int, BatchItemResult] = {}
+        next_index = start_index
+        next_to_emit = start_index
+        exhausted = False
+
+        try:
+            while True:
+                # Alimenter la fenêtre d'exécution sans matérialiser le flux d'entrées
+                while not exhausted and len(pending) + len(completed) < concurrency:
+                    try:
+                        input_data = await anext(iterator)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.create_task(self._run_one(workflow, next_index, input_data)))
+                    next_index += 1
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = task.result()
+                    if preserve_order:
+                        completed[item.index] = item
+                    else:
+                        yield item
+
+                # Émettre les résultats contigus dans l'ordre des entrées
+                while next_to_emit in completed:
+                    yield completed.pop(next_to_emit)
+                    next_to_emit += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _run_one(self, workflow: CompiledWorkflow, index: int, input_data: Any) -> BatchItemResult:
+        try:
+            result = await self.executor.execute(workflow, input_data)
+        except Exception as e:
+            return BatchItemResult(index, input_data, error=e)
+        return BatchItemResult(index, input_data, result=result)
+
+    @staticmethod
+    async def _iterate_sync(inputs: Iterable[Any]) -> AsyncIterator[Any]:
+        for input_data in inputs:
+            yield input_data
+
+    @classmethod
+    def _as_async_iterator(cls, inputs: BatchInputs) -> AsyncIterator[Any]:
+        if isinstance(inputs, AsyncIterable):
+            return aiter(inputs)
+        return cls._iterate_sync(inputs)
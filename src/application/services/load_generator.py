@@ -0,0 +1,251 @@
+import asyncio
+import itertools
+import math
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .workflow_service import WorkflowService
+
+# Tokens par type, et erreurs par (blueprint, nœud)
+_MetricTotals = Tuple[Dict[str, float], Dict[Tuple[str, str], float]]
+
+
+@dataclass(frozen=True, slots=True)
+class LoadProfile:
+    """Charge à générer : boucle fermée (`concurrency` exécutions enchaînées) ou ouverte (`rate` exécutions/s).
+
+    En boucle ouverte, les arrivées ne dépendent pas des fins d'exécution : au-delà de `concurrency`
+    exécutions en cours, elles attendent, et la latence est mesurée depuis l'arrivée prévue.
+    La génération s'arrête après `runs` exécutions ou `duration_s` secondes (le premier atteint) ;
+    les exécutions en cours sont attendues.
+    """
+
+    concurrency: int = 10
+    runs: Optional[int] = None
+    duration_s: Optional[float] = None
+    rate: Optional[float] = None
+
+    def __post_init__(self):
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if self.runs is None and self.duration_s is None:
+            raise ValueError("load profile requires runs or duration_s")
+        if (self.runs is not None and self.runs < 1) or (self.duration_s is not None and self.duration_s <= 0):
+            raise ValueError("runs must be >= 1 and duration_s > 0")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be > 0")
+
+
+@dataclass(frozen=True, slots=True)
+class LoadTarget:
+    """Blueprint exécuté par le générateur de charge, avec son entrée"""
+
+    name: str
+    definition: Dict[str, Any]
+    input_data: Any
+
+
+@dataclass(slots=True)
+class TargetStats:
+    """Latences et erreurs des exécutions d'un blueprint, et de chacun de ses nœuds"""
+
+    latencies_s: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    # Durées des étapes des exécutions réussies, et erreurs des nœuds (métriques du service), par nœud
+    node_latencies_s: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    node_errors: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def finished(self) -> int:
+        return len(self.latencies_s) + sum(self.errors.values())
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.finished if self.finished else 0.0
+
+
+@dataclass(slots=True)
+class LoadReport:
+    """État de la charge, mis à jour au fil des exécutions (rapport en direct) puis final"""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: Optional[float] = None
+    started: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    # Boucle ouverte : arrivées en attente d'une place parmi les `concurrency` exécutions
+    queued: int = 0
+    targets: Dict[str, TargetStats] = field(default_factory=dict)
+    # Tokens consommés par type, d'après les métriques du service
+    tokens: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed_s(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def finished(self) -> int:
+        return sum(stats.finished for stats in self.targets.values())
+
+    @property
+    def failed(self) -> int:
+        return sum(sum(stats.errors.values()) for stats in self.targets.values())
+
+    @property
+    def throughput(self) -> float:
+        """Exécutions terminées par seconde"""
+        return self.finished / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def tokens_per_s(self) -> float:
+        return sum(self.tokens.values()) / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def latencies_s(self, target: Optional[str] = None) -> List[float]:
+        if target is not None:
+            return self.targets[target].latencies_s
+        return [latency for stats in self.targets.values() for latency in stats.latencies_s]
+
+    @staticmethod
+    def percentiles(latencies_s: Sequence[float], quantiles: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[str, Optional[float]]:
+        """Percentiles au rang le plus proche, en secondes (None sans exécution réussie)"""
+        ordered = sorted(latencies_s)
+        return {
+            f"p{round(q * 100):d}": ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))] if ordered else None
+            for q in quantiles
+        }
+
+
+class LoadGenerator:
+    """Exécute des blueprints en concurrence sur un WorkflowService et mesure débit, latences et erreurs"""
+
+    def __init__(self, service: WorkflowService):
+        self.service = service
+
+    async def run(
+        self,
+        targets: Sequence[LoadTarget],
+        profile: LoadProfile,
+        on_progress: Optional[Callable[[LoadReport], None]] = None,
+        progress_interval_s: float = 1.0,
+    ) -> LoadReport:
+        """Génère la charge (blueprints en alternance) ; `on_progress` reçoit le rapport toutes les `progress_interval_s`"""
+        if not targets:
+            raise ValueError("load generation requires at least one target")
+        # Compilation et construction des agents hors de la mesure
+        for target in targets:
+            self.service.compile_workflow(target.definition)
+
+        # Les métriques du service sont cumulées depuis son démarrage : seul l'écart est attribué à la charge
+        baseline = self._metric_totals(targets)
+        report = LoadReport(targets={target.name: TargetStats() for target in targets})
+        progress = None
+        if on_progress is not None:
+            progress = asyncio.create_task(self._report_progress(report, targets, baseline, on_progress, progress_interval_s))
+        try:
+            if profile.rate is None:
+                await self._closed_loop(targets, profile, report)
+            else:
+                await self._open_loop(targets, profile, report)
+        finally:
+            report.finished_at = time.perf_counter()
+            if progress is not None:
+                progress.cancel()
+            self._collect_metrics(report, targets, baseline)
+        return report
+
+    async def _closed_loop(self, targets: Sequence[LoadTarget], profile: LoadProfile, report: LoadReport) -> None:
+        deadline = report.started_at + profile.duration_s if profile.duration_s else None
+        indexes = itertools.count()
+
+        async def worker() -> None:
+            while deadline is None or time.perf_counter() < deadline:
+                index = next(indexes)
+                if profile.runs is not None and index >= profile.runs:
+                    return
+                await self._run_one(targets[index % len(targets)], report, time.perf_counter())
+
+        workers = profile.concurrency if profile.runs is None else min(profile.concurrency, profile.runs)
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def _open_loop(self, targets: Sequence[LoadTarget], profile: LoadProfile, report: LoadReport) -> None:
+        slots = asyncio.Semaphore(profile.concurrency)
+        running = set()
+
+        async def arrival(target: LoadTarget, arrived_at: float) -> None:
+            report.queued += 1
+            async with slots:
+                report.queued -= 1
+                await self._run_one(target, report, arrived_at)
+
+        for index in itertools.count():
+            arrived_at = report.started_at + index / profile.rate
+            if profile.runs is not None and index >= profile.runs:
+                break
+            if profile.duration_s is not None and arrived_at - report.started_at >= profile.duration_s:
+                break
+            delay = arrived_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(arrival(targets[index % len(targets)], arrived_at))
+            running.add(task)
+            task.add_done_callback(running.discard)
+        await asyncio.gather(*running)
+
+    async def _run_one(self, target: LoadTarget, report: LoadReport, arrived_at: float) -> None:
+        stats = report.targets[target.name]
+        report.started += 1
+        report.in_flight += 1
+        report.max_in_flight = max(report.max_in_flight, report.in_flight)
+        try:
+            result = await self.service.execute_workflow_from_json(target.definition, target.input_data)
+        except Exception as error:
+            stats.errors[type(error).__name__] += 1
+        else:
+            stats.latencies_s.append(time.perf_counter() - arrived_at)
+            for step in result["execution_history"]:
+                if step["duration_s"] is not None:
+                    stats.node_latencies_s[step["node_id"]].append(step["duration_s"])
+        finally:
+            report.in_flight -= 1
+
+    async def _report_progress(
+        self,
+        report: LoadReport,
+        targets: Sequence[LoadTarget],
+        baseline: _MetricTotals,
+        on_progress: Callable[[LoadReport], None],
+        interval_s: float,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval_s)
+            self._collect_metrics(report, targets, baseline)
+            on_progress(report)
+
+    def _collect_metrics(self, report: LoadReport, targets: Sequence[LoadTarget], baseline: _MetricTotals) -> None:
+        """Tokens consommés et erreurs par nœud depuis le début de la charge"""
+        tokens, node_errors = self._metric_totals(targets)
+        report.tokens = {kind: value - baseline[0].get(kind, 0) for kind, value in tokens.items()}
+        for name, stats in report.targets.items():
+            stats.node_errors = {
+                node_id: count - baseline[1].get((target, node_id), 0)
+                for (target, node_id), count in node_errors.items()
+                if target == name and count > baseline[1].get((target, node_id), 0)
+            }
+
+    def _metric_totals(self, targets: Sequence[LoadTarget]) -> _MetricTotals:
+        """Tokens par type, et erreurs par (blueprint, nœud), d'après les métriques du service"""
+        snapshot = self.service.get_metrics()
+        tokens: Dict[str, float] = defaultdict(float)
+        for sample in snapshot.get("workflow_node_tokens_total", ()):
+            tokens[sample["labels"]["type"]] += sample["value"]
+
+        # Les métriques sont étiquetées par nom de workflow
+        names = {target.definition["name"]: target.name for target in targets}
+        node_errors: Dict[Tuple[str, str], float] = defaultdict(float)
+        for sample in snapshot.get("workflow_node_errors_total", ()):
+            name = names.get(sample["labels"]["workflow"])
+            if name is not None:
+                node_errors[(name, sample["labels"]["node"])] += sample["value"]
+        return dict(tokens), dict(node_errors)
@@ -1,25 +1,172 @@
-from typing import Any, Dict
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from ...core.compiled_workflow import CompiledWorkflow
+from ...core.execution_events import ExecutionEvent
+from ...core.middleware_chain import MiddlewareChain
+from ...domain.interfaces.i_checkpoint_store import ICheckpointStore
+from ...domain.interfaces.i_history_store import IHistoryStore
+from ...domain.interfaces.i_workflow_middleware import IWorkflowMiddleware
+from ...infrastructure.cache.result_cache import ResultCache
 from ...infrastructure.converters.workflow_converter import WorkflowConverter
 from ...infrastructure.executors.workflow_executor import WorkflowExecutor
 from ...infrastructure.factories.agent_factory import AgentFactory
+from ...infrastructure.http.http_client_pool import HttpClientPool
+from ...infrastructure.metrics.workflow_metrics import WorkflowMetrics
+from ...infrastructure.resilience.rate_limiter import RateLimiterRegistry
+from ...infrastructure.simulation.cassette import Cassette
+from ...infrastructure.simulation.simulated_workflow import simulate_workflow
+from ...infrastructure.tracing.tracer import Tracer
+from .batch_runner import BatchInputs, BatchItemResult, BatchRunner
 
 
 class WorkflowService:
-    def __init__(self):
-        self.agent_factory = AgentFactory()
+    # Plans compilés conservés (les moins récemment utilisés sont oubliés, avec leurs agents)
+    max_compiled_workflows = 256
+
+    def __init__(
+        self,
+        checkpoint_store: Optional[ICheckpointStore] = None,
+        result_cache: Optional[ResultCache] = None,
+        history_store: Optional[IHistoryStore] = None,
+        metrics: Optional[WorkflowMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        middlewares: Sequence[IWorkflowMiddleware] = (),
+        http_clients: Optional[HttpClientPool] = None,
+        rate_limits: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        early_routing: bool = False,
+        simulation: Optional[Mapping[str, Any]] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        self.metrics = metrics or WorkflowMetrics()
+        # Quotas par modèle ou fournisseur, partagés par toutes les exécutions du service
+        self.rate_limiter = RateLimiterRegistry(rate_limits, self.metrics.registry)
+        self.agent_factory = AgentFactory(result_cache, http_clients=http_clients, rate_limiter=self.rate_limiter, cassette=cassette)
+        # Profil de simulation : si défini, tous les modèles des workflows sont simulés ("sim:")
+        self.simulation = simulation
+        self.result_cache = result_cache
         self.converter = WorkflowConverter(self.agent_factory)
-        self.executor = WorkflowExecutor(self.agent_factory)
+        self.checkpoint_store = checkpoint_store
+        self.tracer = tracer
+        self.middlewares: List[IWorkflowMiddleware] = list(middlewares)
+        self.executor = WorkflowExecutor(
+            self.agent_factory,
+            checkpoint_store,
+            history_store,
+            self.metrics,
+            tracer,
+            MiddlewareChain(self.middlewares),
+            early_routing=early_routing,
+        )
+        self.batch_runner = BatchRunner(self.executor)
+        # Par empreinte de la définition, et par identité de l'objet (pas de resérialisation par exécution)
+        self._compiled_workflows: "OrderedDict[str, CompiledWorkflow]" = OrderedDict()
+        self._compiled_by_identity: "OrderedDict[int, Tuple[Mapping[str, Any], str, CompiledWorkflow]]" = OrderedDict()
 
-    async def execute_workflow_from_json(self, json_definition: Dict[str, Any], initial_data: Any) -> Dict[str, Any]:
-        # Convertir JSON en WorkflowDefinition
-        workflow = self.converter.json_to_workflow(json_definition)
+    async def execute_workflow_from_json(
+        self, json_definition: Dict[str, Any], initial_data: Any, timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        # Convertir et compiler le JSON (mis en cache par définition)
+        workflow = self.compile_workflow(json_definition)
 
         # Exécuter le workflow
-        result = await self.executor.execute(workflow, initial_data)
+        result = await self.executor.execute(workflow, initial_data, timeout_s)
 
         return result
 
+    async def execute_stream_from_json(
+        self, json_definition: Dict[str, Any], initial_data: Any, stream_tokens: bool = True, timeout_s: Optional[float] = None
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Exécute le workflow en émettant les événements au fil de l'eau (RunFinished en dernier)"""
+        workflow = self.compile_workflow(json_definition)
+        async for event in self.executor.execute_stream(workflow, initial_data, stream_tokens, timeout_s):
+            yield event
+
+    async def resume(self, run_id: str, timeout_s: Optional[float] = None) -> Dict[str, Any]:
+        """Reprend une exécution interrompue à partir de son dernier checkpoint (avec un nouveau budget de temps)"""
+        if self.checkpoint_store is None:
+            raise ValueError("Resuming a run requires a checkpoint store")
+
+        checkpoint = await self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for run {run_id}")
+        if checkpoint.workflow_source is None:
+            raise ValueError(f"Checkpoint of run {run_id} has no workflow definition")
+
+        workflow = self.compile_workflow(checkpoint.workflow_source)
+        return await self.executor.resume(workflow, checkpoint, timeout_s)
+
+    def add_middleware(self, middleware: IWorkflowMiddleware) -> None:
+        """Ajoute un middleware en fin de chaîne (le dispatch des hooks est recompilé)"""
+        self.middlewares.append(middleware)
+        self.executor.middleware = MiddlewareChain(self.middlewares)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Métriques agrégées depuis le démarrage du service (compteurs et histogrammes avec p50/p95/p99)"""
+        return self.metrics.snapshot()
+
+    async def aclose(self) -> None:
+        """Libère les ressources du service (checkpoints en attente, cache de résultats, historique, traces, clients HTTP)"""
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.close()
+        await self.executor.history_store.close()
+        if self.result_cache is not None:
+            await self.result_cache.close()
+        if self.tracer is not None:
+            await self.tracer.close()
+        await self.agent_factory.aclose()
+
+    async def execute_many(
+        self,
+        json_definition: Dict[str, Any],
+        inputs: BatchInputs,
+        concurrency: int = 10,
+        preserve_order: bool = False,
+        start_index: int = 0,
+    ) -> AsyncIterator[BatchItemResult]:
+        """Exécute le workflow sur chaque entrée (itérable sync ou async) et émet les résultats au fil de l'eau"""
+        workflow = self.compile_workflow(json_definition)
+        async for item in self.batch_runner.run(workflow, inputs, concurrency, preserve_order, start_index):
+            yield item
+
+    def compile_workflow(self, json_definition: Dict[str, Any]) -> CompiledWorkflow:
+        """Retourne le plan compilé d'une définition JSON et prépare ses agents, une seule fois.
+
+        Une définition déjà compilée est reconnue par identité, sans être resérialisée : elle ne doit
+        plus être modifiée en place (en passer une copie). Sinon, elle est reconnue par son empreinte JSON.
+        """
+        entry = self._compiled_by_identity.get(id(json_definition))
+        # Le plan peut avoir été oublié entre-temps : la définition est alors recompilée
+        if entry is not None and entry[0] is json_definition and entry[1] in self._compiled_workflows:
+            self._compiled_by_identity.move_to_end(id(json_definition))
+            self._compiled_workflows.move_to_end(entry[1])
+            return entry[2]
+
+        cache_key = hashlib.sha256(json.dumps(json_definition, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        compiled = self._compiled_workflows.get(cache_key)
+        if compiled is None:
+            source = json_definition
+            if self.simulation is not None:
+                source = simulate_workflow(json_definition, self.simulation)
+            workflow = self.converter.json_to_workflow(source)
+            compiled = CompiledWorkflow.from_definition(workflow, source=source)
+            # Les agents sont construits ici, hors du chemin critique des exécutions
+            self.agent_factory.prebuild(compiled)
+            self._compiled_workflows[cache_key] = compiled
+            if len(self._compiled_workflows) > self.max_compiled_workflows:
+                _, evicted = self._compiled_workflows.popitem(last=False)
+                self.agent_factory.release(evicted)
+        else:
+            self._compiled_workflows.move_to_end(cache_key)
+
+        # La définition est retenue avec son plan : son identité ne peut pas être réattribuée
+        self._compiled_by_identity[id(json_definition)] = (json_definition, cache_key, compiled)
+        if len(self._compiled_by_identity) > self.max_compiled_workflows:
+            self._compiled_by_identity.popitem(last=False)
+        return compiled
+
     def create_pydantic_graph_from_json(self, json_definition: Dict[str, Any]):
         workflow = self.converter.json_to_workflow(json_definition)
         return self.converter.workflow_to_pydantic_graph(workflow)
@@ -1,15 +1,22 @@
+from .catalog import BLUEPRINTS, SAMPLE_INPUTS
 from .workflow_definitions import (
     ADVANCED_CONTENT_WORKFLOW,
     DEVELOPMENT_WORKFLOW,
     HIRING_WORKFLOW,
     MONO_AGENT_WITH_TOOLS,
+    PARALLEL_HIRING_WORKFLOW,
+    REQUIREMENTS_MAP_WORKFLOW,
     TOOLS_TEST_WORKFLOW,
     WRITER_REVIEWER_WORKFLOW,
 )
 
 __all__ = [
+    "BLUEPRINTS",
+    "SAMPLE_INPUTS",
     "ADVANCED_CONTENT_WORKFLOW",
     "HIRING_WORKFLOW",
+    "PARALLEL_HIRING_WORKFLOW",
+    "REQUIREMENTS_MAP_WORKFLOW",
     "WRITER_REVIEWER_WORKFLOW",
     "MONO_AGENT_WITH_TOOLS",
     "TOOLS_TEST_WORKFLOW",
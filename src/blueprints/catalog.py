@@ -0,0 +1,49 @@
+from .workflow_definitions import (
+    ADVANCED_CONTENT_WORKFLOW,
+    DEVELOPMENT_WORKFLOW,
+    HIRING_WORKFLOW,
+    MONO_AGENT_WITH_TOOLS,
+    PARALLEL_HIRING_WORKFLOW,
+    REQUIREMENTS_MAP_WORKFLOW,
+    TOOLS_TEST_WORKFLOW,
+    WRITER_REVIEWER_WORKFLOW,
+)
+
+# Blueprints par nom court (options --workflow de main.py, benchmarks)
+BLUEPRINTS = {
+    "writer": WRITER_REVIEWER_WORKFLOW,
+    "content-tools": ADVANCED_CONTENT_WORKFLOW,
+    "tools-test": TOOLS_TEST_WORKFLOW,
+    "dev": DEVELOPMENT_WORKFLOW,
+    "hiring": HIRING_WORKFLOW,
+    "parallel-hiring": PARALLEL_HIRING_WORKFLOW,
+    "requirements-map": REQUIREMENTS_MAP_WORKFLOW,
+    "mono-agent": MONO_AGENT_WITH_TOOLS,
+}
+
+_CANDIDATE = {
+    "name": "Marie Dupont",
+    "cv": "Senior Python Developer avec 6 ans d'expérience. Expertise en Django, FastAPI, PostgreSQL, Docker.",
+    "position": "Lead Backend Developer",
+    "salary_range": "65000-75000",
+    "team": "équipe produit de 8 personnes",
+}
+
+_PROJECT = {
+    "project": "API REST pour gestion de tâches",
+    "requirements": ["CRUD operations pour les tâches", "Authentification JWT", "Base de données SQLite", "Documentation API"],
+    "technology": "Python FastAPI",
+    "timeline": "1 semaine",
+}
+
+# Entrée d'exemple de chaque blueprint (exécutions de charge et benchmarks)
+SAMPLE_INPUTS = {
+    "writer": {"topic": "L'intelligence artificielle dans les petites entreprises", "length": "100 mots", "audience": "dirigeants de PME"},
+    "content-tools": {"topic": "Les 3 outils IA incontournables pour développeurs Python", "target_length": "300 mots"},
+    "tools-test": {"topic": "L'impact de ChatGPT sur le développement logiciel", "target_length": "400 mots"},
+    "dev": _PROJECT,
+    "hiring": _CANDIDATE,
+    "parallel-hiring": _CANDIDATE,
+    "requirements-map": _PROJECT,
+    "mono-agent": {"message": "Combien de mots contient la phrase « Les agents collaborent dans un workflow » ?"},
+}
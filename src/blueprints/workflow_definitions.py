@@ -86,18 +86,28 @@ WRITER_REVIEWER_WORKFLOW = {
                 "system_prompt": """You are a content reviewer. Evaluate the content against the original manager instructions.
 
                 You MUST respond with ONLY a JSON object in this EXACT format:
-                {"approved": true, "feedback": "your feedback here", "final_review": false}
+                {"approved": true, "final_review": false, "feedback": "your feedback here"}
 
                 Guidelines:
                 - Set "approved" to true only if the content fully meets requirements
                 - Set "final_review" to true if this is the 3rd iteration
                 - Keep feedback concise and actionable""",
+                "output_schema": {
+                    "type": "object",
+                    "properties": {
+                        "approved": {"type": "boolean"},
+                        "final_review": {"type": "boolean", "default": False},
+                        "feedback": {"type": "string"},
+                    },
+                    "required": ["approved", "feedback"],
+                },
             },
         },
         {
             "id": "manager_final",
             "name": "Manager Final",
             "type": "process",
+            "context": {"max_tokens": 6000, "exclude_nodes": ["manager_initial"]},
             "agent_config": {
                 "type": "pydantic",
                 "model": "openai:gpt-4o-mini",
@@ -521,3 +531,134 @@ HIRING_WORKFLOW = {
         {"from_node": "final_interview", "to_node": "rejected", "condition": "rejected"},
     ],
 }
+
+PARALLEL_HIRING_WORKFLOW = {
+    "name": "Parallel Hiring Workflow",
+    "description": "Recrutement avec présélections RH et technique exécutées en parallèle",
+    "start_node": "candidate",
+    "nodes": [
+        {
+            "id": "candidate",
+            "name": "Candidate",
+            "type": "process",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "Candidate",
+                "system_prompt": """You are processing a job candidate application.
+
+                Prepare the candidate profile for the hiring process.""",
+            },
+        },
+        {"id": "screening", "name": "Screening", "type": "parallel", "max_concurrency": 2, "agent_config": {}},
+        {
+            "id": "hr_screening",
+            "name": "HR Screening",
+            "type": "decision",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "HRScreener",
+                "node_type": "decision",
+                "system_prompt": """You are an HR recruiter conducting initial screening.
+
+                Respond with JSON: {"passed": true, "feedback": "detailed feedback", "score": 85}
+
+                Set "passed" to true if candidate should proceed, false otherwise.""",
+            },
+        },
+        {
+            "id": "technical_prescreen",
+            "name": "Technical Pre-screen",
+            "type": "decision",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "TechnicalScreener",
+                "node_type": "decision",
+                "system_prompt": """You are a technical recruiter pre-screening the candidate's CV for technical fit.
+
+                Respond with JSON: {"passed": true, "score": 85, "technical_notes": "assessment"}""",
+            },
+        },
+        {"id": "screening_join", "name": "Screening Join", "type": "sync", "merge_strategy": "by_branch", "agent_config": {}},
+        {
+            "id": "final_interview",
+            "name": "Final Interview",
+            "type": "decision",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "FinalInterviewer",
+                "node_type": "decision",
+                "system_prompt": """You are making the hiring decision from the HR screening and technical pre-screen results.
+
+                Reject the candidate if either screening did not pass.
+
+                Respond with JSON: {"hired": true, "decision": "detailed decision", "salary_offer": 75000}""",
+            },
+        },
+        {"id": "employee", "name": "Employee", "type": "end", "agent_config": {}},
+        {"id": "rejected", "name": "Rejected", "type": "end", "agent_config": {}},
+    ],
+    "edges": [
+        {"from_node": "candidate", "to_node": "screening"},
+        {"from_node": "screening", "to_node": "hr_screening"},
+        {"from_node": "screening", "to_node": "technical_prescreen"},
+        {"from_node": "hr_screening", "to_node": "screening_join"},
+        {"from_node": "technical_prescreen", "to_node": "screening_join"},
+        {"from_node": "screening_join", "to_node": "final_interview"},
+        {"from_node": "final_interview", "to_node": "employee", "condition": "hired"},
+        {"from_node": "final_interview", "to_node": "rejected", "condition": "rejected"},
+    ],
+}
+
+REQUIREMENTS_MAP_WORKFLOW = {
+    "name": "Requirements Map Workflow",
+    "description": "Conception de chaque exigence en parallèle puis synthèse par le release manager",
+    "start_node": "design_each",
+    "nodes": [
+        {
+            "id": "design_each",
+            "name": "Design Each Requirement",
+            "type": "map",
+            "max_concurrency": 4,
+            "agent_config": {},
+            "map": {"items_path": "requirements", "node": "requirement_designer", "context_keys": ["project", "technology"], "on_error": "collect"},
+        },
+        {
+            "id": "requirement_designer",
+            "name": "Requirement Designer",
+            "type": "process",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "RequirementDesigner",
+                "system_prompt": """You are a senior developer. You receive ONE requirement ("item") of a project.
+
+                Describe concisely how to implement this requirement with the given technology:
+                - components to create
+                - key implementation steps
+                - tests to write""",
+            },
+        },
+        {
+            "id": "release_manager",
+            "name": "Release Manager",
+            "type": "process",
+            "agent_config": {
+                "type": "pydantic",
+                "model": "openai:gpt-4o-mini",
+                "name": "ReleaseManager",
+                "system_prompt": """You are a release manager. You receive the implementation plan of each requirement.
+
+                Merge them into a single ordered delivery plan with milestones.""",
+            },
+        },
+        {"id": "end", "name": "End", "type": "end", "agent_config": {}},
+    ],
+    "edges": [
+        {"from_node": "design_each", "to_node": "release_manager"},
+        {"from_node": "release_manager", "to_node": "end"},
+    ],
+}
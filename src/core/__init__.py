@@ -1,3 +1,52 @@
+from .branch_merger import BranchMerger
+from .compiled_workflow import CompiledContext, CompiledEdge, CompiledMap, CompiledNode, CompiledWorkflow
 from .condition_evaluator import ConditionEvaluator
+from .context_builder import ContextBuilder
+from .data_path import DataPath
+from .execution_history import ExecutionHistory, StepRecord
+from .execution_events import (
+    EdgeTaken,
+    EventType,
+    ExecutionEvent,
+    NodeFinished,
+    NodeStarted,
+    RunFinished,
+    TokenDelta,
+    ToolCalled,
+)
+from .middleware_chain import MiddlewareChain
+from .output_schema import build_output_model
+from .partial_json import PartialJsonObject
+from .run_context import RunContext
+from .run_limits import NodeTimeout, RunDeadlineExceeded, RunLimitExceeded
+from .token_counter import TokenCounter
 
-__all__ = ["ConditionEvaluator"]
+__all__ = [
+    "BranchMerger",
+    "CompiledContext",
+    "CompiledEdge",
+    "CompiledMap",
+    "CompiledNode",
+    "CompiledWorkflow",
+    "ConditionEvaluator",
+    "ContextBuilder",
+    "DataPath",
+    "EdgeTaken",
+    "EventType",
+    "ExecutionEvent",
+    "ExecutionHistory",
+    "MiddlewareChain",
+    "NodeFinished",
+    "NodeStarted",
+    "NodeTimeout",
+    "PartialJsonObject",
+    "RunContext",
+    "RunDeadlineExceeded",
+    "RunFinished",
+    "RunLimitExceeded",
+    "StepRecord",
+    "TokenCounter",
+    "TokenDelta",
+    "ToolCalled",
+    "build_output_model",
+]
@@ -0,0 +1,19 @@
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any, Optional, Sequence
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    # Objets non sérialisables (modèle instancié, fonction) : identifiés par leur identité
+    return f"<{type(value).__qualname__}@{id(value):x}>"
+
+
+def agent_key(agent_config: Mapping[str, Any], tools: Optional[Sequence[str]] = None) -> str:
+    """Empreinte normalisée (ordre des clés indifférent) d'une configuration d'agent et de ses outils"""
+    payload = json.dumps(
+        {"config": dict(agent_config), "tools": list(tools or ())}, sort_keys=True, separators=(",", ":"), default=_normalize
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,36 @@
+from typing import Any, Dict
+
+
+class BranchMerger:
+    """Fusion des sorties de branches parallèles pour les nœuds sync"""
+
+    DEFAULT_STRATEGY = "by_branch"
+    STRATEGIES = ("by_branch", "list", "merge_dicts", "concat")
+
+    @staticmethod
+    def merge(strategy: str, branch_outputs: Dict[str, Any]) -> Any:
+        """Fusionne les sorties indexées par nœud de départ de branche (ordre de déclaration)"""
+
+        # Dictionnaire {branche: sortie}
+        if strategy == "by_branch":
+            return dict(branch_outputs)
+
+        # Liste des sorties dans l'ordre des branches
+        if strategy == "list":
+            return list(branch_outputs.values())
+
+        # Fusion des sorties dict, la dernière branche l'emporte en cas de conflit
+        if strategy == "merge_dicts":
+            merged: Dict[str, Any] = {}
+            for branch_id, output in branch_outputs.items():
+                if isinstance(output, dict):
+                    merged.update(output)
+                else:
+                    merged[branch_id] = output
+            return merged
+
+        # Concaténation textuelle des sorties
+        if strategy == "concat":
+            return "\n\n".join(str(output) for output in branch_outputs.values())
+
+        raise ValueError(f"Merge strategy {strategy} not supported")
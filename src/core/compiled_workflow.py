@@ -0,0 +1,221 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from ..domain.entities.node_type import NodeType
+from ..domain.entities.workflow_definition import WorkflowDefinition
+from ..domain.entities.workflow_node import WorkflowNode
+from .agent_key import agent_key
+from .branch_merger import BranchMerger
+
+# Types de nœuds exécutés sans agent
+AGENTLESS_NODE_TYPES = frozenset({NodeType.END, NodeType.SYNC, NodeType.MAP, NodeType.PARALLEL})
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledEdge:
+    """Transition sortante d'un nœud compilé"""
+
+    to_node: str
+    condition: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMap:
+    """Configuration d'exécution d'un nœud map"""
+
+    ERROR_POLICIES = ("fail_fast", "skip", "collect")
+
+    items_path: str
+    node: str
+    context_keys: Tuple[str, ...] = ()
+    on_error: str = "fail_fast"
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledContext:
+    """Politique de construction du contexte d'entrée d'un nœud"""
+
+    max_tokens: Optional[int] = None
+    last_n: Optional[int] = None
+    nodes: Optional[FrozenSet[str]] = None
+    exclude_nodes: FrozenSet[str] = frozenset()
+    include_inputs: bool = False
+    include_original_request: bool = True
+    include_iterations: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledNode:
+    """Représentation d'exécution immuable d'un nœud"""
+
+    id: str
+    name: str
+    type: NodeType
+    max_iterations: Optional[int]
+    agent_config: Mapping[str, Any]
+    tools: Optional[Tuple[str, ...]]
+    conditional_edges: Tuple[CompiledEdge, ...]
+    default_edge: Optional[CompiledEdge]
+    branches: Tuple[CompiledEdge, ...] = ()
+    max_concurrency: Optional[int] = None
+    merge_strategy: str = BranchMerger.DEFAULT_STRATEGY
+    map: Optional[CompiledMap] = None
+    timeout_s: Optional[float] = None
+    context: Optional[CompiledContext] = None
+    # Empreinte de agent_config et des outils : clé de l'agent partagé dans l'AgentFactory
+    agent_key: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledWorkflow:
+    """Plan d'exécution construit une seule fois à partir d'un WorkflowDefinition"""
+
+    name: str
+    description: str
+    start_node: str
+    nodes: Mapping[str, CompiledNode]
+    timeout_s: Optional[float] = None
+    max_total_iterations: Optional[int] = None
+    priority: int = 0
+    # Définition JSON d'origine, conservée pour reprendre une exécution depuis un checkpoint
+    source: Optional[Mapping[str, Any]] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_definition(cls, workflow: WorkflowDefinition, source: Optional[Mapping[str, Any]] = None) -> "CompiledWorkflow":
+        node_ids = [node.id for node in workflow.nodes]
+        known_ids = set(node_ids)
+        if len(known_ids) != len(node_ids):
+            raise ValueError(f"Workflow '{workflow.name}': duplicate node ids")
+
+        if workflow.start_node not in known_ids:
+            raise ValueError(f"Workflow '{workflow.name}': start node '{workflow.start_node}' not found")
+
+        if workflow.timeout_s is not None and workflow.timeout_s <= 0:
+            raise ValueError(f"Workflow '{workflow.name}': timeout_s must be > 0")
+        if workflow.max_total_iterations is not None and workflow.max_total_iterations < 1:
+            raise ValueError(f"Workflow '{workflow.name}': max_total_iterations must be >= 1")
+
+        # Regrouper les edges sortants par nœud en conservant l'ordre de déclaration
+        outgoing: Dict[str, List[CompiledEdge]] = {node_id: [] for node_id in node_ids}
+        for edge in workflow.edges:
+            if edge.from_node not in known_ids:
+                raise ValueError(f"Workflow '{workflow.name}': edge from unknown node '{edge.from_node}'")
+            if edge.to_node not in known_ids:
+                raise ValueError(f"Workflow '{workflow.name}': edge '{edge.from_node}' -> unknown node '{edge.to_node}'")
+            outgoing[edge.from_node].append(CompiledEdge(edge.to_node, edge.condition))
+
+        nodes = {}
+        for node in workflow.nodes:
+            branches: Tuple[CompiledEdge, ...] = ()
+            if node.type == NodeType.PARALLEL:
+                # Toutes les sorties d'un nœud parallel sont des branches démarrées simultanément
+                branches = cls._validate_branches(workflow.name, node.id, outgoing[node.id])
+                conditional_edges, default_edge = (), None
+            else:
+                conditional_edges, default_edge = cls._split_edges(outgoing[node.id])
+
+            if node.max_concurrency is not None and node.max_concurrency < 1:
+                raise ValueError(f"Workflow '{workflow.name}': node '{node.id}' max_concurrency must be >= 1")
+            if node.timeout_s is not None and node.timeout_s <= 0:
+                raise ValueError(f"Workflow '{workflow.name}': node '{node.id}' timeout_s must be > 0")
+            merge_strategy = node.merge_strategy or BranchMerger.DEFAULT_STRATEGY
+            if merge_strategy not in BranchMerger.STRATEGIES:
+                raise ValueError(f"Workflow '{workflow.name}': node '{node.id}' merge strategy {merge_strategy} not supported")
+
+            map_config = cls._compile_map(workflow.name, node, known_ids) if node.type == NodeType.MAP else None
+            context = cls._compile_context(workflow.name, node, known_ids) if node.context is not None else None
+
+            nodes[node.id] = CompiledNode(
+                id=node.id,
+                name=node.name,
+                type=node.type,
+                max_iterations=node.max_iterations,
+                agent_config=MappingProxyType(dict(node.agent_config)),
+                tools=tuple(node.tools) if node.tools is not None else None,
+                conditional_edges=conditional_edges,
+                default_edge=default_edge,
+                branches=branches,
+                max_concurrency=node.max_concurrency,
+                merge_strategy=merge_strategy,
+                map=map_config,
+                timeout_s=node.timeout_s,
+                context=context,
+                agent_key=None if node.type in AGENTLESS_NODE_TYPES else agent_key(node.agent_config, node.tools),
+            )
+
+        return cls(
+            name=workflow.name,
+            description=workflow.description,
+            start_node=workflow.start_node,
+            nodes=MappingProxyType(nodes),
+            timeout_s=workflow.timeout_s,
+            max_total_iterations=workflow.max_total_iterations,
+            priority=workflow.priority,
+            source=source,
+        )
+
+    @staticmethod
+    def _split_edges(edges: List[CompiledEdge]) -> Tuple[Tuple[CompiledEdge, ...], Optional[CompiledEdge]]:
+        """Sépare les edges conditionnels de l'edge par défaut.
+
+        Un edge sans condition est toujours satisfait : les edges déclarés après lui
+        ne peuvent jamais être empruntés et sont donc ignorés.
+        """
+        conditional_edges = []
+        for edge in edges:
+            if edge.condition is None:
+                return tuple(conditional_edges), edge
+            conditional_edges.append(edge)
+        return tuple(conditional_edges), None
+
+    @staticmethod
+    def _validate_branches(workflow_name: str, node_id: str, edges: List[CompiledEdge]) -> Tuple[CompiledEdge, ...]:
+        if not edges:
+            raise ValueError(f"Workflow '{workflow_name}': parallel node '{node_id}' has no branches")
+        if any(edge.condition is not None for edge in edges):
+            raise ValueError(f"Workflow '{workflow_name}': parallel node '{node_id}' branches cannot be conditional")
+        if len({edge.to_node for edge in edges}) != len(edges):
+            raise ValueError(f"Workflow '{workflow_name}': parallel node '{node_id}' has duplicate branches")
+        return tuple(edges)
+
+    @staticmethod
+    def _compile_map(workflow_name: str, node: WorkflowNode, known_ids: Set[str]) -> CompiledMap:
+        if node.map is None:
+            raise ValueError(f"Workflow '{workflow_name}': map node '{node.id}' requires a 'map' configuration")
+        if node.map.node not in known_ids:
+            raise ValueError(f"Workflow '{workflow_name}': map node '{node.id}' -> unknown node '{node.map.node}'")
+        if node.map.node == node.id:
+            raise ValueError(f"Workflow '{workflow_name}': map node '{node.id}' cannot map over itself")
+        if node.map.on_error not in CompiledMap.ERROR_POLICIES:
+            raise ValueError(f"Workflow '{workflow_name}': map node '{node.id}' error policy {node.map.on_error} not supported")
+        return CompiledMap(
+            items_path=node.map.items_path,
+            node=node.map.node,
+            context_keys=tuple(node.map.context_keys or ()),
+            on_error=node.map.on_error,
+        )
+
+    @staticmethod
+    def _compile_context(workflow_name: str, node: WorkflowNode, known_ids: Set[str]) -> CompiledContext:
+        config = node.context
+        if config.max_tokens is not None and config.max_tokens < 1:
+            raise ValueError(f"Workflow '{workflow_name}': node '{node.id}' context max_tokens must be >= 1")
+        if config.last_n is not None and config.last_n < 0:
+            raise ValueError(f"Workflow '{workflow_name}': node '{node.id}' context last_n must be >= 0")
+        unknown = set(config.nodes or ()) | set(config.exclude_nodes or ())
+        unknown -= known_ids
+        if unknown:
+            raise ValueError(f"Workflow '{workflow_name}': node '{node.id}' context references unknown nodes {sorted(unknown)}")
+        return CompiledContext(
+            max_tokens=config.max_tokens,
+            last_n=config.last_n,
+            nodes=frozenset(config.nodes) if config.nodes is not None else None,
+            exclude_nodes=frozenset(config.exclude_nodes or ()),
+            include_inputs=config.include_inputs,
+            include_original_request=config.include_original_request,
+            include_iterations=config.include_iterations,
+        )
+
+    def get_node(self, node_id: str) -> Optional[CompiledNode]:
+        return self.nodes.get(node_id)
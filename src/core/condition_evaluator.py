@@ -1,12 +1,38 @@
 import json
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, FrozenSet, Optional
 
 
 class ConditionEvaluator:
     """Évaluateur de conditions générique pour les workflows"""
 
+    # Conditions négatives (rejected = !approved, failed = !passed)
+    NEGATIVE_MAPPINGS = {"rejected": "approved", "failed": "passed", "not_hired": "hired", "incomplete": "complete"}
+
+    # Champs du résultat lus par les conditions spéciales
+    SPECIAL_FIELDS = {
+        "rejected_not_final": ("approved", "passed", "final_review"),
+        "final_review": ("final_review",),
+        "has_issues": ("has_bugs", "has_errors"),
+        "no_issues": ("has_bugs", "has_errors"),
+    }
+
+    @classmethod
+    def fields(cls, condition: Optional[str]) -> FrozenSet[str]:
+        """Champs du résultat dont dépend l'évaluation de la condition (présents ou absents)"""
+        if condition is None:
+            return frozenset()
+        fields = {condition}
+        if condition in cls.NEGATIVE_MAPPINGS:
+            fields.add(cls.NEGATIVE_MAPPINGS[condition])
+        if condition.startswith("status_"):
+            fields.add("status")
+        fields.update(cls.SPECIAL_FIELDS.get(condition, ()))
+        return frozenset(fields)
+
     @staticmethod
-    def evaluate(condition: Optional[str], result: Any, context: Dict[str, Any]) -> bool:
+    def evaluate(condition: Optional[str], result: Any, context: Dict[str, Any], logger: Optional[logging.Logger] = None) -> bool:
+        """Le logger est injecté par l'appelant (le cœur ne dépend pas de l'infrastructure de logs)"""
         if condition is None:
             return True
 
@@ -15,7 +41,8 @@ class ConditionEvaluator:
             try:
                 result = json.loads(result.replace("'", '"'))
             except Exception as e:
-                print(f"   [ConditionEvaluator] ⚠️ Erreur de parsing JSON: {e}")
+                if logger is not None:
+                    logger.debug("   [ConditionEvaluator] ⚠️ Erreur de parsing JSON: %s", e)
 
         if not isinstance(result, dict):
             return False
@@ -31,10 +58,8 @@ class ConditionEvaluator:
             return result[condition] is True
 
         # Conditions négatives (rejected = !approved, failed = !passed)
-        negative_mappings = {"rejected": "approved", "failed": "passed", "not_hired": "hired", "incomplete": "complete"}
-
-        if condition in negative_mappings:
-            positive_field = negative_mappings[condition]
+        if condition in ConditionEvaluator.NEGATIVE_MAPPINGS:
+            positive_field = ConditionEvaluator.NEGATIVE_MAPPINGS[condition]
             if positive_field in result:
                 return result[positive_field] is False
 
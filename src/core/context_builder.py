@@ -0,0 +1,112 @@
+from typing import Any, Dict, List
+
+from .compiled_workflow import CompiledContext
+from .execution_history import StepRecord
+from .run_context import RunContext
+from .token_counter import TokenCounter
+
+# En dessous, une chaîne n'est plus raccourcie : le contexte peut alors dépasser le budget
+_MIN_STRING_CHARS = 32
+
+
+class ContextBuilder:
+    """Construit l'entrée enrichie d'un nœud à partir de sa politique `context`.
+
+    Les étapes d'historique sont filtrées (nœuds, `last_n`), réduites à leurs sorties sauf
+    demande contraire, puis le contexte est ajusté au budget de tokens : les étapes les plus
+    anciennes qui ne peuvent pas tenir sont retirées, puis les chaînes les plus longues sont
+    tronquées en gardant leur début et leur fin.
+    """
+
+    @classmethod
+    def build(cls, config: CompiledContext, input_data: Any, run: RunContext) -> Dict[str, Any]:
+        context: Dict[str, Any] = {"content": input_data}
+        if config.include_original_request:
+            context["original_request"] = run.context.get("original_request")
+        if config.include_iterations:
+            context["iterations"] = dict(run.node_iterations)
+        context["history"] = [cls._entry(step, config.include_inputs) for step in cls._select_steps(config, run.execution_history)]
+
+        if config.max_tokens is not None:
+            context = cls._fit(context, config.max_tokens)
+        return context
+
+    @staticmethod
+    def _select_steps(config: CompiledContext, history) -> List[StepRecord]:
+        # Parcours depuis la fin : seules les étapes retenues chargent leurs données
+        selected = []
+        for step in reversed(history):
+            if config.last_n is not None and len(selected) >= config.last_n:
+                break
+            if config.nodes is not None and step.node_id not in config.nodes:
+                continue
+            if step.node_id in config.exclude_nodes:
+                continue
+            selected.append(step)
+        selected.reverse()
+        return selected
+
+    @staticmethod
+    def _entry(step: StepRecord, include_inputs: bool) -> Dict[str, Any]:
+        entry = {"node_id": step.node_id, "iteration": step.iteration}
+        if step.branch is not None:
+            entry["branch"] = step.branch
+        if include_inputs:
+            entry["input"] = step.input
+        entry["output"] = step.output
+        return entry
+
+    @classmethod
+    def _fit(cls, context: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+        if TokenCounter.count_value(context) <= max_tokens:
+            return context
+
+        # 1. Retirer les étapes les plus anciennes tant que les suivantes dépassent encore le budget
+        history = context["history"]
+        base_tokens = TokenCounter.count_value({**context, "history": []})
+        entry_tokens = [TokenCounter.count_value(entry) for entry in history]
+        total = base_tokens + sum(entry_tokens)
+        omitted = 0
+        while len(history) - omitted > 1 and total - entry_tokens[omitted] > max_tokens:
+            total -= entry_tokens[omitted]
+            omitted += 1
+        if omitted:
+            context = {**context, "history": history[omitted:], "omitted_steps": omitted}
+            if TokenCounter.count_value(context) <= max_tokens:
+                return context
+
+        # 2. Tronquer les chaînes : plus grande longueur maximale qui tient dans le budget
+        low, high = _MIN_STRING_CHARS, cls._longest_string(context)
+        best = cls._truncate(context, low)
+        while low <= high:
+            middle = (low + high) // 2
+            candidate = cls._truncate(context, middle)
+            if TokenCounter.count_value(candidate) <= max_tokens:
+                best, low = candidate, middle + 1
+            else:
+                high = middle - 1
+        return best
+
+    @classmethod
+    def _longest_string(cls, value: Any) -> int:
+        if isinstance(value, str):
+            return len(value)
+        if isinstance(value, dict):
+            return max((cls._longest_string(item) for item in value.values()), default=0)
+        if isinstance(value, (list, tuple)):
+            return max((cls._longest_string(item) for item in value), default=0)
+        return 0
+
+    @classmethod
+    def _truncate(cls, value: Any, max_chars: int) -> Any:
+        if isinstance(value, str):
+            if len(value) <= max_chars:
+                return value
+            head = max_chars // 2
+            tail = max_chars - head
+            return f"{value[:head]}…[+{len(value) - max_chars} chars]…{value[-tail:]}"
+        if isinstance(value, dict):
+            return {key: cls._truncate(item, max_chars) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._truncate(item, max_chars) for item in value]
+        return value
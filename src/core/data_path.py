@@ -0,0 +1,28 @@
+import json
+from typing import Any
+
+
+class DataPath:
+    """Résolution de chemins pointés dans les données d'un workflow ("a.b.0.c")"""
+
+    @staticmethod
+    def resolve(data: Any, path: str) -> Any:
+        # Les sorties d'agents textuelles contenant du JSON sont décodées
+        if isinstance(data, str):
+            try:
+                data = json.loads(data)
+            except json.JSONDecodeError:
+                pass
+
+        if path in ("", "$"):
+            return data
+
+        current = data
+        for part in path.split("."):
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            elif isinstance(current, (list, tuple)) and part.lstrip("-").isdigit() and -len(current) <= int(part) < len(current):
+                current = current[int(part)]
+            else:
+                raise ValueError(f"Path '{path}' not found in data (missing '{part}')")
+        return current
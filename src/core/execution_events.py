@@ -0,0 +1,76 @@
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, ClassVar, Dict, Optional
+
+
+class EventType(str, Enum):
+    NODE_STARTED = "node_started"
+    TOKEN_DELTA = "token_delta"
+    TOOL_CALLED = "tool_called"
+    NODE_FINISHED = "node_finished"
+    EDGE_TAKEN = "edge_taken"
+    RUN_FINISHED = "run_finished"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExecutionEvent:
+    """Événement émis pendant l'exécution d'un workflow"""
+
+    type: ClassVar[EventType]
+
+    run_id: str
+    branch: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NodeStarted(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.NODE_STARTED
+
+    node_id: str
+    node_name: str
+    iteration: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TokenDelta(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.TOKEN_DELTA
+
+    node_id: str
+    delta: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ToolCalled(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.TOOL_CALLED
+
+    node_id: str
+    tool_name: str
+    args: Any = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NodeFinished(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.NODE_FINISHED
+
+    node_id: str
+    iteration: int
+    output: Any
+    duration_s: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EdgeTaken(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.EDGE_TAKEN
+
+    from_node: str
+    to_node: str
+    condition: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RunFinished(ExecutionEvent):
+    type: ClassVar[EventType] = EventType.RUN_FINISHED
+
+    result: Dict[str, Any]
@@ -0,0 +1,162 @@
+import itertools
+from collections import deque
+from collections.abc import Mapping, Sequence
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+
+class StepRecord(Mapping):
+    """Étape d'exécution légère : identifiants, horodatage, durée et références vers les données.
+
+    Les entrées/sorties complètes ne sont chargées qu'à l'accès (`record["input"]`, `record.output`).
+    """
+
+    __slots__ = ("node_id", "iteration", "timestamp", "duration_s", "branch", "input_ref", "output_ref", "_history")
+
+    def __init__(
+        self,
+        history: "ExecutionHistory",
+        node_id: str,
+        iteration: int,
+        timestamp: str,
+        input_ref: Any,
+        output_ref: Any,
+        duration_s: Optional[float] = None,
+        branch: Optional[str] = None,
+    ):
+        self._history = history
+        self.node_id = node_id
+        self.iteration = iteration
+        self.timestamp = timestamp
+        self.duration_s = duration_s
+        self.branch = branch
+        self.input_ref = input_ref
+        self.output_ref = output_ref
+
+    @property
+    def input(self) -> Any:
+        return self._history.load(self.input_ref)
+
+    @property
+    def output(self) -> Any:
+        return self._history.load(self.output_ref)
+
+    def _keys(self) -> tuple:
+        keys = ("node_id", "iteration", "input", "output", "timestamp", "duration_s")
+        return keys + ("branch",) if self.branch is not None else keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"StepRecord(node_id={self.node_id!r}, iteration={self.iteration}, branch={self.branch!r})"
+
+    def to_dict(self, payloads: bool = True) -> Dict[str, Any]:
+        """Forme sérialisable, avec les données complètes ou seulement leurs références"""
+        record = {"node_id": self.node_id, "iteration": self.iteration, "timestamp": self.timestamp, "duration_s": self.duration_s}
+        if payloads:
+            record.update(input=self.input, output=self.output)
+        else:
+            record.update(input_ref=self.input_ref, output_ref=self.output_ref)
+        if self.branch is not None:
+            record["branch"] = self.branch
+        return record
+
+
+class ExecutionHistory(Sequence):
+    """Historique des étapes d'une exécution.
+
+    Cette implémentation garde les données en mémoire (la référence est la donnée
+    elle-même). Avec `max_steps`, seules les dernières étapes sont conservées (buffer
+    circulaire). Les sous-classes stockent les données ailleurs via `_store` / `load`.
+    """
+
+    # Les références restent valides hors du processus : les checkpoints n'embarquent pas les données
+    durable = False
+
+    def __init__(self, max_steps: Optional[int] = None):
+        self.max_steps = max_steps
+        self._records: Deque[StepRecord] = deque(maxlen=max_steps)
+        # Étapes enregistrées depuis le début de l'exécution, évincées comprises
+        self.recorded = 0
+
+    def record(
+        self,
+        node_id: str,
+        iteration: int,
+        input_data: Any,
+        output_data: Any,
+        timestamp: str,
+        duration_s: Optional[float] = None,
+        branch: Optional[str] = None,
+    ) -> StepRecord:
+        step = StepRecord(self, node_id, iteration, timestamp, self._store(input_data), self._store(output_data), duration_s, branch)
+        self._append(step)
+        return step
+
+    def restore(self, records: Iterable[Dict[str, Any]], start: int = 0) -> None:
+        """Recharge des étapes sérialisées (checkpoint), avec données complètes ou références ; `start` est le rang de la première"""
+        self.recorded = start
+        for record in records:
+            if "input_ref" in record:
+                input_ref, output_ref = record["input_ref"], record["output_ref"]
+            else:
+                input_ref, output_ref = self._store(record.get("input")), self._store(record.get("output"))
+            self._append(
+                StepRecord(
+                    self,
+                    record["node_id"],
+                    record["iteration"],
+                    record["timestamp"],
+                    input_ref,
+                    output_ref,
+                    record.get("duration_s"),
+                    record.get("branch"),
+                )
+            )
+
+    def _append(self, step: StepRecord) -> None:
+        if self.max_steps is not None and len(self._records) == self.max_steps:
+            self._evict(self._records[0])
+        self._records.append(step)
+        self.recorded += 1
+
+    def _store(self, payload: Any) -> Any:
+        return payload
+
+    def _evict(self, step: StepRecord) -> None:
+        """Étape sortie du buffer circulaire"""
+
+    def load(self, ref: Any) -> Any:
+        return ref
+
+    async def flush(self) -> None:
+        """Attend que les données déjà enregistrées soient persistées (avant un checkpoint)"""
+
+    def to_list(self, payloads: bool = True, since: int = 0) -> List[Dict[str, Any]]:
+        """Étapes sérialisées ; avec `since`, seulement celles de rang >= since encore conservées"""
+        steps = self._records
+        if since > self.recorded - len(steps):
+            steps = itertools.islice(steps, since - (self.recorded - len(steps)), None)
+        return [step.to_dict(payloads) for step in steps]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._records)[index]
+        return self._records[index]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[StepRecord]:
+        return iter(self._records)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} steps)"
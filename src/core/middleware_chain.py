@@ -0,0 +1,101 @@
+import inspect
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+from ..domain.interfaces.i_workflow_middleware import IWorkflowMiddleware
+
+AgentCall = Callable[[Any], Awaitable[Any]]
+
+
+async def _resolve(value: Any) -> Any:
+    # Les hooks synchrones retournent directement leur valeur
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class MiddlewareChain:
+    """Dispatch des hooks de middlewares, compilé une fois à l'enregistrement.
+
+    Chaque hook est exposé comme un attribut : None quand aucun middleware ne le redéfinit,
+    ce qui réduit son coût dans la boucle d'exécution à un test `is not None`.
+    """
+
+    HOOKS = ("before_run", "before_node", "around_agent_call", "after_node", "on_edge", "after_run")
+
+    def __init__(self, middlewares: Sequence[Any] = ()):
+        self.middlewares = tuple(middlewares)
+        self.before_run = self._compile_notify(self._implementations("before_run"))
+        self.before_node = self._compile_before_node(self._implementations("before_node"))
+        self.around_agent_call = self._compile_around(self._implementations("around_agent_call"))
+        self.after_node = self._compile_after_node(self._implementations("after_node"))
+        self.on_edge = self._compile_notify(self._implementations("on_edge"))
+        self.after_run = self._compile_notify(self._implementations("after_run"))
+
+    def __len__(self) -> int:
+        return len(self.middlewares)
+
+    def _implementations(self, hook: str) -> List[Callable]:
+        """Méthodes liées des middlewares qui redéfinissent le hook (dans l'ordre d'enregistrement)"""
+        default = getattr(IWorkflowMiddleware, hook)
+        return [
+            getattr(middleware, hook)
+            for middleware in self.middlewares
+            if getattr(type(middleware), hook, default) is not default
+        ]
+
+    @staticmethod
+    def _compile_notify(hooks: List[Callable]) -> Optional[Callable[..., Awaitable[None]]]:
+        if not hooks:
+            return None
+
+        async def dispatch(*args) -> None:
+            for hook in hooks:
+                await _resolve(hook(*args))
+
+        return dispatch
+
+    @staticmethod
+    def _compile_before_node(hooks: List[Callable]) -> Optional[Callable[..., Awaitable[Any]]]:
+        if not hooks:
+            return None
+
+        async def dispatch(run: Any, node: Any, input_data: Any) -> Any:
+            for hook in hooks:
+                input_data = await _resolve(hook(run, node, input_data))
+            return input_data
+
+        return dispatch
+
+    @staticmethod
+    def _compile_after_node(hooks: List[Callable]) -> Optional[Callable[..., Awaitable[Any]]]:
+        if not hooks:
+            return None
+
+        # Ordre inverse : le premier middleware enregistré voit la sortie en dernier, comme un oignon
+        hooks = hooks[::-1]
+
+        async def dispatch(run: Any, node: Any, input_data: Any, output: Any) -> Any:
+            for hook in hooks:
+                output = await _resolve(hook(run, node, input_data, output))
+            return output
+
+        return dispatch
+
+    @staticmethod
+    def _compile_around(hooks: List[Callable]) -> Optional[Callable[[Any, Any, AgentCall], AgentCall]]:
+        if not hooks:
+            return None
+
+        def wrap(hook: Callable, run: Any, node: Any, call_next: AgentCall) -> AgentCall:
+            async def call(input_data: Any) -> Any:
+                return await _resolve(hook(run, node, input_data, call_next))
+
+            return call
+
+        def chain(run: Any, node: Any, agent_call: AgentCall) -> AgentCall:
+            """Enveloppe l'appel de l'agent ; le premier middleware enregistré est le plus externe"""
+            for hook in reversed(hooks):
+                agent_call = wrap(hook, run, node, agent_call)
+            return agent_call
+
+        return chain
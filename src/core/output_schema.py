@@ -0,0 +1,49 @@
+import re
+from typing import Any, Dict, List, Literal, Mapping, Optional, Type
+
+from pydantic import BaseModel, Field, create_model
+
+_PRIMITIVE_TYPES = {"string": str, "boolean": bool, "integer": int, "number": float}
+
+
+def build_output_model(schema: Mapping[str, Any], name: str = "DecisionOutput") -> Type[BaseModel]:
+    """Modèle pydantic d'un schéma de sortie déclaré en JSON Schema.
+
+    Sous-ensemble pris en charge : objets (`properties`, `required`, `default`, `description`),
+    tableaux (`items`), `enum` et types primitifs. Les champs hors de `required` sont optionnels.
+    """
+    properties = schema.get("properties")
+    if schema.get("type", "object") != "object" or not isinstance(properties, Mapping) or not properties:
+        raise ValueError(f"output_schema of '{name}' must be an object schema with properties")
+
+    required = set(schema.get("required", ()))
+    unknown = required - set(properties)
+    if unknown:
+        raise ValueError(f"output_schema of '{name}' requires unknown fields {sorted(unknown)}")
+
+    model_name = re.sub(r"\W", "", name.title()) or "DecisionOutput"
+    fields: Dict[str, Any] = {}
+    for field_name, field_schema in properties.items():
+        annotation = _annotation(field_schema, f"{model_name}{field_name.title()}")
+        description = field_schema.get("description")
+        if field_name in required:
+            fields[field_name] = (annotation, Field(..., description=description))
+        else:
+            fields[field_name] = (Optional[annotation], Field(field_schema.get("default"), description=description))
+    return create_model(model_name, __doc__=schema.get("description"), **fields)
+
+
+def _annotation(schema: Mapping[str, Any], name: str) -> Any:
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+
+    schema_type = schema.get("type")
+    if schema_type is None:
+        return Any
+    if schema_type in _PRIMITIVE_TYPES:
+        return _PRIMITIVE_TYPES[schema_type]
+    if schema_type == "array":
+        return List[_annotation(schema.get("items", {}), f"{name}Item")]
+    if schema_type == "object":
+        return build_output_model(schema, name) if schema.get("properties") else Dict[str, Any]
+    raise ValueError(f"output_schema type '{schema_type}' not supported")
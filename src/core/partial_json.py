@@ -0,0 +1,78 @@
+import json
+from typing import Any, Dict, List
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+class PartialJsonObject:
+    """Analyse incrémentale du premier objet JSON d'un flux de texte.
+
+    `fields` contient les champs de premier niveau dont la valeur est entièrement reçue : une
+    valeur n'y change plus une fois ajoutée. Le texte qui précède l'objet est ignoré.
+    """
+
+    __slots__ = ("fields", "complete", "_member", "_depth", "_in_string", "_escape")
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.complete = False
+        # Texte du membre "clé": valeur en cours de réception
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, delta: str) -> bool:
+        """Ajoute un fragment du flux ; retourne True si de nouveaux champs sont complets"""
+        added = False
+        member = self._member
+        for char in delta:
+            if self.complete:
+                break
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                member.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    added |= self._close_member()
+                    self.complete = True
+                    continue
+            elif char == "," and self._depth == 1:
+                added |= self._close_member()
+                continue
+            member.append(char)
+        return added
+
+    def _close_member(self) -> bool:
+        text = "".join(self._member).strip()
+        self._member.clear()
+        if not text:
+            return False
+        try:
+            key, end = _JSON_DECODER.raw_decode(text)
+            separator = text.index(":", end)
+            value = json.loads(text[separator + 1 :])
+        except ValueError:
+            # Membre invalide : ignoré, les conditions qui en dépendent attendront la réponse complète
+            return False
+        if not isinstance(key, str) or key in self.fields:
+            return False
+        self.fields[key] = value
+        return True
@@ -0,0 +1,113 @@
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ..domain.entities.workflow_checkpoint import WorkflowCheckpoint
+from .compiled_workflow import CompiledWorkflow
+from .execution_history import ExecutionHistory
+from .execution_events import ExecutionEvent
+
+
+_run_id: ContextVar[Optional[str]] = ContextVar("run_id", default=None)
+
+
+def _discard_event(event: ExecutionEvent) -> None:
+    pass
+
+
+@contextmanager
+def run_scope(run_id: str) -> Iterator[None]:
+    """Rattache le bloc (appels d'agents, de modèles et d'outils) à une exécution"""
+    token = _run_id.set(run_id)
+    try:
+        yield
+    finally:
+        _run_id.reset(token)
+
+
+def current_run_id() -> Optional[str]:
+    """Exécution en cours (None hors exécution de workflow)"""
+    return _run_id.get()
+
+
+@dataclass(slots=True)
+class IterationScope:
+    """Compteurs d'itérations d'un élément de map, indépendants de l'exécution et des autres éléments"""
+
+    node_iterations: Dict[str, int] = field(default_factory=dict)
+    total_iterations: int = 0
+
+    def get_iterations(self, node_id: str) -> int:
+        return self.node_iterations.get(node_id, 0)
+
+
+@dataclass(slots=True)
+class RunContext:
+    """État d'une exécution de workflow, créé pour chaque appel à execute()"""
+
+    workflow: CompiledWorkflow
+    initial_data: Any
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    execution_history: ExecutionHistory = field(default_factory=ExecutionHistory)
+    node_iterations: Dict[str, int] = field(default_factory=dict)
+    total_iterations: int = 0
+    emit: Callable[[ExecutionEvent], None] = _discard_event
+    stream_tokens: bool = False
+    # Budget de temps global, décompté à partir de la création du contexte
+    timeout_s: Optional[float] = None
+    context: Dict[str, Any] = field(init=False)
+    deadline: Optional[float] = field(init=False)
+    # Limite ayant interrompu l'exécution ("completed" si elle est allée à son terme)
+    stop_reason: str = field(init=False, default="completed")
+    stopped_at: Optional[str] = field(init=False, default=None)
+    # Edges choisis par routage anticipé, par (branche, nœud), jusqu'au choix définitif
+    early_routes: Dict[Tuple[Optional[str], str], Any] = field(init=False, default_factory=dict)
+    # Étapes déjà enregistrées par un checkpoint (None : aucun checkpoint, le prochain est complet)
+    checkpointed_steps: Optional[int] = field(init=False, default=None)
+
+    def __post_init__(self):
+        # Contexte partagé avec les agents et l'évaluateur de conditions
+        self.context = {
+            "run_id": self.run_id,
+            "workflow_name": self.workflow.name,
+            "history": [],
+            "original_request": self.initial_data,
+        }
+        self.deadline = time.monotonic() + self.timeout_s if self.timeout_s is not None else None
+
+    def get_iterations(self, node_id: str) -> int:
+        return self.node_iterations.get(node_id, 0)
+
+    def remaining_s(self) -> Optional[float]:
+        """Temps restant avant la deadline de l'exécution (None si illimité)"""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def stop(self, reason: str, node_id: Optional[str]) -> None:
+        self.stop_reason = reason
+        self.stopped_at = node_id
+
+    @classmethod
+    def from_checkpoint(
+        cls, workflow: CompiledWorkflow, checkpoint: WorkflowCheckpoint, execution_history: Optional[ExecutionHistory] = None, **kwargs
+    ) -> "RunContext":
+        """Restaure l'état d'une exécution interrompue"""
+        execution_history = execution_history if execution_history is not None else ExecutionHistory()
+        execution_history.restore(checkpoint.execution_history, checkpoint.history_start)
+        run = cls(
+            workflow,
+            checkpoint.context.get("original_request"),
+            run_id=checkpoint.run_id,
+            execution_history=execution_history,
+            node_iterations=dict(checkpoint.node_iterations),
+            total_iterations=checkpoint.total_iterations,
+            **kwargs,
+        )
+        run.context.update(checkpoint.context)
+        # Le store conserve l'historique du checkpoint : les suivants n'ajoutent que les nouvelles étapes
+        run.checkpointed_steps = execution_history.recorded
+        return run
@@ -0,0 +1,34 @@
+from typing import Optional
+
+
+class RunLimitExceeded(Exception):
+    """Limite d'exécution atteinte : interrompt le nœud en cours et ses appels d'agent"""
+
+    reason = "limit"
+
+    def __init__(self, node_id: str, limit_s: Optional[float]):
+        super().__init__(f"Node '{node_id}' interrupted: {self.reason} ({limit_s}s) exceeded")
+        self.node_id = node_id
+        self.limit_s = limit_s
+
+
+class ItemLimitExceeded(Exception):
+    """Un élément de map a atteint une limite d'itérations : échec de l'élément, traité selon `on_error`"""
+
+    def __init__(self, reason: str, node_id: str, limit: int):
+        super().__init__(f"Node '{node_id}' stopped: {reason} ({limit}) reached in map item")
+        self.reason = reason
+        self.node_id = node_id
+        self.limit = limit
+
+
+class NodeTimeout(RunLimitExceeded):
+    """Le nœud a dépassé son propre `timeout_s`"""
+
+    reason = "node_timeout"
+
+
+class RunDeadlineExceeded(RunLimitExceeded):
+    """Le budget de temps global de l'exécution est épuisé"""
+
+    reason = "run_deadline"
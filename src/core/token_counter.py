@@ -0,0 +1,33 @@
+import json
+import math
+import re
+from typing import Any
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+
+
+class TokenCounter:
+    """Estimation locale du nombre de tokens, sans tokenizer du fournisseur.
+
+    Chaque mot ou signe de ponctuation compte pour au moins un token, et les mots
+    longs pour environ un token tous les 4 caractères : l'écart avec les tokenizers
+    BPE usuels reste de l'ordre de 10 à 20 %.
+    """
+
+    CHARS_PER_TOKEN = 4
+
+    @classmethod
+    def count(cls, text: str) -> int:
+        tokens = 0
+        for piece in _PIECES.findall(text):
+            tokens += max(1, math.ceil(len(piece) / cls.CHARS_PER_TOKEN))
+        return tokens
+
+    @classmethod
+    def count_value(cls, value: Any) -> int:
+        return cls.count(value if isinstance(value, str) else compact_json(value))
+
+
+def compact_json(value: Any) -> str:
+    """Sérialisation JSON sans espaces superflus ni échappement des caractères non ASCII"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
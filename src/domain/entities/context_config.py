@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ContextConfig(BaseModel):
+    """Contexte d'exécution ajouté à l'entrée d'un nœud (historique, demande initiale, itérations)"""
+
+    # Budget approximatif en tokens du contexte sérialisé
+    max_tokens: Optional[int] = None
+    # Nombre maximal d'étapes d'historique (les plus récentes)
+    last_n: Optional[int] = None
+    # Seules les étapes de ces nœuds sont incluses
+    nodes: Optional[List[str]] = None
+    # Les étapes de ces nœuds sont exclues
+    exclude_nodes: Optional[List[str]] = None
+    # Inclure les entrées des étapes en plus de leurs sorties
+    include_inputs: bool = False
+    include_original_request: bool = True
+    include_iterations: bool = True
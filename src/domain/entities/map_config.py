@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class MapConfig(BaseModel):
+    """Configuration d'un nœud map : exécute un sous-nœud pour chaque élément d'une liste"""
+
+    # Chemin de la liste dans les données courantes (ex: "requirements", "analysis.items")
+    items_path: str
+    # Nœud (ou premier nœud d'un sous-chemin) exécuté pour chaque élément
+    node: str
+    # Clés des données courantes transmises avec chaque élément
+    context_keys: Optional[List[str]] = None
+    # Politique en cas d'échec d'un élément : fail_fast, skip ou collect
+    on_error: str = "fail_fast"
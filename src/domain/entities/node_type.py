@@ -5,4 +5,7 @@ class NodeType(str, Enum):
     START = "start"
     PROCESS = "process"
     DECISION = "decision"
+    PARALLEL = "parallel"
+    SYNC = "sync"
+    MAP = "map"
     END = "end"
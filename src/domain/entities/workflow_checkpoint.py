@@ -0,0 +1,47 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class WorkflowCheckpoint(BaseModel):
+    """État persistant d'une exécution, enregistré après chaque nœud terminé.
+
+    Un checkpoint incrémental (`history_delta`) ne porte que les étapes ajoutées depuis le
+    précédent : le store le fusionne avec l'historique déjà enregistré pour l'exécution.
+    """
+
+    run_id: str
+    workflow_name: str
+    workflow_source: Optional[Dict[str, Any]] = None
+    status: str = "running"
+    next_node_id: Optional[str] = None
+    current_data: Any = None
+    node_iterations: Dict[str, int] = {}
+    total_iterations: int = 0
+    execution_history: List[Dict[str, Any]] = []
+    # Rang de la première étape de `execution_history` parmi toutes les étapes de l'exécution
+    history_start: int = 0
+    history_delta: bool = False
+    context: Dict[str, Any] = {}
+    updated_at: str
+
+    @property
+    def completed(self) -> bool:
+        return self.status == "completed"
+
+    def merge(self, delta: "WorkflowCheckpoint") -> "WorkflowCheckpoint":
+        """Applique un checkpoint plus récent de la même exécution (complet ou incrémental)"""
+        if not delta.history_delta:
+            return delta
+        if self.completed or delta.total_iterations < self.total_iterations:
+            # Incrément antérieur à ce checkpoint, déjà intégré
+            return self
+        kept = self.execution_history[: max(0, delta.history_start - self.history_start)]
+        return delta.model_copy(
+            update={
+                "workflow_source": delta.workflow_source or self.workflow_source,
+                "execution_history": kept + delta.execution_history,
+                "history_start": self.history_start if kept else delta.history_start,
+                "history_delta": self.history_delta,
+            }
+        )
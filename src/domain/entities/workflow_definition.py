@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -12,3 +12,9 @@ class WorkflowDefinition(BaseModel):
     nodes: List[WorkflowNode]
     edges: List[WorkflowEdge]
     start_node: str
+    # Budget de temps global d'une exécution, en secondes
+    timeout_s: Optional[float] = None
+    # Limite du nombre total de nœuds exécutés (défaut de l'exécuteur si absent)
+    max_total_iterations: Optional[int] = None
+    # Priorité des appels au modèle de ses exécutions face aux quotas partagés (plus grand = servi avant)
+    priority: int = 0
@@ -2,6 +2,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from .context_config import ContextConfig
+from .map_config import MapConfig
 from .node_type import NodeType
 
 
@@ -10,5 +12,15 @@ class WorkflowNode(BaseModel):
     name: str
     type: NodeType
     max_iterations: Optional[int] = None
+    # Durée maximale d'une exécution du nœud, en secondes
+    timeout_s: Optional[float] = None
     agent_config: Dict[str, Any]
     tools: Optional[List[str]] = None
+    # Nœuds parallel et map : nombre maximum de branches exécutées simultanément
+    max_concurrency: Optional[int] = None
+    # Nœuds sync : stratégie de fusion des sorties de branches
+    merge_strategy: Optional[str] = None
+    # Nœuds map : liste à parcourir et sous-nœud à exécuter par élément
+    map: Optional[MapConfig] = None
+    # Contexte d'exécution (historique, demande initiale) ajouté à l'entrée du nœud
+    context: Optional[ContextConfig] = None
@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+from .i_agent_observer import IAgentObserver
+
 
 class IAgent(ABC):
     @abstractmethod
     async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
         pass
 
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        """Exécute l'agent en signalant tokens et appels d'outils à l'observateur"""
+        return await self.execute(input_data, context)
+
     @abstractmethod
     def get_name(self) -> str:
         pass
@@ -14,3 +20,7 @@ class IAgent(ABC):
     def set_tools(self, tools: List[Any]) -> None:
         """Définit les outils disponibles pour cet agent"""
         pass
+
+    def warm(self) -> None:
+        """Prépare un appel imminent (réservation de quota...) sans l'exécuter"""
+        pass
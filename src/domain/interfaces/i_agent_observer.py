@@ -0,0 +1,35 @@
+from abc import ABC
+from typing import Any, Mapping
+
+
+class IAgentObserver(ABC):
+    """Reçoit les événements produits par un agent pendant son exécution"""
+
+    # Les agents ne streament les tokens du modèle que si l'observateur le demande
+    stream_tokens: bool = False
+    # Idem pour les champs de la sortie structurée, signalés dès qu'ils sont complets
+    partial_output: bool = False
+
+    def on_token(self, delta: str) -> None:
+        pass
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        pass
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        """Fin d'une exécution d'agent : temps passé dans le modèle et dans les outils, consommation de tokens"""
+        pass
+
+    def on_partial_output(self, fields: Mapping[str, Any]) -> None:
+        """Champs de premier niveau de la sortie déjà entièrement reçus (la réponse continue de streamer)"""
+        pass
+
+    def on_retry(self, error: BaseException) -> None:
+        pass
+
+    def on_parse_failure(self) -> None:
+        pass
+
+    def on_cascade(self, model: str, outcome: str) -> None:
+        """Réponse d'un modèle de cascade : "accepted", "final" (modèle du nœud) ou motif d'escalade"""
+        pass
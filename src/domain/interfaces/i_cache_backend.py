@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Tuple
+
+
+class ICacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        """Retourne (trouvé, valeur)"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
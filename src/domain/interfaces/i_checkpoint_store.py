@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.workflow_checkpoint import WorkflowCheckpoint
+
+
+class ICheckpointStore(ABC):
+    @abstractmethod
+    async def save(self, checkpoint: WorkflowCheckpoint) -> None:
+        pass
+
+    @abstractmethod
+    async def load(self, run_id: str) -> Optional[WorkflowCheckpoint]:
+        pass
+
+    async def flush(self) -> None:
+        """Écrit les checkpoints en attente"""
+        pass
+
+    async def close(self) -> None:
+        await self.flush()
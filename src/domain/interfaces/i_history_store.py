@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IHistoryStore(ABC):
+    """Fabrique des historiques d'exécution : choisit où et comment les données des étapes sont conservées"""
+
+    @abstractmethod
+    def open(self, run_id: str) -> Any:
+        """Crée l'historique (ExecutionHistory) d'une exécution"""
+        pass
+
+    async def close(self) -> None:
+        pass
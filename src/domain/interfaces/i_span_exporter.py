@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class ISpanExporter(ABC):
+    """Reçoit les spans terminés d'un Tracer"""
+
+    @abstractmethod
+    def export(self, span: Any) -> None:
+        """Appelé depuis la boucle d'événements à la fin de chaque span : doit rester rapide"""
+        pass
+
+    async def close(self) -> None:
+        pass
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
 from ..entities.workflow_definition import WorkflowDefinition
 
 
 class IWorkflowExecutor(ABC):
     @abstractmethod
-    async def execute(self, workflow: WorkflowDefinition, initial_data: Any) -> Dict[str, Any]:
+    async def execute(self, workflow: WorkflowDefinition, initial_data: Any, timeout_s: Optional[float] = None) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def execute_stream(
+        self, workflow: WorkflowDefinition, initial_data: Any, stream_tokens: bool = True, timeout_s: Optional[float] = None
+    ) -> AsyncIterator[Any]:
         pass
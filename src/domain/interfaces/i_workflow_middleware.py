@@ -0,0 +1,32 @@
+from abc import ABC
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class IWorkflowMiddleware(ABC):
+    """Extension du cycle de vie d'une exécution, enregistrée sur le WorkflowService.
+
+    Seules les méthodes redéfinies sont appelées. Chacune peut être synchrone ou async.
+    `run` est le RunContext de l'exécution et `node` le CompiledNode courant.
+    """
+
+    def before_run(self, run: Any) -> Optional[Awaitable[None]]:
+        pass
+
+    def before_node(self, run: Any, node: Any, input_data: Any) -> Any:
+        """Retourne l'entrée à transmettre au nœud (éventuellement modifiée)"""
+        return input_data
+
+    def around_agent_call(self, run: Any, node: Any, input_data: Any, call_next: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Entoure l'appel de l'agent : `await call_next(input_data)` exécute la suite de la chaîne"""
+        return call_next(input_data)
+
+    def after_node(self, run: Any, node: Any, input_data: Any, output: Any) -> Any:
+        """Retourne la sortie du nœud (éventuellement modifiée), utilisée pour le routage"""
+        return output
+
+    def on_edge(self, run: Any, from_node: str, to_node: str, condition: Optional[str]) -> Optional[Awaitable[None]]:
+        pass
+
+    def after_run(self, run: Any, result: Optional[Dict[str, Any]], error: Optional[BaseException]) -> Optional[Awaitable[None]]:
+        """Fin de l'exécution : `result` en cas de succès, `error` si elle a échoué ou a été annulée (CancelledError)"""
+        pass
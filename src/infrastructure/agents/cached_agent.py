@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+from ...core.agent_key import agent_key
+from ...domain.interfaces.i_agent import IAgent
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ..cache.result_cache import ResultCache
+
+
+class _SharedStream(IAgentObserver):
+    """Observateur d'un appel partagé : ses événements sont relayés à tous les appelants qui l'attendent
+    encore, à partir de leur arrivée. La consommation n'est imputée qu'à un seul d'entre eux"""
+
+    __slots__ = ("observers",)
+
+    def __init__(self):
+        self.observers: List[IAgentObserver] = []
+
+    @property
+    def stream_tokens(self) -> bool:
+        return any(observer.stream_tokens for observer in self.observers)
+
+    @property
+    def partial_output(self) -> bool:
+        return any(observer.partial_output for observer in self.observers)
+
+    def on_token(self, delta: str) -> None:
+        for observer in tuple(self.observers):
+            observer.on_token(delta)
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        for observer in tuple(self.observers):
+            observer.on_tool_call(tool_name, args)
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        # Un seul appel au fournisseur : sa consommation n'est comptée qu'une fois
+        if self.observers:
+            self.observers[0].on_agent_run(model_s, tools_s, usage)
+
+    def on_partial_output(self, fields: Mapping[str, Any]) -> None:
+        for observer in tuple(self.observers):
+            observer.on_partial_output(fields)
+
+    def on_retry(self, error: BaseException) -> None:
+        for observer in tuple(self.observers):
+            observer.on_retry(error)
+
+    def on_parse_failure(self) -> None:
+        for observer in tuple(self.observers):
+            observer.on_parse_failure()
+
+    def on_cascade(self, model: str, outcome: str) -> None:
+        for observer in tuple(self.observers):
+            observer.on_cascade(model, outcome)
+
+
+class CachedAgent(IAgent):
+    """Décorateur d'agent qui sert les entrées identiques depuis le cache de résultats.
+
+    La clé couvre l'empreinte normalisée de la configuration et des outils du nœud (celle de
+    CompiledNode.agent_key : modèle, prompt, schéma de sortie, paramètres...) et l'entrée sérialisée.
+    En streaming, les appelants d'un même appel partagé en reçoivent tous les événements ; un
+    appelant annulé n'en reçoit plus.
+    """
+
+    def __init__(self, agent: IAgent, cache: ResultCache, agent_config: Mapping[str, Any], tool_names: Optional[List[str]] = None):
+        self.agent = agent
+        self.cache = cache
+        self.ttl_s = agent_config.get("cache_ttl_s")
+        model = agent_config.get("model", "openai:gpt-4o-mini")
+        if not isinstance(model, str):
+            # Un modèle instancié est identifié par son nom, stable d'un processus à l'autre (backend persistant)
+            agent_config = {**agent_config, "model": getattr(model, "model_name", repr(model))}
+        self._agent_key = agent_key(agent_config, tool_names)
+        # Flux partagés par clé, tant qu'un appelant les attend
+        self._streams: Dict[str, _SharedStream] = {}
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.cache.get_or_compute(
+            self._make_key(input_data), lambda: self.agent.execute(input_data, context), self.ttl_s
+        )
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        # En cas de succès de cache, aucun token n'est émis : le résultat est immédiat
+        key = self._make_key(input_data)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = _SharedStream()
+        stream.observers.append(observer)
+        try:
+            return await self.cache.get_or_compute(key, lambda: self.agent.execute_stream(input_data, context, stream), self.ttl_s)
+        finally:
+            stream.observers.remove(observer)
+            if not stream.observers and self._streams.get(key) is stream:
+                del self._streams[key]
+
+    def _make_key(self, input_data: Any) -> str:
+        return self.cache.make_key(agent=self._agent_key, input=input_data)
+
+    def get_name(self) -> str:
+        return self.agent.get_name()
+
+    def warm(self) -> None:
+        self.agent.warm()
+
+    def set_tools(self, tools: List[Any]) -> None:
+        self.agent.set_tools(tools)
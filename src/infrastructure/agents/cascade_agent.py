@@ -0,0 +1,104 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...domain.interfaces.i_agent import IAgent
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ..logs.logger import get_logger
+from ..routing.cascade_policy import CascadePolicy
+
+logger = get_logger(__name__)
+
+# Sans observateur (execute), les échecs de parsing restent détectés par l'observateur de palier
+_NO_OBSERVER = IAgentObserver()
+
+
+class _TierObserver(IAgentObserver):
+    """Observateur d'un palier de la cascade : ses tokens et appels d'outils ne sont relayés que si sa réponse est acceptée"""
+
+    __slots__ = ("observer", "events", "parse_failed")
+
+    def __init__(self, observer: IAgentObserver):
+        self.observer = observer
+        # Événements retenus, dans leur ordre d'arrivée : (méthode de l'observateur, arguments)
+        self.events: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = []
+        self.parse_failed = False
+
+    @property
+    def stream_tokens(self) -> bool:
+        return self.observer.stream_tokens
+
+    @property
+    def partial_output(self) -> bool:
+        # Les champs d'un palier pourraient être rejetés : pas de routage anticipé sur leur base
+        return False
+
+    def on_token(self, delta: str) -> None:
+        self.events.append((self.observer.on_token, (delta,)))
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        self.events.append((self.observer.on_tool_call, (tool_name, args)))
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Dict[str, int]) -> None:
+        # Le coût d'un palier rejeté reste imputé au nœud
+        self.observer.on_agent_run(model_s, tools_s, usage)
+
+    def on_retry(self, error: BaseException) -> None:
+        self.observer.on_retry(error)
+
+    def on_parse_failure(self) -> None:
+        self.parse_failed = True
+
+    def flush(self) -> None:
+        for relay, args in self.events:
+            relay(*args)
+
+
+class CascadeAgent(IAgent):
+    """Décorateur d'agent : essaie des modèles moins coûteux avant celui du nœud.
+
+    La première réponse acceptée par la politique de cascade est retenue ; sinon (réponse
+    rejetée ou erreur), l'appel passe au palier suivant, puis à l'agent du nœud.
+    """
+
+    CONFIG_KEY = "cascade"
+
+    def __init__(self, agent: IAgent, tiers: List[Tuple[str, IAgent]], policy: CascadePolicy, model: str):
+        self.agent = agent
+        self.tiers = tiers
+        self.policy = policy
+        self.model = model
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.execute_stream(input_data, context, _NO_OBSERVER)
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        for model, agent in self.tiers:
+            tier_observer = _TierObserver(observer)
+            try:
+                output = await agent.execute_stream(input_data, context, tier_observer)
+            except Exception as error:
+                logger.warning("   [CascadeAgent] ⤴️ %s: %s en échec (%s), escalade", self.get_name(), model, error)
+                reason: Optional[str] = "error"
+            else:
+                reason = "parse_failure" if tier_observer.parse_failed else self.policy.rejection(output)
+                if reason is None:
+                    tier_observer.flush()
+                    observer.on_cascade(model, "accepted")
+                    return output
+                logger.debug("   [CascadeAgent] ⤴️ %s: réponse de %s rejetée (%s), escalade", self.get_name(), model, reason)
+            observer.on_cascade(model, reason)
+
+        output = await self.agent.execute_stream(input_data, context, observer)
+        observer.on_cascade(self.model, "final")
+        return output
+
+    def get_name(self) -> str:
+        return self.agent.get_name()
+
+    def warm(self) -> None:
+        # Le premier palier est appelé en premier
+        (self.tiers[0][1] if self.tiers else self.agent).warm()
+
+    def set_tools(self, tools: List[Any]) -> None:
+        self.agent.set_tools(tools)
+        for _, agent in self.tiers:
+            agent.set_tools(tools)
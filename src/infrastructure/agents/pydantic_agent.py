@@ -1,38 +1,221 @@
 import json
 import re
-from typing import Any, Dict, List, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from pydantic import BaseModel
 from pydantic_ai import Agent
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.messages import (
+    ModelRequest,
+    PartDeltaEvent,
+    PartStartEvent,
+    RetryPromptPart,
+    TextPart,
+    TextPartDelta,
+    ToolCallPart,
+    ToolCallPartDelta,
+)
 from pydantic_ai.tools import Tool
+from pydantic_ai.usage import Usage
 
+from ...core.output_schema import build_output_model
+from ...core.partial_json import PartialJsonObject
+from ...core.token_counter import compact_json
 from ...domain.interfaces.i_agent import IAgent
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ..http.http_client_pool import HttpClientPool
+from ..http.provider_models import build_model
+from ..logs.logger import get_logger
+from ..resilience.model_health import model_key
+from ..simulation.cassette import Cassette
+from ..simulation.simulated_model import SimulatedModel
+from ..tools.tool_calls import cancel_tool_calls_on_exit
+from ..tracing.span import Span, current_span
+
+logger = get_logger(__name__)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _first_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Premier objet JSON contenu dans le texte, objets imbriqués compris"""
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            value = None
+        if isinstance(value, dict):
+            return value
+        start = text.find("{", start + 1)
+    return None
 
 
 class PydanticAgent(IAgent):
-    def __init__(self, agent_config: Dict[str, Any], tools: Optional[List[Tool]] = None):
+    def __init__(
+        self,
+        agent_config: Dict[str, Any],
+        tools: Optional[List[Tool]] = None,
+        http_clients: Optional[HttpClientPool] = None,
+        cassette: Optional[Cassette] = None,
+    ):
         self.config = agent_config
         self.name = agent_config.get("name", "GenericAgent")
         self.tools = tools or []
+        # Clients HTTP partagés par fournisseur ; sans pool, pydantic-ai utilise son client par défaut
+        self.http_clients = http_clients
+        # Enregistrement ou rejeu des échanges avec le modèle
+        self.cassette = cassette
+        # Sortie typée : le modèle pydantic du schéma déclaré, validé par pydantic-ai
+        output_schema = agent_config.get("output_schema")
+        self.output_model = build_output_model(output_schema, self.name) if output_schema else None
+        self.output_retries = agent_config.get("output_retries", 2)
+        if self.output_retries < 0:
+            raise ValueError("output_retries must be >= 0")
         self._create_agent()
 
     async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        with cancel_tool_calls_on_exit():
+            result = await self.agent.run(self._build_prompt(input_data))
+        return self._process_output(result.output)
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        # Chaque nœud du graphe pydantic-ai s'exécute entre sa réception et celle du suivant
+        phase_times = {"model": 0.0, "tools": 0.0}
+        phase, phase_started = None, time.perf_counter()
+        # Span de la requête au modèle en cours et consommation à son début (uniquement si le tracing est actif)
+        parent_span, model_span, usage_before = current_span(), None, None
+
+        with cancel_tool_calls_on_exit(), self._validation_failures(observer):
+            async with self.agent.iter(self._build_prompt(input_data)) as agent_run:
+                try:
+                    async for node in agent_run:
+                        now = time.perf_counter()
+                        if phase is not None:
+                            phase_times[phase] += now - phase_started
+                        phase, phase_started = None, now
+                        if model_span is not None:
+                            self._end_model_span(model_span, usage_before, agent_run.usage())
+                            model_span = None
+
+                        if Agent.is_model_request_node(node):
+                            phase = "model"
+                            if parent_span is not None:
+                                model_span = parent_span.child("model.request", {"gen_ai.request.model": self.model_name, "agent.name": self.name})
+                                usage = agent_run.usage()
+                                usage_before = (usage.request_tokens or 0, usage.response_tokens or 0)
+                            if observer.stream_tokens or (observer.partial_output and self._is_structured()):
+                                await self._stream_model_request(node, agent_run, observer)
+                        elif Agent.is_call_tools_node(node):
+                            phase = "tools"
+                            for part in node.model_response.parts:
+                                if isinstance(part, ToolCallPart):
+                                    observer.on_tool_call(part.tool_name, part.args)
+                except BaseException as error:
+                    if model_span is not None:
+                        model_span.record_error(error)
+                        model_span.end()
+                    raise
+
+        if self.output_model is not None:
+            # Chaque nouvelle tentative de validation de la sortie est un échec de parsing
+            # (les erreurs d'arguments des outils du nœud ne comptent pas)
+            tool_names = {tool.name for tool in self.tools}
+            for message in agent_run.result.new_messages():
+                if isinstance(message, ModelRequest):
+                    for part in message.parts:
+                        if isinstance(part, RetryPromptPart) and part.tool_name not in tool_names:
+                            observer.on_parse_failure()
+
+        usage = agent_run.usage()
+        observer.on_agent_run(
+            phase_times["model"],
+            phase_times["tools"],
+            {"requests": usage.requests, "request_tokens": usage.request_tokens or 0, "response_tokens": usage.response_tokens or 0},
+        )
+        return self._process_output(agent_run.result.output, observer)
+
+    @contextmanager
+    def _validation_failures(self, observer: IAgentObserver) -> Iterator[None]:
+        """Signale l'échec final de validation de la sortie typée (tentatives épuisées)"""
+        try:
+            yield
+        except UnexpectedModelBehavior:
+            if self.output_model is not None:
+                observer.on_parse_failure()
+            raise
+
+    @staticmethod
+    def _end_model_span(span: Span, usage_before: Tuple[int, int], usage: Usage) -> None:
+        span.attributes["gen_ai.usage.input_tokens"] = (usage.request_tokens or 0) - usage_before[0]
+        span.attributes["gen_ai.usage.output_tokens"] = (usage.response_tokens or 0) - usage_before[1]
+        span.end()
+
+    async def _stream_model_request(self, node, agent_run, observer: IAgentObserver) -> None:
+        """Relaie les fragments de texte de la réponse du modèle au fil de l'eau.
+
+        Pour une sortie structurée, les champs de premier niveau sont aussi signalés dès qu'ils
+        sont complets (texte JSON, ou arguments de l'outil de sortie pour une sortie typée).
+        """
+        stream_tokens = observer.stream_tokens
+        parser = PartialJsonObject() if observer.partial_output and self._is_structured() else None
+        # Index des parts de la réponse qui portent la sortie analysée
+        output_parts = set()
+        tool_names = {tool.name for tool in self.tools}
+
+        async with node.stream(agent_run.ctx) as request_stream:
+            async for event in request_stream:
+                text = output = None
+                if isinstance(event, PartStartEvent):
+                    part = event.part
+                    if isinstance(part, TextPart):
+                        text = part.content
+                    elif isinstance(part, ToolCallPart) and part.tool_name not in tool_names:
+                        output_parts.add(event.index)
+                        output = part.args
+                elif isinstance(event, PartDeltaEvent):
+                    delta = event.delta
+                    if isinstance(delta, TextPartDelta):
+                        text = delta.content_delta
+                    elif isinstance(delta, ToolCallPartDelta) and event.index in output_parts:
+                        output = delta.args_delta
+
+                if text and stream_tokens:
+                    observer.on_token(text)
+                if parser is None:
+                    continue
+                if self.output_model is None:
+                    output = text
+                if isinstance(output, dict):
+                    # Arguments déjà décodés par le fournisseur : tous les champs sont complets
+                    observer.on_partial_output(output)
+                elif output and parser.feed(output):
+                    observer.on_partial_output(parser.fields)
+
+    def _build_prompt(self, input_data: Any) -> str:
         # Préparer le prompt avec les données d'entrée
         if isinstance(input_data, dict):
-            prompt = f"Input data: {json.dumps(input_data, indent=2)}"
-        else:
-            prompt = f"Input: {input_data}"
+            return f"Input data: {compact_json(input_data)}"
+        return f"Input: {input_data}"
 
-        result = await self.agent.run(prompt)
+    def _process_output(self, output: Any, observer: Optional[IAgentObserver] = None) -> Any:
+        # Sortie typée déjà validée : transmise telle quelle (en dict) au routage
+        if isinstance(output, BaseModel):
+            return output.model_dump()
 
         # Essayer de parser la réponse comme JSON si c'est un agent de décision
         if self._is_decision_agent():
             try:
-                return self._parse_structured_response(str(result.data))
+                return self._parse_structured_response(str(output), observer)
             except Exception as e:
-                print(f"   [PydanticAgent] ⚠️ Erreur de parsing JSON pour {self.name}: {e}")
-                return {"error": "parsing_failed", "raw_response": str(result.data)}
+                logger.warning("   [PydanticAgent] ⚠️ Erreur de parsing JSON pour %s: %s", self.name, e)
+                if observer is not None:
+                    observer.on_parse_failure()
+                return {"error": "parsing_failed", "raw_response": str(output)}
 
-        return result.data
+        return output
 
     def set_tools(self, tools: List[Tool]) -> None:
         """Met à jour les outils et recrée l'agent"""
@@ -41,45 +224,65 @@ class PydanticAgent(IAgent):
 
     def _create_agent(self):
         """Crée l'agent Pydantic AI avec les outils"""
-        agent_kwargs = {"model": self.config.get("model", "openai:gpt-4o-mini"), "system_prompt": self.config.get("system_prompt", "")}
+        model = self.config.get("model", "openai:gpt-4o-mini")
+        if self.cassette is not None and not self.cassette.recording:
+            # Rejeu : le modèle réel n'est pas construit (ni réseau ni clé d'API)
+            model = self.cassette.wrap(model)
+        else:
+            name = model_key(model)
+            if SimulatedModel.handles(model):
+                model = SimulatedModel.from_config(model, self.config.get("simulation"))
+            elif self.http_clients is not None:
+                model = build_model(model, self.http_clients)
+            if self.cassette is not None:
+                model = self.cassette.wrap(model, name)
+        agent_kwargs = {"model": model, "system_prompt": self.config.get("system_prompt", "")}
+        if self.output_model is not None:
+            agent_kwargs["output_type"] = self.output_model
+            agent_kwargs["output_retries"] = self.output_retries
 
         # Ajouter les outils si disponibles
         if self.tools:
             agent_kwargs["tools"] = self.tools
-            print(
-                f"   [PydanticAgent] 🔧 Agent {self.name} configuré avec {len(self.tools)} outils: {[tool.function.__name__ for tool in self.tools]}"
+            logger.debug(
+                "   [PydanticAgent] 🔧 Agent %s configuré avec %d outils: %s", self.name, len(self.tools), [tool.name for tool in self.tools]
             )
 
         self.agent = Agent(**agent_kwargs)
 
+    def _is_structured(self) -> bool:
+        """La sortie est un objet : typée, ou JSON extrait de la réponse d'un agent de décision"""
+        return self.output_model is not None or self._is_decision_agent()
+
     def _is_decision_agent(self) -> bool:
         return "decision" in self.config.get("node_type", "") or "reviewer" in self.name.lower() or "tester" in self.name.lower()
 
-    def _parse_structured_response(self, response: str) -> Dict[str, Any]:
+    def _parse_structured_response(self, response: str, observer: Optional[IAgentObserver] = None) -> Dict[str, Any]:
         # Nettoyer la réponse pour extraire le JSON
         cleaned_response = re.sub(r"\n\s*", " ", response)
 
-        # Chercher un JSON dans la réponse
-        json_match = re.search(r"\{[^{}]*\}", cleaned_response)
-        if json_match:
-            json_str = json_match.group()
-            try:
-                json_str = re.sub(r'",\s*"', '", "', json_str)
-                parsed = json.loads(json_str)
-                return parsed
-            except json.JSONDecodeError:
-                pass
+        # Chercher un objet JSON dans la réponse (éventuellement entouré de texte)
+        parsed = _first_json_object(cleaned_response)
+        if parsed is not None:
+            return parsed
 
         # Fallback: essayer de parser la réponse complète
         try:
             return json.loads(cleaned_response)
         except Exception as e:
-            print(f"   [PydanticAgent] ⚠️ Erreur de parsing JSON: {e}")
+            logger.warning("   [PydanticAgent] ⚠️ Erreur de parsing JSON: %s", e)
+            if observer is not None:
+                observer.on_parse_failure()
             # Si ça échoue, créer une structure par défaut
             if "approved" in response.lower():
                 approved = "true" in response.lower() or '"approved": true' in response.lower()
                 return {"approved": approved, "feedback": response, "final_review": False}
             return {"status": "unknown", "response": response}
 
+    @property
+    def model_name(self) -> str:
+        model = self.config.get("model", "openai:gpt-4o-mini")
+        return model if isinstance(model, str) else getattr(model, "model_name", str(model))
+
     def get_name(self) -> str:
         return self.name
@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Mapping, Optional
+
+from ...core.token_counter import TokenCounter
+from ...domain.interfaces.i_agent import IAgent
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ..resilience.rate_limiter import RateLimiter
+
+# Observateur sans effet : ni tokens ni sortie partielle demandés
+_SILENT_OBSERVER = IAgentObserver()
+
+
+class _UsageObserver(IAgentObserver):
+    """Relaie les événements à l'observateur du nœud en retenant la consommation réelle de l'appel"""
+
+    __slots__ = ("observer", "usage")
+
+    def __init__(self, observer: IAgentObserver):
+        self.observer = observer
+        self.usage: Optional[Mapping[str, int]] = None
+
+    @property
+    def stream_tokens(self) -> bool:
+        return self.observer.stream_tokens
+
+    @property
+    def partial_output(self) -> bool:
+        return self.observer.partial_output
+
+    def on_partial_output(self, fields: Mapping[str, Any]) -> None:
+        self.observer.on_partial_output(fields)
+
+    def on_token(self, delta: str) -> None:
+        self.observer.on_token(delta)
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        self.observer.on_tool_call(tool_name, args)
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        self.usage = usage
+        self.observer.on_agent_run(model_s, tools_s, usage)
+
+    def on_retry(self, error: BaseException) -> None:
+        self.observer.on_retry(error)
+
+    def on_parse_failure(self) -> None:
+        self.observer.on_parse_failure()
+
+
+class RateLimitedAgent(IAgent):
+    """Décorateur d'agent : chaque appel attend le quota RPM/TPM de son modèle avant de partir.
+
+    Les tokens sont estimés localement (prompt système, entrée et sortie attendue) puis, quand
+    l'agent rapporte sa consommation réelle, l'écart est reporté sur le quota.
+    """
+
+    def __init__(self, agent: IAgent, agent_config: Mapping[str, Any], limiter: RateLimiter):
+        self.agent = agent
+        self.limiter = limiter
+        self._fixed_tokens = TokenCounter.count(agent_config.get("system_prompt", "")) + limiter.output_tokens_estimate
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        # Sans observateur, l'agent ne rapporte sa consommation réelle qu'en passant par execute_stream
+        return await self.execute_stream(input_data, context, _SILENT_OBSERVER)
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        estimated_tokens = self._estimate(input_data)
+        await self.limiter.acquire(estimated_tokens)
+        usage_observer = _UsageObserver(observer)
+        try:
+            return await self.agent.execute_stream(input_data, context, usage_observer)
+        finally:
+            usage = usage_observer.usage
+            if usage is not None:
+                self.limiter.settle(
+                    estimated_tokens, usage.get("request_tokens", 0) + usage.get("response_tokens", 0), usage.get("requests", 1)
+                )
+
+    def _estimate(self, input_data: Any) -> int:
+        return self._fixed_tokens + TokenCounter.count_value(input_data)
+
+    def warm(self) -> None:
+        # Réserve le quota d'un appel à l'entrée encore inconnue (prompt système et sortie attendue)
+        self.limiter.prefetch(self._fixed_tokens)
+
+    def get_name(self) -> str:
+        return self.agent.get_name()
+
+    def set_tools(self, tools: List[Any]) -> None:
+        self.agent.set_tools(tools)
@@ -0,0 +1,214 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+
+from ...domain.interfaces.i_agent import IAgent
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ..logs.logger import get_logger
+from ..resilience.circuit_breaker import CircuitOpenError
+from ..resilience.hedge_policy import HedgePolicy
+from ..resilience.model_health import ModelHealthRegistry, model_key
+from ..resilience.retry_policy import RetryPolicy, is_retryable
+
+logger = get_logger(__name__)
+
+AgentCall = Callable[[IAgent, Optional[IAgentObserver]], Awaitable[Any]]
+
+_NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class _AttemptObserver(IAgentObserver):
+    """Observateur d'une tentative : tokens, sortie partielle et appels d'outils sont retenus jusqu'à
+    ce que la tentative l'emporte ; consommation, échecs de parsing et cascade sont relayés aussitôt"""
+
+    __slots__ = ("observer", "events")
+
+    def __init__(self, observer: IAgentObserver):
+        self.observer = observer
+        self.events: List[Callable[[], None]] = []
+
+    @property
+    def stream_tokens(self) -> bool:
+        return self.observer.stream_tokens
+
+    @property
+    def partial_output(self) -> bool:
+        return self.observer.partial_output
+
+    def on_token(self, delta: str) -> None:
+        self.events.append(partial(self.observer.on_token, delta))
+
+    def on_partial_output(self, fields: Mapping[str, Any]) -> None:
+        self.events.append(partial(self.observer.on_partial_output, dict(fields)))
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        self.events.append(partial(self.observer.on_tool_call, tool_name, args))
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        self.observer.on_agent_run(model_s, tools_s, usage)
+
+    def on_retry(self, error: BaseException) -> None:
+        self.observer.on_retry(error)
+
+    def on_parse_failure(self) -> None:
+        self.observer.on_parse_failure()
+
+    def on_cascade(self, model: str, outcome: str) -> None:
+        self.observer.on_cascade(model, outcome)
+
+    def commit(self) -> None:
+        """Tentative retenue : relaie son flux"""
+        for event in self.events:
+            event()
+        self.events.clear()
+
+
+class ResilientAgent(IAgent):
+    """Décorateur d'agent : nouvelles tentatives, requêtes dupliquées (hedging) et disjoncteur par modèle.
+
+    Si le circuit du modèle principal est ouvert, ou si ses tentatives sont épuisées sur une
+    erreur transitoire, l'appel bascule sur `fallback_model` lorsqu'il est configuré.
+
+    Quand plusieurs tentatives sont possibles, le flux (tokens, sortie partielle, appels d'outils)
+    d'une tentative n'est relayé qu'une fois celle-ci réussie : l'observateur ne reçoit que celui
+    de la tentative retenue. La consommation de toutes les tentatives lui est rapportée.
+    """
+
+    CONFIG_KEYS = ("retry", "hedge", "circuit_breaker", "fallback_model")
+
+    def __init__(
+        self,
+        agent: IAgent,
+        agent_config: Mapping[str, Any],
+        health: ModelHealthRegistry,
+        fallback_factory: Optional[Callable[[], IAgent]] = None,
+    ):
+        self.agent = agent
+        self.health = health
+        self.retry = RetryPolicy.from_config(agent_config.get("retry")) or _NO_RETRY
+        self.hedge = HedgePolicy.from_config(agent_config.get("hedge"))
+        self.breaker_config = agent_config.get("circuit_breaker")
+        self.model = model_key(agent_config.get("model", "openai:gpt-4o-mini"))
+        self.fallback_model = agent_config.get("fallback_model")
+        self._fallback_factory = fallback_factory
+        self._fallback: Optional[IAgent] = None
+        # Une seule tentative possible : le flux est relayé en direct
+        self._single_attempt = self.retry.max_attempts == 1 and self.hedge is None and fallback_factory is None
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self._call(lambda agent, observer: agent.execute(input_data, context), None)
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        return await self._call(lambda agent, observer: agent.execute_stream(input_data, context, observer), observer)
+
+    async def _call(self, call: AgentCall, observer: Optional[IAgentObserver]) -> Any:
+        try:
+            return await self._call_model(self.agent, self.model, call, observer)
+        except Exception as error:
+            if self._fallback_factory is None or not (isinstance(error, CircuitOpenError) or is_retryable(error)):
+                raise
+            logger.warning("   [ResilientAgent] ↪️ %s: bascule sur %s (%s)", self.get_name(), self.fallback_model, error)
+            self.health.count(self.model, "fallbacks")
+            if self._fallback is None:
+                self._fallback = self._fallback_factory()
+            return await self._call_model(self._fallback, model_key(self.fallback_model), call, observer)
+
+    async def _call_model(self, agent: IAgent, model: str, call: AgentCall, observer: Optional[IAgentObserver]) -> Any:
+        breaker = self.health.breaker(model, self.breaker_config) if self.breaker_config is not None else None
+        latencies = self.health.latencies(model)
+
+        for attempt in range(1, self.retry.max_attempts + 1):
+            if breaker is not None:
+                breaker.before_call()
+
+            started_at = time.perf_counter()
+            try:
+                result = await self._hedged(agent, model, call, observer)
+            except Exception as error:
+                retryable = is_retryable(error)
+                if breaker is not None:
+                    # Seules les erreurs transitoires du fournisseur comptent contre le modèle
+                    if retryable:
+                        breaker.record_failure()
+                    else:
+                        breaker.release()
+                if not retryable or attempt == self.retry.max_attempts:
+                    raise
+
+                delay = self.retry.delay(attempt)
+                logger.warning(
+                    "   [ResilientAgent] 🔁 %s: tentative %d échouée (%s), nouvel essai dans %.2fs", self.get_name(), attempt, error, delay
+                )
+                self.health.count(model, "retries")
+                if observer is not None:
+                    observer.on_retry(error)
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Annulation (timeout du nœud) : l'échec n'est pas imputable au modèle
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            if breaker is not None:
+                breaker.record_success()
+            latencies.record(time.perf_counter() - started_at)
+            return result
+
+    async def _hedged(self, agent: IAgent, model: str, call: AgentCall, observer: Optional[IAgentObserver]) -> Any:
+        """Relance la requête si la première n'a pas répondu après le délai de hedging ; la plus rapide l'emporte"""
+        delay = self.hedge.delay(self.health.latencies(model)) if self.hedge is not None else None
+        if delay is None:
+            if observer is None or self._single_attempt:
+                return await call(agent, observer)
+            attempt = _AttemptObserver(observer)
+            result = await call(agent, attempt)
+            attempt.commit()
+            return result
+
+        # Chaque requête a son observateur : seul le flux de la plus rapide est relayé
+        observers: Dict[asyncio.Task, Optional[_AttemptObserver]] = {}
+
+        def start() -> asyncio.Task:
+            attempt = _AttemptObserver(observer) if observer is not None else None
+            task = asyncio.create_task(call(agent, attempt))
+            observers[task] = attempt
+            return task
+
+        primary = start()
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                self.health.count(model, "hedges")
+                tasks.add(start())
+
+            error: Optional[BaseException] = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.health.count(model, "hedge_wins")
+                        if observers[task] is not None:
+                            observers[task].commit()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def get_name(self) -> str:
+        return self.agent.get_name()
+
+    def warm(self) -> None:
+        self.agent.warm()
+
+    def set_tools(self, tools: List[Any]) -> None:
+        self.agent.set_tools(tools)
+        if self._fallback is not None:
+            self._fallback.set_tools(tools)
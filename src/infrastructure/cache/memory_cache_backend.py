@@ -0,0 +1,47 @@
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from ...domain.interfaces.i_cache_backend import ICacheBackend
+
+
+class MemoryCacheBackend(ICacheBackend):
+    """Cache LRU en mémoire avec expiration (TTL) et nombre maximal d'entrées.
+
+    Les valeurs sont copiées à l'écriture et à la lecture : un appelant qui modifie le résultat
+    reçu ne modifie ni l'entrée du cache ni les résultats des autres exécutions.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_s: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.evictions = 0
+        # clé -> (date d'expiration monotone ou None, valeur)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, copy.deepcopy(value)
+
+    async def set(self, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        ttl_s = ttl_s if ttl_s is not None else self.ttl_s
+        expires_at = time.monotonic() + ttl_s if ttl_s is not None else None
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
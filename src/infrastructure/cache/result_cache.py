@@ -0,0 +1,105 @@
+import asyncio
+import copy
+import hashlib
+import json
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ...domain.interfaces.i_cache_backend import ICacheBackend
+from .memory_cache_backend import MemoryCacheBackend
+
+
+@dataclass(slots=True)
+class _Flight:
+    """Calcul partagé d'une clé, et nombre d'appelants qui l'attendent"""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class ResultCache:
+    """Cache des résultats d'agents avec déduplication des appels simultanés (single-flight).
+
+    Des appels concurrents sur la même clé partagent une seule exécution : seul le premier
+    interroge le fournisseur, les suivants attendent son résultat et en reçoivent une copie.
+    Le calcul partagé est annulé dès que plus aucun appelant ne l'attend (timeout, deadline).
+    """
+
+    def __init__(self, backend: Optional[ICacheBackend] = None):
+        self.backend = backend or MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._in_flight: Dict[str, _Flight] = {}
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        serialized = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]], ttl_s: Optional[float] = None) -> Any:
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            return await self._join(key, flight)
+
+        found, value = await self.backend.get(key)
+        if found:
+            self.hits += 1
+            return value
+
+        # Un appel identique a pu démarrer pendant la lecture du backend
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            return await self._join(key, flight)
+
+        self.misses += 1
+        flight = _Flight(asyncio.ensure_future(self._compute_and_store(key, compute, ttl_s)))
+        self._in_flight[key] = flight
+        flight.task.add_done_callback(partial(self._landed, key, flight))
+        return await self._wait(key, flight)
+
+    async def _join(self, key: str, flight: _Flight) -> Any:
+        # Le résultat partagé est aussi celui du premier appelant : chacun reçoit sa copie
+        self.coalesced += 1
+        return copy.deepcopy(await self._wait(key, flight))
+
+    async def _wait(self, key: str, flight: _Flight) -> Any:
+        """Attend le calcul partagé ; l'annulation d'un appelant ne l'interrompt que s'il était le dernier"""
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Plus personne n'attend : l'appel au fournisseur (et son quota) est abandonné
+                flight.task.cancel()
+                self._forget(key, flight)
+
+    def _landed(self, key: str, flight: _Flight, task: asyncio.Task) -> None:
+        self._forget(key, flight)
+        if not task.cancelled():
+            # Erreur récupérée même si tous les appelants sont partis
+            task.exception()
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    async def _compute_and_store(self, key: str, compute: Callable[[], Awaitable[Any]], ttl_s: Optional[float]) -> Any:
+        value = await compute()
+        await self.backend.set(key, value, ttl_s)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "evictions": getattr(self.backend, "evictions", 0),
+        }
+
+    async def close(self) -> None:
+        await self.backend.close()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+from ...domain.interfaces.i_cache_backend import ICacheBackend
+
+
+class SQLiteCacheBackend(ICacheBackend):
+    """Cache persistant dans une base SQLite locale.
+
+    Les valeurs sont sérialisées en JSON. Les entrées expirées sont ignorées à la lecture,
+    et les moins récemment utilisées sont supprimées au-delà de `max_entries`.
+    """
+
+    def __init__(self, path: str = "llm_cache.db", max_entries: int = 100_000, ttl_s: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_last_access ON cache (last_access)")
+            (self._count,) = self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()
+
+    async def get(self, key: str) -> Tuple[bool, Any]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        ttl_s = ttl_s if ttl_s is not None else self.ttl_s
+        await asyncio.to_thread(self._set, key, json.dumps(value, ensure_ascii=False, default=str), ttl_s)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: str) -> Tuple[bool, Any]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False, None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._count -= 1
+                return False, None
+            self._connection.execute("UPDATE cache SET last_access = ? WHERE key = ?", (now, key))
+        return True, json.loads(value)
+
+    def _set(self, key: str, value: str, ttl_s: Optional[float]) -> None:
+        now = time.time()
+        expires_at = now + ttl_s if ttl_s is not None else None
+        with self._lock, self._connection:
+            exists = self._connection.execute("SELECT 1 FROM cache WHERE key = ?", (key,)).fetchone() is not None
+            self._connection.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", (key, value, expires_at, now))
+            if not exists:
+                self._count += 1
+            overflow = self._count - self.max_entries
+            if overflow > 0:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY last_access LIMIT ?)", (overflow,)
+                )
+                self._count -= overflow
+                self.evictions += overflow
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import time
+import zlib
+from abc import abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from ...domain.entities.workflow_checkpoint import WorkflowCheckpoint
+from ...domain.interfaces.i_checkpoint_store import ICheckpointStore
+
+_RAW = b"j"
+_COMPRESSED = b"z"
+
+
+class BufferedCheckpointStore(ICheckpointStore):
+    """Base des stores de checkpoints : regroupement des écritures et compression.
+
+    Seul le dernier checkpoint de chaque exécution est conservé en mémoire jusqu'à
+    l'écriture, déclenchée dès que `batch_size` checkpoints sont en attente ou que
+    `flush_interval_s` est écoulé. Avec `batch_size=1`, chaque checkpoint est écrit
+    immédiatement ; au-delà, un crash peut faire perdre les derniers checkpoints.
+
+    Les checkpoints incrémentaux (nouvelles étapes seulement) sont fusionnés avec ceux en
+    attente, puis ajoutés à la suite du checkpoint enregistré ; celui d'une exécution terminée
+    est réécrit en un checkpoint complet.
+    """
+
+    def __init__(self, batch_size: int = 1, flush_interval_s: Optional[float] = None, compress: bool = False):
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.compress = compress
+        self._pending: Dict[str, WorkflowCheckpoint] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._write_lock = asyncio.Lock()
+
+    async def save(self, checkpoint: WorkflowCheckpoint) -> None:
+        pending = self._pending.get(checkpoint.run_id)
+        self._pending[checkpoint.run_id] = pending.merge(checkpoint) if pending is not None else checkpoint
+        self._pending_count += 1
+
+        interval_elapsed = self.flush_interval_s is not None and time.monotonic() - self._last_flush >= self.flush_interval_s
+        if self._pending_count >= self.batch_size or interval_elapsed:
+            await self.flush()
+
+    async def load(self, run_id: str) -> Optional[WorkflowCheckpoint]:
+        pending = self._pending.get(run_id)
+        if pending is not None and not pending.history_delta:
+            return pending
+
+        # Sous le verrou d'écriture : un lot en cours d'écriture n'est ni dans `_pending` ni encore
+        # enregistré, il serait manqué
+        async with self._write_lock:
+            checkpoint = await asyncio.to_thread(self._load_saved, run_id)
+            pending = self._pending.get(run_id)
+        if pending is not None:
+            return checkpoint.merge(pending) if checkpoint is not None else pending
+        return checkpoint
+
+    def _load_saved(self, run_id: str) -> Optional[WorkflowCheckpoint]:
+        """Checkpoint enregistré, incréments appliqués"""
+        checkpoint = None
+        for payload in self._read(run_id):
+            decoded = self._decode(payload)
+            checkpoint = checkpoint.merge(decoded) if checkpoint is not None else decoded
+        return checkpoint
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        async with self._write_lock:
+            # Le lot est retiré de `_pending` une fois le verrou pris : un chargement concurrent
+            # le trouve en attente, ou enregistré
+            if not self._pending:
+                return
+            pending, self._pending, self._pending_count = self._pending, {}, 0
+            self._last_flush = time.monotonic()
+            await asyncio.to_thread(self._encode_and_write, pending)
+
+    def _encode_and_write(self, pending: Dict[str, WorkflowCheckpoint]) -> None:
+        for run_id, checkpoint in pending.items():
+            if checkpoint.completed and checkpoint.history_delta:
+                # Exécution terminée : un seul checkpoint complet remplace les incréments
+                saved = self._load_saved(run_id)
+                if saved is not None:
+                    pending[run_id] = saved.merge(checkpoint)
+        self._write_many({run_id: (checkpoint, self._encode(checkpoint)) for run_id, checkpoint in pending.items()})
+
+    def _encode(self, checkpoint: WorkflowCheckpoint) -> bytes:
+        data = json.dumps(checkpoint.model_dump(), ensure_ascii=False, default=str).encode("utf-8")
+        if self.compress:
+            return _COMPRESSED + zlib.compress(data)
+        return _RAW + data
+
+    @staticmethod
+    def _decode(payload: bytes) -> WorkflowCheckpoint:
+        marker, data = payload[:1], payload[1:]
+        if marker == _COMPRESSED:
+            data = zlib.decompress(data)
+        return WorkflowCheckpoint(**json.loads(data))
+
+    @abstractmethod
+    def _write_many(self, records: Dict[str, Tuple[WorkflowCheckpoint, bytes]]) -> None:
+        """Écrit les checkpoints encodés (appelé hors de la boucle d'événements) : un checkpoint complet
+        remplace ceux de l'exécution, un incrément (`history_delta`) s'ajoute à leur suite"""
+
+    @abstractmethod
+    def _read(self, run_id: str) -> List[bytes]:
+        """Lit les checkpoints encodés d'une exécution, le complet puis ses incréments (appelé hors de la boucle d'événements)"""
@@ -0,0 +1,59 @@
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ...domain.entities.workflow_checkpoint import WorkflowCheckpoint
+from .buffered_checkpoint_store import BufferedCheckpointStore
+
+# Longueur de chaque incrément dans le fichier d'incréments
+_LENGTH = struct.Struct(">I")
+
+
+class FileCheckpointStore(BufferedCheckpointStore):
+    """Checkpoints stockés dans un répertoire local : un fichier par exécution, et un fichier
+    d'incréments en ajout seul pour les checkpoints incrémentaux"""
+
+    def __init__(self, directory: str = ".checkpoints", **kwargs):
+        super().__init__(**kwargs)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _write_many(self, records: Dict[str, Tuple[WorkflowCheckpoint, bytes]]) -> None:
+        for run_id, (checkpoint, payload) in records.items():
+            if checkpoint.history_delta:
+                with open(self._deltas_path(run_id), "ab") as deltas_file:
+                    deltas_file.write(_LENGTH.pack(len(payload)) + payload)
+                continue
+            path = self._path(run_id)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(payload)
+            # Remplacement atomique : un crash ne laisse jamais un checkpoint tronqué
+            os.replace(tmp_path, path)
+            # Incréments éventuellement restés après un crash : ignorés au chargement (antérieurs)
+            self._deltas_path(run_id).unlink(missing_ok=True)
+
+    def _read(self, run_id: str) -> List[bytes]:
+        path = self._path(run_id)
+        if not path.exists():
+            return []
+        payloads = [path.read_bytes()]
+        deltas_path = self._deltas_path(run_id)
+        if deltas_path.exists():
+            data = deltas_path.read_bytes()
+            position = 0
+            # Un incrément tronqué (crash pendant l'écriture) est ignoré
+            while position + _LENGTH.size <= len(data):
+                (length,) = _LENGTH.unpack_from(data, position)
+                position += _LENGTH.size
+                if position + length > len(data):
+                    break
+                payloads.append(data[position : position + length])
+                position += length
+        return payloads
+
+    def _path(self, run_id: str) -> Path:
+        return self.directory / f"{run_id}.checkpoint"
+
+    def _deltas_path(self, run_id: str) -> Path:
+        return self.directory / f"{run_id}.deltas"
@@ -0,0 +1,62 @@
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+
+from ...domain.entities.workflow_checkpoint import WorkflowCheckpoint
+from .buffered_checkpoint_store import BufferedCheckpointStore
+
+
+class SQLiteCheckpointStore(BufferedCheckpointStore):
+    """Checkpoints stockés dans une base SQLite locale (une ligne par exécution, plus ses incréments)"""
+
+    def __init__(self, path: str = "checkpoints.db", **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS checkpoints (
+                    run_id TEXT PRIMARY KEY,
+                    workflow_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                )"""
+            )
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS checkpoint_deltas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                )"""
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS checkpoint_deltas_run ON checkpoint_deltas (run_id, id)")
+
+    def _write_many(self, records: Dict[str, Tuple[WorkflowCheckpoint, bytes]]) -> None:
+        rows, deltas = [], []
+        for run_id, (checkpoint, payload) in records.items():
+            if checkpoint.history_delta:
+                deltas.append((run_id, checkpoint.status, checkpoint.updated_at, payload))
+            else:
+                rows.append((run_id, checkpoint.workflow_name, checkpoint.status, checkpoint.updated_at, payload))
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?)", rows)
+            self._connection.executemany("DELETE FROM checkpoint_deltas WHERE run_id = ?", [(row[0],) for row in rows])
+            self._connection.executemany("INSERT INTO checkpoint_deltas (run_id, payload) VALUES (?, ?)", [(delta[0], delta[3]) for delta in deltas])
+            self._connection.executemany(
+                "UPDATE checkpoints SET status = ?, updated_at = ? WHERE run_id = ?", [(delta[1], delta[2], delta[0]) for delta in deltas]
+            )
+
+    def _read(self, run_id: str) -> List[bytes]:
+        with self._lock:
+            row = self._connection.execute("SELECT payload FROM checkpoints WHERE run_id = ?", (run_id,)).fetchone()
+            if row is None:
+                return []
+            deltas = self._connection.execute("SELECT payload FROM checkpoint_deltas WHERE run_id = ? ORDER BY id", (run_id,)).fetchall()
+        return [row[0]] + [delta[0] for delta in deltas]
+
+    async def close(self) -> None:
+        await super().close()
+        with self._lock:
+            self._connection.close()
@@ -18,7 +18,14 @@ class WorkflowConverter(IWorkflowConverter):
         edges = [WorkflowEdge(**edge) for edge in json_data["edges"]]
 
         return WorkflowDefinition(
-            name=json_data["name"], description=json_data["description"], nodes=nodes, edges=edges, start_node=json_data["start_node"]
+            name=json_data["name"],
+            description=json_data["description"],
+            nodes=nodes,
+            edges=edges,
+            start_node=json_data["start_node"],
+            timeout_s=json_data.get("timeout_s"),
+            max_total_iterations=json_data.get("max_total_iterations"),
+            priority=json_data.get("priority", 0),
         )
 
     def workflow_to_pydantic_graph(self, workflow: WorkflowDefinition) -> Graph:
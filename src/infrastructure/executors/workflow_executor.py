@@ -1,132 +1,660 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager, nullcontext
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Union
 
+from ...core.branch_merger import BranchMerger
+from ...core.compiled_workflow import CompiledEdge, CompiledNode, CompiledWorkflow
 from ...core.condition_evaluator import ConditionEvaluator
+from ...core.context_builder import ContextBuilder
+from ...core.data_path import DataPath
+from ...core.execution_events import EdgeTaken, ExecutionEvent, NodeFinished, NodeStarted, RunFinished, TokenDelta, ToolCalled
+from ...core.middleware_chain import MiddlewareChain
+from ...core.run_context import IterationScope, RunContext, run_scope
+from ...core.run_limits import ItemLimitExceeded, NodeTimeout, RunDeadlineExceeded, RunLimitExceeded
+from ...domain.entities.workflow_checkpoint import WorkflowCheckpoint
 from ...domain.entities.workflow_definition import WorkflowDefinition
 from ...domain.entities.workflow_node import NodeType
+from ...domain.interfaces.i_agent_observer import IAgentObserver
+from ...domain.interfaces.i_checkpoint_store import ICheckpointStore
+from ...domain.interfaces.i_history_store import IHistoryStore
 from ...domain.interfaces.i_workflow_executor import IWorkflowExecutor
 from ...infrastructure.factories.agent_factory import AgentFactory
+from ...infrastructure.history.memory_history_store import MemoryHistoryStore
+from ...infrastructure.logs.log_context import bind
+from ...infrastructure.logs.logger import get_logger
+from ...infrastructure.metrics.workflow_metrics import WorkflowMetrics
+from ...infrastructure.resilience.rate_limiter import rate_limit_scope
+from ...infrastructure.tracing.span import Span, current_span
+from ...infrastructure.tracing.tracer import Tracer
+
+logger = get_logger(__name__)
+
+# Contexte réutilisable quand le tracing est désactivé
+_NO_SPAN = nullcontext()
+
+
+class _EarlyRouter:
+    """Choisit l'edge sortant d'un nœud de décision à partir des champs déjà reçus de sa sortie.
+
+    Les conditions sont évaluées dans l'ordre des edges, chacune dès que les champs dont elle
+    dépend sont reçus (ou absents du schéma de sortie). Le choix n'est fait qu'une fois.
+    """
+
+    __slots__ = ("node", "context", "known_fields", "edge", "decided")
+
+    def __init__(self, node: CompiledNode, context: Dict[str, Any]):
+        self.node = node
+        self.context = context
+        schema = node.agent_config.get("output_schema")
+        # Sans schéma, un champ non reçu peut encore arriver
+        self.known_fields: Optional[FrozenSet[str]] = frozenset(schema["properties"]) if schema else None
+        self.edge: Optional[CompiledEdge] = None
+        self.decided = False
+
+    def update(self, fields: Mapping[str, Any]) -> bool:
+        """Retourne True quand l'edge vient d'être choisi"""
+        if self.decided:
+            return False
+        for edge in self.node.conditional_edges:
+            for field in ConditionEvaluator.fields(edge.condition):
+                if field not in fields and (self.known_fields is None or field in self.known_fields):
+                    return False
+            if ConditionEvaluator.evaluate(edge.condition, dict(fields), self.context, logger):
+                self.edge = edge
+                break
+        else:
+            self.edge = self.node.default_edge
+        self.decided = True
+        return True
+
+
+class _NodeObserver(IAgentObserver):
+    """Convertit les événements d'un agent en événements d'exécution et en métriques du nœud courant"""
+
+    __slots__ = ("run", "node_id", "branch", "metrics", "span", "router", "on_route")
+
+    def __init__(
+        self,
+        run: RunContext,
+        node_id: str,
+        branch: Optional[str],
+        metrics: Optional[WorkflowMetrics] = None,
+        router: Optional[_EarlyRouter] = None,
+        on_route: Optional[Callable[[RunContext, CompiledEdge], None]] = None,
+    ):
+        self.run = run
+        self.node_id = node_id
+        self.branch = branch
+        self.metrics = metrics
+        self.span: Optional[Span] = current_span()
+        self.router = router
+        self.on_route = on_route
+
+    @property
+    def stream_tokens(self) -> bool:
+        return self.run.stream_tokens
+
+    @property
+    def partial_output(self) -> bool:
+        return self.router is not None
+
+    def on_partial_output(self, fields: Mapping[str, Any]) -> None:
+        if not self.router.update(fields) or self.router.edge is None:
+            return
+        to_node = self.router.edge.to_node
+        if self.metrics is not None:
+            self.metrics.early_route(self.run.workflow.name, self.node_id, to_node)
+        if self.span is not None:
+            self.span.add_event("early_route", {"to": to_node, "fields": len(fields)})
+        self.run.early_routes[(self.branch, self.node_id)] = self.router.edge
+        self.on_route(self.run, self.router.edge)
+
+    def on_token(self, delta: str) -> None:
+        self.run.emit(TokenDelta(run_id=self.run.run_id, branch=self.branch, node_id=self.node_id, delta=delta))
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        self.run.emit(ToolCalled(run_id=self.run.run_id, branch=self.branch, node_id=self.node_id, tool_name=tool_name, args=args))
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        if self.metrics is not None:
+            self.metrics.agent_run(self.run.workflow.name, self.node_id, model_s, tools_s, usage)
+        if self.span is not None:
+            # Cumulé sur les appels d'agent du nœud (nouvelles tentatives, repli)
+            attributes = self.span.attributes
+            attributes["gen_ai.usage.input_tokens"] = attributes.get("gen_ai.usage.input_tokens", 0) + usage["request_tokens"]
+            attributes["gen_ai.usage.output_tokens"] = attributes.get("gen_ai.usage.output_tokens", 0) + usage["response_tokens"]
+
+    def on_retry(self, error: BaseException) -> None:
+        if self.metrics is not None:
+            self.metrics.retry(self.run.workflow.name, self.node_id)
+        if self.span is not None:
+            self.span.add_event("retry", {"error": f"{type(error).__name__}: {error}"})
+
+    def on_parse_failure(self) -> None:
+        if self.metrics is not None:
+            self.metrics.parse_failure(self.run.workflow.name, self.node_id)
+        if self.span is not None:
+            self.span.add_event("parse_failure")
+
+    def on_cascade(self, model: str, outcome: str) -> None:
+        if self.metrics is not None:
+            self.metrics.cascade(self.run.workflow.name, self.node_id, model, outcome)
+        if self.span is not None:
+            self.span.add_event("cascade", {"model": model, "outcome": outcome})
 
 
 class WorkflowExecutor(IWorkflowExecutor):
-    def __init__(self, agent_factory: AgentFactory):
+    """Exécuteur sans état : tout l'état d'une exécution vit dans un RunContext"""
+
+    max_total_iterations = 20  # Sécurité contre les boucles infinies, surchargeable par workflow
+
+    def __init__(
+        self,
+        agent_factory: AgentFactory,
+        checkpoint_store: Optional[ICheckpointStore] = None,
+        history_store: Optional[IHistoryStore] = None,
+        metrics: Optional[WorkflowMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        middleware: Optional[MiddlewareChain] = None,
+        early_routing: bool = False,
+    ):
         self.agent_factory = agent_factory
-        self.execution_history: List[Dict[str, Any]] = []
-        self.node_iterations: Dict[str, int] = {}
+        self.checkpoint_store = checkpoint_store
+        self.history_store = history_store or MemoryHistoryStore()
+        self.metrics = metrics
+        self.tracer = tracer
+        self.middleware = middleware if middleware is not None else MiddlewareChain()
         self.condition_evaluator = ConditionEvaluator()
+        # Routage anticipé : le nœud suivant est préparé pendant le streaming de la décision
+        self.early_routing = early_routing
+
+    async def execute(
+        self, workflow: Union[WorkflowDefinition, CompiledWorkflow], initial_data: Any, timeout_s: Optional[float] = None
+    ) -> Dict[str, Any]:
+        async for event in self.execute_stream(workflow, initial_data, stream_tokens=False, timeout_s=timeout_s):
+            if isinstance(event, RunFinished):
+                return event.result
+
+    async def execute_stream(
+        self,
+        workflow: Union[WorkflowDefinition, CompiledWorkflow],
+        initial_data: Any,
+        stream_tokens: bool = True,
+        timeout_s: Optional[float] = None,
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Exécute le workflow en émettant les événements au fur et à mesure.
+
+        Le dernier événement est toujours RunFinished, qui porte le résultat complet.
+        `timeout_s` remplace le budget de temps global déclaré par le workflow.
+        """
+        if isinstance(workflow, WorkflowDefinition):
+            workflow = CompiledWorkflow.from_definition(workflow)
+
+        events: asyncio.Queue = asyncio.Queue()
+        run = RunContext(workflow, initial_data, emit=events.put_nowait, stream_tokens=stream_tokens, timeout_s=timeout_s or workflow.timeout_s)
+        run.execution_history = self.history_store.open(run.run_id)
+        async for event in self._stream_run(run, events, workflow.start_node, initial_data):
+            yield event
+
+    async def resume(self, workflow: CompiledWorkflow, checkpoint: WorkflowCheckpoint, timeout_s: Optional[float] = None) -> Dict[str, Any]:
+        async for event in self.resume_stream(workflow, checkpoint, stream_tokens=False, timeout_s=timeout_s):
+            if isinstance(event, RunFinished):
+                return event.result
+
+    async def resume_stream(
+        self, workflow: CompiledWorkflow, checkpoint: WorkflowCheckpoint, stream_tokens: bool = True, timeout_s: Optional[float] = None
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Reprend une exécution après le dernier nœud terminé, sans ré-exécuter les agents précédents"""
+        events: asyncio.Queue = asyncio.Queue()
+        run = RunContext.from_checkpoint(
+            workflow,
+            checkpoint,
+            execution_history=self.history_store.open(checkpoint.run_id),
+            emit=events.put_nowait,
+            stream_tokens=stream_tokens,
+            timeout_s=timeout_s or workflow.timeout_s,
+        )
+        async for event in self._stream_run(run, events, checkpoint.next_node_id, checkpoint.current_data):
+            yield event
+
+    async def _stream_run(self, run: RunContext, events: asyncio.Queue, start_node_id: Optional[str], data: Any) -> AsyncIterator[ExecutionEvent]:
+        run_task = asyncio.create_task(self._run(run, start_node_id, data))
+        run_task.add_done_callback(lambda _: events.put_nowait(None))
+
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            # Propager une éventuelle erreur de l'exécution
+            run_task.result()
+        finally:
+            if not run_task.done():
+                run_task.cancel()
+
+    async def _run(self, run: RunContext, start_node_id: Optional[str], data: Any) -> None:
+        started_at = time.perf_counter()
+        hooks = self.middleware
+        with (
+            bind(run_id=run.run_id),
+            run_scope(run.run_id),
+            rate_limit_scope(run.workflow.name, run.workflow.priority, run.run_id),
+            self._span("workflow.run", {"workflow.name": run.workflow.name, "workflow.run_id": run.run_id}) as span,
+        ):
+            try:
+                if hooks.before_run is not None:
+                    await hooks.before_run(run)
+                final_data, _ = await self._run_path(run, start_node_id, data)
+            except BaseException as error:
+                # Annulation comprise : les middlewares peuvent libérer leurs ressources
+                outcome = "cancelled" if isinstance(error, asyncio.CancelledError) else "error"
+                if self.metrics is not None:
+                    self.metrics.run_finished(run.workflow.name, time.perf_counter() - started_at, outcome)
+                if hooks.after_run is not None:
+                    await hooks.after_run(run, None, error)
+                raise
+            finally:
+                if self.early_routing:
+                    # Réservations anticipées non consommées (nœud préparé jamais exécuté)
+                    self.agent_factory.rate_limiter.release(run.run_id)
+            if self.metrics is not None:
+                self.metrics.run_finished(run.workflow.name, time.perf_counter() - started_at, run.stop_reason)
+            if span is not None:
+                span.set_attribute("workflow.stop_reason", run.stop_reason)
+                span.set_attribute("workflow.total_iterations", run.total_iterations)
+            # Après un timeout, le dernier checkpoint pointe encore sur le nœud interrompu : il reste reprenable
+            if run.stop_reason not in (NodeTimeout.reason, RunDeadlineExceeded.reason):
+                await self._save_checkpoint(run, None, final_data, status="completed")
 
-    async def execute(self, workflow: WorkflowDefinition, initial_data: Any) -> Dict[str, Any]:
-        current_node_id = workflow.start_node
-        current_data = initial_data
-        context = {"workflow_name": workflow.name, "history": [], "original_request": initial_data}
+        result = {
+            "run_id": run.run_id,
+            "final_result": final_data,
+            # Liste de dicts avec les données : le résultat reste indépendant du store d'historique
+            "execution_history": run.execution_history.to_list(),
+            "node_iterations": run.node_iterations,
+            "total_iterations": run.total_iterations,
+            "stop_reason": run.stop_reason,
+            "stopped_at": run.stopped_at,
+        }
+        if hooks.after_run is not None:
+            await hooks.after_run(run, result, None)
+        run.emit(RunFinished(run_id=run.run_id, result=result))
+
+    async def _run_path(
+        self, run: RunContext, start_node_id: str, data: Any, branch: Optional[str] = None, scope: Optional[IterationScope] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """Suit les edges à partir de start_node_id.
 
-        max_total_iterations = 20  # Sécurité contre les boucles infinies
+        Dans une branche parallèle, s'arrête avant le premier nœud sync rencontré et
+        retourne son identifiant avec la sortie de la branche. Les sous-chemins d'un élément
+        de map comptent leurs itérations dans leur propre `scope` ; y atteindre une limite
+        lève ItemLimitExceeded, un échec de l'élément.
+        Sur le chemin principal, un dépassement de timeout arrête l'exécution avec la
+        dernière sortie obtenue ; dans une branche, il remonte au chemin parent.
+        """
+        workflow = run.workflow
+        hooks = self.middleware
+        max_total_iterations = workflow.max_total_iterations or self.max_total_iterations
+        counters = run if scope is None else scope
+        current_node_id = start_node_id
+        current_data = data
+        joining = False
 
-        iteration_count = 0
-        while current_node_id and iteration_count < max_total_iterations:
-            iteration_count += 1
-            current_node = self._find_node(workflow, current_node_id)
+        while current_node_id and counters.total_iterations < max_total_iterations:
+            current_node = workflow.get_node(current_node_id)
             if not current_node:
-                print(f"❌ Nœud {current_node_id} non trouvé")
+                logger.error("❌ Nœud %s non trouvé", current_node_id)
                 break
 
+            # Fin de branche : la jointure est exécutée par le chemin parent
+            if branch is not None and current_node.type == NodeType.SYNC and not joining:
+                return current_data, current_node_id
+            joining = False
+
+            counters.total_iterations += 1
+
             # Vérifier les iterations max pour ce nœud spécifique
-            if self._should_stop_iteration(current_node, current_node_id):
-                print(f"⏹️ Max iterations atteint: {current_node.name}")
+            if self._should_stop_iteration(counters, current_node):
+                logger.info("⏹️ Max iterations atteint: %s", current_node.name, extra={"node_id": current_node_id})
                 # Pour le reviewer, on force la final_review
                 if current_node_id == "reviewer":
-                    context["force_final_review"] = True
+                    run.context["force_final_review"] = True
                 else:
+                    if scope is not None:
+                        raise ItemLimitExceeded("max_iterations", current_node_id, current_node.max_iterations)
+                    if branch is None:
+                        run.stop("max_iterations", current_node_id)
                     break
 
-            node_iteration = self.node_iterations.get(current_node_id, 0) + 1
-            print(f"🔄 {current_node.name} - Iteration {node_iteration}")
+            node_iteration = counters.get_iterations(current_node_id) + 1
+            logger.info("🔄 %s - Iteration %d", current_node.name, node_iteration, extra={"node_id": current_node_id, "iteration": node_iteration, "branch": branch})
+            run.emit(NodeStarted(run_id=run.run_id, branch=branch, node_id=current_node_id, node_name=current_node.name, iteration=node_iteration))
+            started_at = time.perf_counter()
 
-            # Exécuter le nœud
-            result = await self._execute_node(current_node, current_data, context)
+            next_edge: Optional[CompiledEdge] = None
+            with self._span("workflow.node", self._node_attributes(current_node, node_iteration, branch)) as span:
+                try:
+                    async with self._enforce_limits(run, current_node):
+                        if hooks.before_node is not None:
+                            current_data = await hooks.before_node(run, current_node, current_data)
 
-            # Enregistrer l'historique
-            self._record_execution(current_node_id, current_data, result)
+                        if current_node.type == NodeType.PARALLEL:
+                            # Lancer les branches puis enchaîner directement sur leur nœud sync
+                            counters.node_iterations[current_node_id] = node_iteration
+                            result, sync_node_id = await self._execute_parallel(run, current_node, current_data, scope)
+                            next_node_id = sync_node_id
+                            joining = True
+                        else:
+                            # Exécuter le nœud
+                            result = await self._execute_node(run, current_node, current_data, branch, scope)
 
-            # Déterminer le prochain nœud
-            next_node_id = self._determine_next_node(workflow, current_node_id, result, context)
+                        if hooks.after_node is not None:
+                            result = await hooks.after_node(run, current_node, current_data, result)
+
+                        if not joining:
+                            # Déterminer le prochain nœud
+                            next_edge = self._determine_next_edge(current_node, result, run.context)
+                            next_node_id = next_edge.to_node if next_edge else None
+                            if run.early_routes:
+                                predicted = run.early_routes.pop((branch, current_node_id), None)
+                                if predicted is not None and predicted.to_node != next_node_id:
+                                    # Routage anticipé démenti : le quota réservé pour le nœud préparé est rendu
+                                    self.agent_factory.rate_limiter.release(run.run_id)
+                except Exception as error:
+                    if self.metrics is not None:
+                        self.metrics.node_failed(workflow.name, current_node_id, error)
+                    if branch is not None or not isinstance(error, RunLimitExceeded):
+                        raise
+                    logger.warning("⏱️ %s interrompu: %s", current_node.name, error.reason, extra={"node_id": current_node_id})
+                    if span is not None:
+                        span.record_error(error)
+                    run.stop(error.reason, error.node_id)
+                    break
+                if span is not None and next_node_id:
+                    span.set_attribute("workflow.node.next", next_node_id)
+
+            # Enregistrer l'historique
+            duration_s = time.perf_counter() - started_at
+            self._record_execution(run, current_node_id, node_iteration, current_data, result, branch, duration_s)
+            if self.metrics is not None:
+                self.metrics.node_finished(workflow.name, current_node_id, duration_s)
+            run.emit(
+                NodeFinished(
+                    run_id=run.run_id,
+                    branch=branch,
+                    node_id=current_node_id,
+                    iteration=node_iteration,
+                    output=result,
+                    duration_s=duration_s,
+                )
+            )
 
             if next_node_id:
-                next_node = self._find_node(workflow, next_node_id)
-                next_node_name = next_node.name if next_node else next_node_id
-                print(f"   ➡️ {current_node.name} → {next_node_name}")
-            else:
-                print("   ✅ Workflow terminé")
+                next_node_name = workflow.nodes[next_node_id].name
+                logger.info("   ➡️ %s → %s", current_node.name, next_node_name, extra={"node_id": current_node_id, "next_node_id": next_node_id})
+                if next_edge is not None:
+                    run.emit(EdgeTaken(run_id=run.run_id, branch=branch, from_node=current_node_id, to_node=next_node_id, condition=next_edge.condition))
+                    if self.metrics is not None:
+                        self.metrics.edge_taken(workflow.name, current_node_id, next_node_id)
+                    if hooks.on_edge is not None:
+                        await hooks.on_edge(run, current_node_id, next_node_id, next_edge.condition)
+            elif branch is None:
+                logger.info("   ✅ Workflow terminé")
+
+            # Les branches parallèles sont reprises en bloc : seul le chemin principal est persisté
+            if branch is None:
+                await self._save_checkpoint(run, next_node_id, result)
 
             current_node_id = next_node_id
             current_data = result
+        else:
+            # Seule la condition de la boucle signale le budget global épuisé : un `break` garde sa raison d'arrêt
+            if current_node_id and scope is not None:
+                raise ItemLimitExceeded("max_total_iterations", current_node_id, max_total_iterations)
+            if current_node_id and branch is None:
+                run.stop("max_total_iterations", current_node_id)
 
-        return {
-            "final_result": current_data,
-            "execution_history": self.execution_history,
-            "node_iterations": self.node_iterations,
-            "total_iterations": iteration_count,
-        }
+        return current_data, None
+
+    def _span(self, name: str, attributes: Dict[str, Any]):
+        """Span actif pour le bloc, ou contexte vide (qui produit None) si le tracing est désactivé"""
+        if self.tracer is None:
+            return _NO_SPAN
+        return self.tracer.span(name, attributes)
+
+    @staticmethod
+    def _node_attributes(node: CompiledNode, iteration: int, branch: Optional[str]) -> Dict[str, Any]:
+        attributes = {"workflow.node.id": node.id, "workflow.node.type": node.type.value, "workflow.node.iteration": iteration}
+        if branch is not None:
+            attributes["workflow.branch"] = branch
+        return attributes
+
+    @asynccontextmanager
+    async def _enforce_limits(self, run: RunContext, node: CompiledNode):
+        """Borne l'exécution d'un nœud par son timeout et par le temps restant de l'exécution.
+
+        L'expiration annule la tâche en cours, et donc les appels de modèle et d'outils en vol.
+        """
+        remaining = run.remaining_s()
+        if remaining is not None and remaining <= 0:
+            raise RunDeadlineExceeded(node.id, run.timeout_s)
+
+        deadline_bound = remaining is not None and (node.timeout_s is None or remaining < node.timeout_s)
+        budget = remaining if deadline_bound else node.timeout_s
+        if budget is None:
+            yield
+            return
+
+        try:
+            async with asyncio.timeout(budget) as scope:
+                yield
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            if deadline_bound:
+                raise RunDeadlineExceeded(node.id, run.timeout_s) from None
+            raise NodeTimeout(node.id, node.timeout_s) from None
+
+    async def _execute_parallel(
+        self, run: RunContext, node: CompiledNode, input_data: Any, scope: Optional[IterationScope] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """Exécute toutes les branches simultanément ; un échec annule les branches sœurs"""
+        semaphore = asyncio.Semaphore(node.max_concurrency) if node.max_concurrency else None
 
-    def _find_node(self, workflow: WorkflowDefinition, node_id: str):
-        return next((node for node in workflow.nodes if node.id == node_id), None)
+        async def run_branch(branch_node_id: str) -> Tuple[Any, Optional[str]]:
+            run.emit(EdgeTaken(run_id=run.run_id, branch=branch_node_id, from_node=node.id, to_node=branch_node_id))
+            if self.metrics is not None:
+                self.metrics.edge_taken(run.workflow.name, node.id, branch_node_id)
+            if self.middleware.on_edge is not None:
+                await self.middleware.on_edge(run, node.id, branch_node_id, None)
+            if semaphore is None:
+                return await self._run_path(run, branch_node_id, input_data, branch=branch_node_id, scope=scope)
+            async with semaphore:
+                return await self._run_path(run, branch_node_id, input_data, branch=branch_node_id, scope=scope)
 
-    def _should_stop_iteration(self, node, node_id: str) -> bool:
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = {edge.to_node: task_group.create_task(run_branch(edge.to_node)) for edge in node.branches}
+        except BaseExceptionGroup as group:
+            # Remonter la première erreur de branche comme une exécution séquentielle le ferait
+            raise group.exceptions[0]
+
+        branch_outputs: Dict[str, Any] = {}
+        sync_node_ids = set()
+        for branch_node_id, task in tasks.items():
+            output, sync_node_id = task.result()
+            if sync_node_id is None:
+                raise ValueError(f"Parallel node '{node.id}': branch '{branch_node_id}' did not reach a sync node")
+            branch_outputs[branch_node_id] = output
+            sync_node_ids.add(sync_node_id)
+
+        if len(sync_node_ids) != 1:
+            raise ValueError(f"Parallel node '{node.id}': branches join different sync nodes {sorted(sync_node_ids)}")
+
+        return branch_outputs, sync_node_ids.pop()
+
+    async def _execute_map(self, run: RunContext, node: CompiledNode, input_data: Any, branch: Optional[str]) -> List[Any]:
+        """Exécute le sous-nœud du map pour chaque élément de la liste sélectionnée"""
+        map_config = node.map
+        items = DataPath.resolve(input_data, map_config.items_path)
+        if not isinstance(items, (list, tuple)):
+            raise ValueError(f"Map node '{node.id}': '{map_config.items_path}' is not a list")
+
+        shared = {}
+        if map_config.context_keys and isinstance(input_data, dict):
+            shared = {key: input_data[key] for key in map_config.context_keys if key in input_data}
+
+        semaphore = asyncio.Semaphore(node.max_concurrency) if node.max_concurrency else None
+        prefix = f"{branch}/" if branch else ""
+
+        async def run_item(index: int, item: Any) -> Any:
+            item_input = {**shared, "item": item} if shared else item
+            item_branch = f"{prefix}{node.id}[{index}]"
+            # Chaque élément borne ses propres cycles, sans consommer le budget de l'exécution
+            item_scope = IterationScope()
+            try:
+                if semaphore is None:
+                    output, _ = await self._run_path(run, map_config.node, item_input, branch=item_branch, scope=item_scope)
+                    return output
+                async with semaphore:
+                    output, _ = await self._run_path(run, map_config.node, item_input, branch=item_branch, scope=item_scope)
+                    return output
+            finally:
+                # Les totaux par nœud de tous les éléments restent rapportés dans node_iterations
+                for node_id, count in item_scope.node_iterations.items():
+                    run.node_iterations[node_id] = run.get_iterations(node_id) + count
+
+        if map_config.on_error == "fail_fast":
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [task_group.create_task(run_item(index, item)) for index, item in enumerate(items)]
+            except BaseExceptionGroup as group:
+                raise group.exceptions[0]
+            return [task.result() for task in tasks]
+
+        # skip / collect : les échecs n'interrompent pas les autres éléments
+        outputs = await asyncio.gather(*(run_item(index, item) for index, item in enumerate(items)), return_exceptions=True)
+        results = []
+        for index, output in enumerate(outputs):
+            # Le budget global épuisé interrompt tout le map, quelle que soit la politique d'erreur
+            if isinstance(output, (asyncio.CancelledError, RunDeadlineExceeded)):
+                raise output
+            if isinstance(output, Exception):
+                logger.warning("   ⚠️ %s - élément %d en échec: %s", node.name, index, output, extra={"node_id": node.id})
+                if map_config.on_error == "collect":
+                    results.append({"error": f"{type(output).__name__}: {output}", "index": index})
+                continue
+            results.append(output)
+        return results
+
+    async def _save_checkpoint(self, run: RunContext, next_node_id: Optional[str], current_data: Any, status: str = "running"):
+        if self.checkpoint_store is None:
+            return
+        if run.execution_history.durable:
+            # Le checkpoint ne porte que des références : les données doivent être sur disque
+            await run.execution_history.flush()
+
+        # Checkpoint incrémental : seules les étapes ajoutées depuis le précédent sont sérialisées
+        history = run.execution_history
+        delta = run.checkpointed_steps is not None
+        since = run.checkpointed_steps if delta else 0
+        steps = history.to_list(payloads=not history.durable, since=since)
+
+        # Copies superficielles : le store peut sérialiser hors de la boucle d'événements
+        checkpoint = WorkflowCheckpoint(
+            run_id=run.run_id,
+            workflow_name=run.workflow.name,
+            workflow_source=None if delta else run.workflow.source,
+            status=status,
+            next_node_id=next_node_id,
+            current_data=current_data,
+            node_iterations=dict(run.node_iterations),
+            total_iterations=run.total_iterations,
+            execution_history=steps,
+            history_start=history.recorded - len(steps),
+            history_delta=delta,
+            context=dict(run.context),
+            updated_at=datetime.now().isoformat(),
+        )
+        await self.checkpoint_store.save(checkpoint)
+        run.checkpointed_steps = history.recorded
+
+    def _should_stop_iteration(self, counters: Union[RunContext, IterationScope], node: CompiledNode) -> bool:
         if node.max_iterations is None:
             return False
 
-        current_iterations = self.node_iterations.get(node_id, 0)
-        return current_iterations >= node.max_iterations
+        return counters.get_iterations(node.id) >= node.max_iterations
 
-    async def _execute_node(self, node, input_data: Any, context: Dict[str, Any]) -> Any:
-        # Incrémenter le compteur d'itérations
-        self.node_iterations[node.id] = self.node_iterations.get(node.id, 0) + 1
+    async def _execute_node(
+        self, run: RunContext, node: CompiledNode, input_data: Any, branch: Optional[str] = None, scope: Optional[IterationScope] = None
+    ) -> Any:
+        # Incrémenter le compteur d'itérations (celui de l'élément de map en cours, le cas échéant)
+        counters = run if scope is None else scope
+        counters.node_iterations[node.id] = counters.get_iterations(node.id) + 1
 
         if node.type == NodeType.END:
             return input_data
 
-        # Préparer les données d'entrée selon le nœud
-        if node.id == "manager_final":
-            # Le manager final a besoin du contexte complet
-            enhanced_input = {
-                "content": input_data,
-                "original_request": context.get("original_request"),
-                "iterations": self.node_iterations,
-                "history": self.execution_history,
-            }
-            input_data = enhanced_input
+        # Jointure : fusionner les sorties des branches parallèles
+        if node.type == NodeType.SYNC:
+            return BranchMerger.merge(node.merge_strategy, input_data)
+
+        if node.type == NodeType.MAP:
+            return await self._execute_map(run, node, input_data, branch)
+
+        # Enrichir l'entrée avec le contexte d'exécution déclaré par le nœud
+        if node.context is not None:
+            input_data = ContextBuilder.build(node.context, input_data, run)
 
         # Créer et exécuter l'agent
-        agent = self.agent_factory.create_agent(node.agent_config, node)
-        result = await agent.execute(input_data, context)
+        agent = self.agent_factory.get_agent(node)
+        router = _EarlyRouter(node, run.context) if self.early_routing and node.conditional_edges else None
+        observer = _NodeObserver(run, node.id, branch, self.metrics, router, self._warm_next_node)
+        # Les logs de l'agent et de ses outils portent le nœud et la branche
+        with bind(node_id=node.id, branch=branch):
+            if self.middleware.around_agent_call is None:
+                return await agent.execute_stream(input_data, run.context, observer)
 
-        return result
+            async def agent_call(agent_input: Any) -> Any:
+                return await agent.execute_stream(agent_input, run.context, observer)
 
-    def _determine_next_node(
-        self, workflow: WorkflowDefinition, current_node_id: str, result: Any, context: Dict[str, Any]
-    ) -> Optional[str]:
-        edges = [edge for edge in workflow.edges if edge.from_node == current_node_id]
+            return await self.middleware.around_agent_call(run, node, agent_call)(input_data)
 
-        for edge in edges:
-            if self._evaluate_condition(edge.condition, result, context, current_node_id):
-                return edge.to_node
+    def _warm_next_node(self, run: RunContext, edge: CompiledEdge) -> None:
+        """Prépare l'agent du nœud cible (construction, réservation du quota de son modèle)"""
+        node = run.workflow.get_node(edge.to_node)
+        if node is None or node.agent_key is None:
+            return
+        logger.debug("   ⏩ Routage anticipé vers %s", node.name, extra={"next_node_id": node.id})
+        self.agent_factory.get_agent(node).warm()
 
-        # Si aucune condition n'est satisfaite, prendre le premier edge sans condition
-        default_edge = next((edge for edge in edges if edge.condition is None), None)
-        if default_edge:
-            return default_edge.to_node
+    def _determine_next_edge(self, node: CompiledNode, result: Any, context: Dict[str, Any]) -> Optional[CompiledEdge]:
+        for edge in node.conditional_edges:
+            if self._evaluate_condition(edge.condition, result, context, node.id):
+                return edge
 
-        return None
+        # Si aucune condition n'est satisfaite, prendre l'edge sans condition
+        return node.default_edge
 
     def _evaluate_condition(self, condition: Optional[str], result: Any, context: Dict[str, Any], current_node_id: str) -> bool:
-        return self.condition_evaluator.evaluate(condition, result, context)
-
-    def _record_execution(self, node_id: str, input_data: Any, output_data: Any):
-        self.execution_history.append(
-            {
-                "node_id": node_id,
-                "iteration": self.node_iterations.get(node_id, 1),
-                "input": input_data,
-                "output": output_data,
-                "timestamp": __import__("datetime").datetime.now().isoformat(),
-            }
+        return self.condition_evaluator.evaluate(condition, result, context, logger)
+
+    def _record_execution(
+        self,
+        run: RunContext,
+        node_id: str,
+        iteration: int,
+        input_data: Any,
+        output_data: Any,
+        branch: Optional[str] = None,
+        duration_s: Optional[float] = None,
+    ):
+        run.execution_history.record(
+            node_id,
+            iteration,
+            input_data,
+            output_data,
+            datetime.now().isoformat(),
+            duration_s,
+            branch,
         )
@@ -1,13 +1,93 @@
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Dict, List, Optional
 
+from pydantic_ai.tools import Tool
+
+from ...core.compiled_workflow import CompiledNode, CompiledWorkflow
 from ...domain.entities.workflow_node import WorkflowNode
 from ...domain.interfaces.i_agent import IAgent
 from ...domain.interfaces.i_agent_factory import IAgentFactory
+from ..agents.cached_agent import CachedAgent
+from ..agents.cascade_agent import CascadeAgent
 from ..agents.pydantic_agent import PydanticAgent
+from ..agents.rate_limited_agent import RateLimitedAgent
+from ..agents.resilient_agent import ResilientAgent
+from ..cache.result_cache import ResultCache
+from ..http.http_client_pool import HttpClientPool
+from ..resilience.model_health import ModelHealthRegistry, model_key
+from ..resilience.rate_limiter import RateLimiterRegistry
+from ..routing.cascade_policy import CascadePolicy
+from ..simulation.cassette import Cassette
 from ..tools import tool_registry
 
 
 class AgentFactory(IAgentFactory):
+    """Construit les agents des nœuds et les partage entre itérations et exécutions.
+
+    Les agents ne portent aucun état d'exécution : une même instance sert aux exécutions
+    concurrentes de tous les nœuds qui ont la même configuration et les mêmes outils.
+    """
+
+    def __init__(
+        self,
+        result_cache: Optional[ResultCache] = None,
+        model_health: Optional[ModelHealthRegistry] = None,
+        http_clients: Optional[HttpClientPool] = None,
+        rate_limiter: Optional[RateLimiterRegistry] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        self.result_cache = result_cache
+        # Disjoncteurs et latences par modèle, partagés par toutes les exécutions
+        self.model_health = model_health or ModelHealthRegistry()
+        # Un client HTTP longue durée par fournisseur, injecté dans tous les modèles construits
+        self.http_clients = http_clients or HttpClientPool()
+        # Quotas RPM/TPM par modèle ou fournisseur, appliqués à chaque appel au modèle
+        self.rate_limiter = rate_limiter or RateLimiterRegistry()
+        # Échanges avec les modèles enregistrés ou rejoués (exécutions hors ligne)
+        self.cassette = cassette
+        # Agents construits, par empreinte de configuration (CompiledNode.agent_key)
+        self._agents: Dict[str, IAgent] = {}
+        # Plans compilés qui utilisent chaque agent (libéré quand plus aucun ne l'utilise)
+        self._users: Dict[str, int] = {}
+
+    def get_agent(self, node: CompiledNode) -> IAgent:
+        """Agent partagé du nœud, construit à la première demande"""
+        agent = self._agents.get(node.agent_key)
+        if agent is None:
+            agent = self._agents[node.agent_key] = self.create_agent(node.agent_config, node)
+        return agent
+
+    def prebuild(self, workflow: CompiledWorkflow) -> None:
+        """Construit les agents de tous les nœuds à la compilation (erreurs de configuration comprises)"""
+        nodes = {node.agent_key: node for node in workflow.nodes.values() if node.agent_key is not None}
+        for key, node in nodes.items():
+            self.get_agent(node)
+            self._users[key] = self._users.get(key, 0) + 1
+
+    def release(self, workflow: CompiledWorkflow) -> None:
+        """Oublie les agents d'un plan compilé qui ne sont partagés avec aucun autre plan"""
+        for key in {node.agent_key for node in workflow.nodes.values() if node.agent_key is not None}:
+            users = self._users.get(key, 0) - 1
+            if users > 0:
+                self._users[key] = users
+            else:
+                self._users.pop(key, None)
+                self._agents.pop(key, None)
+
+    def clear(self) -> None:
+        self._agents.clear()
+        self._users.clear()
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+    async def aclose(self) -> None:
+        """Ferme les clients HTTP des fournisseurs et la cassette ; les agents construits ne sont plus utilisables"""
+        self.clear()
+        await self.http_clients.aclose()
+        if self.cassette is not None:
+            self.cassette.close()
+
     def create_agent(self, agent_config: Dict[str, Any], node: WorkflowNode = None) -> IAgent:
         agent_type = agent_config.get("type", "pydantic")
 
@@ -17,6 +97,34 @@ class AgentFactory(IAgentFactory):
             if node and node.tools:
                 tools = tool_registry.get_tools(node.tools)
 
-            return PydanticAgent(agent_config, tools=tools)
+            agent = self._model_agent(agent_config, tools)
         else:
             raise ValueError(f"Agent type {agent_type} not supported")
+
+        # Résilience opt-in par nœud : retries, hedging, disjoncteur et modèle de repli
+        if any(key in agent_config for key in ResilientAgent.CONFIG_KEYS):
+            fallback_factory = None
+            if agent_config.get("fallback_model"):
+                fallback_config = {**agent_config, "model": agent_config["fallback_model"]}
+                fallback_factory = partial(self._model_agent, fallback_config, tools)
+            agent = ResilientAgent(agent, agent_config, self.model_health, fallback_factory)
+
+        # Cascade opt-in : modèles moins coûteux essayés avant celui du nœud
+        cascade = CascadePolicy.from_config(agent_config.get(CascadeAgent.CONFIG_KEY))
+        if cascade is not None:
+            tiers = [(model_key(model), self._model_agent({**agent_config, "model": model}, tools)) for model in cascade.models]
+            agent = CascadeAgent(agent, tiers, cascade, model_key(agent_config.get("model", "openai:gpt-4o-mini")))
+
+        # Cache de résultats opt-in par nœud
+        if self.result_cache is not None and agent_config.get("cacheable", False):
+            return CachedAgent(agent, self.result_cache, agent_config, list(node.tools) if node and node.tools else None)
+
+        return agent
+
+    def _model_agent(self, agent_config: Dict[str, Any], tools: Optional[List[Tool]]) -> IAgent:
+        """Agent qui appelle le modèle, derrière le quota de ce modèle s'il en a un"""
+        agent = PydanticAgent(agent_config, tools=tools, http_clients=self.http_clients, cassette=self.cassette)
+        limiter = self.rate_limiter.limiter(agent_config.get("model", "openai:gpt-4o-mini"))
+        if limiter is not None:
+            return RateLimitedAgent(agent, agent_config, limiter)
+        return agent
@@ -0,0 +1,58 @@
+import hashlib
+import json
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from ...core.execution_history import ExecutionHistory, StepRecord
+from ...domain.interfaces.i_history_store import IHistoryStore
+
+
+class DedupExecutionHistory(ExecutionHistory):
+    """Historique adressé par contenu : une donnée identique n'est conservée qu'une fois.
+
+    L'entrée d'une étape est la sortie de la précédente, et les brouillons se répètent
+    d'une itération à l'autre : les étapes ne portent que l'empreinte de leurs données.
+    """
+
+    def __init__(self, max_steps: Optional[int] = None):
+        super().__init__(max_steps)
+        self._payloads: Dict[str, Any] = {}
+        self._refcounts: Counter = Counter()
+
+    def _store(self, payload: Any) -> str:
+        ref = self.fingerprint(payload)
+        if ref not in self._payloads:
+            self._payloads[ref] = payload
+        self._refcounts[ref] += 1
+        return ref
+
+    def _evict(self, step: StepRecord) -> None:
+        for ref in (step.input_ref, step.output_ref):
+            self._refcounts[ref] -= 1
+            if self._refcounts[ref] <= 0:
+                del self._refcounts[ref]
+                self._payloads.pop(ref, None)
+
+    def load(self, ref: str) -> Any:
+        return self._payloads[ref]
+
+    @property
+    def unique_payloads(self) -> int:
+        return len(self._payloads)
+
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        if isinstance(payload, str):
+            data = payload.encode("utf-8")
+        else:
+            data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        # Le type fait partie de l'empreinte : "1" et 1 restent distincts
+        return hashlib.sha256(type(payload).__name__.encode() + b":" + data).hexdigest()
+
+
+class DedupHistoryStore(IHistoryStore):
+    def __init__(self, max_steps: Optional[int] = None):
+        self.max_steps = max_steps
+
+    def open(self, run_id: str) -> DedupExecutionHistory:
+        return DedupExecutionHistory(self.max_steps)
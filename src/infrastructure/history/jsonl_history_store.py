@@ -0,0 +1,125 @@
+import asyncio
+import atexit
+import json
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from ...core.execution_history import ExecutionHistory
+from ...domain.interfaces.i_history_store import IHistoryStore
+
+
+class JsonlExecutionHistory(ExecutionHistory):
+    """Historique dont les données sont déversées dans le fichier JSONL du store.
+
+    Les étapes ne gardent que la position (offset, longueur) de leurs données dans le
+    fichier ; elles sont relues à la demande.
+    """
+
+    durable = True
+
+    def __init__(self, store: "JsonlHistoryStore", run_id: str, max_steps: Optional[int] = None):
+        super().__init__(max_steps)
+        self.store = store
+        self.run_id = run_id
+
+    def _store(self, payload: Any) -> List[int]:
+        return self.store.append(self.run_id, payload)
+
+    def load(self, ref: Sequence[int]) -> Any:
+        return self.store.read(ref)
+
+    async def flush(self) -> None:
+        await self.store.flush()
+
+
+class JsonlHistoryStore(IHistoryStore):
+    """Fichier JSONL en ajout seul partagé par toutes les exécutions.
+
+    Les écritures ne bloquent pas la boucle d'événements : les lignes sont mises en file et
+    écrites par lots par un thread dédié ; celles qui ne sont pas encore sur disque sont relues
+    en mémoire. Les lectures passent par un descripteur ouvert une fois (`os.pread`).
+    Les données non sérialisables en JSON sont conservées sous forme de chaîne.
+    """
+
+    def __init__(self, path: str, max_steps: Optional[int] = None):
+        self.path = path
+        self.max_steps = max_steps
+        self._file = open(path, "ab")
+        self._read_fd = os.open(path, os.O_RDONLY)
+        # Position de la prochaine ligne : les références sont connues avant l'écriture
+        self._offset = self._file.seek(0, os.SEEK_END)
+        # Lignes en file, par offset, jusqu'à leur écriture
+        self._pending: Dict[int, bytes] = {}
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="jsonl-history-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self._stop_writer)
+
+    def open(self, run_id: str) -> JsonlExecutionHistory:
+        return JsonlExecutionHistory(self, run_id, self.max_steps)
+
+    def append(self, run_id: str, payload: Any) -> List[int]:
+        line = json.dumps({"run_id": run_id, "payload": payload}, ensure_ascii=False, default=str).encode("utf-8") + b"\n"
+        offset = self._offset
+        self._offset += len(line)
+        self._pending[offset] = line
+        self._queue.put((offset, line))
+        return [offset, len(line)]
+
+    def read(self, ref: Sequence[int]) -> Any:
+        offset, length = ref
+        line = self._pending.get(offset)
+        if line is None:
+            line = os.pread(self._read_fd, length, offset)
+        return json.loads(line)["payload"]
+
+    async def flush(self) -> None:
+        """Attend que les lignes déjà ajoutées soient écrites (un checkpoint peut référencer leur position)"""
+        if not self._pending:
+            return
+        loop = asyncio.get_running_loop()
+        written = loop.create_future()
+        self._queue.put(lambda: loop.call_soon_threadsafe(_resolve, written))
+        await written
+
+    def _write_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [item for item in batch if isinstance(item, tuple)]
+            if lines:
+                self._file.writelines(line for _, line in lines)
+                self._file.flush()
+                # Retirées après l'écriture : une lecture trouve la ligne en mémoire ou dans le fichier
+                for offset, _ in lines:
+                    del self._pending[offset]
+            for item in batch:
+                if callable(item):
+                    item()
+            if None in batch:
+                return
+
+    def _stop_writer(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    async def close(self) -> None:
+        if self._file.closed:
+            return
+        atexit.unregister(self._stop_writer)
+        await asyncio.to_thread(self._stop_writer)
+        self._file.close()
+        os.close(self._read_fd)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
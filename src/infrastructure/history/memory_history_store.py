@@ -0,0 +1,14 @@
+from typing import Optional
+
+from ...core.execution_history import ExecutionHistory
+from ...domain.interfaces.i_history_store import IHistoryStore
+
+
+class MemoryHistoryStore(IHistoryStore):
+    """Historique en mémoire ; avec `max_steps`, buffer circulaire des dernières étapes"""
+
+    def __init__(self, max_steps: Optional[int] = None):
+        self.max_steps = max_steps
+
+    def open(self, run_id: str) -> ExecutionHistory:
+        return ExecutionHistory(self.max_steps)
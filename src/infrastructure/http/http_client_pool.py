@@ -0,0 +1,58 @@
+import importlib.util
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from ..logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpClientPool:
+    """Un `httpx.AsyncClient` longue durée par fournisseur de modèle.
+
+    Tous les modèles d'un même fournisseur partagent le pool de connexions (keep-alive,
+    sessions TLS, multiplexage HTTP/2). HTTP/2 nécessite le paquet `h2` : sans lui, les
+    clients restent en HTTP/1.1. Les clients sont fermés par `aclose()`.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry_s: float = 60.0,
+        http2: bool = True,
+        timeout_s: float = 600.0,
+        connect_timeout_s: float = 5.0,
+    ):
+        if max_connections < 1 or max_keepalive_connections < 0:
+            raise ValueError("max_connections must be >= 1 and max_keepalive_connections >= 0")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self.timeout = httpx.Timeout(timeout_s, connect=connect_timeout_s)
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.warning("HTTP/2 demandé mais le paquet 'h2' est absent : les clients des fournisseurs restent en HTTP/1.1")
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> "HttpClientPool":
+        return cls(**config) if config else cls()
+
+    def client(self, provider: str) -> httpx.AsyncClient:
+        """Client partagé du fournisseur, créé à la première demande"""
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            client = self._clients[provider] = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
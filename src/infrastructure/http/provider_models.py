@@ -0,0 +1,35 @@
+import importlib
+from typing import Any, Dict, Tuple, Union
+
+from .http_client_pool import HttpClientPool
+
+# Fournisseurs dont le modèle accepte un client HTTP injecté : (classe du modèle, classe du provider)
+_PROVIDER_MODELS: Dict[str, Tuple[str, str]] = {
+    "openai": ("pydantic_ai.models.openai:OpenAIModel", "pydantic_ai.providers.openai:OpenAIProvider"),
+    "anthropic": ("pydantic_ai.models.anthropic:AnthropicModel", "pydantic_ai.providers.anthropic:AnthropicProvider"),
+    "groq": ("pydantic_ai.models.groq:GroqModel", "pydantic_ai.providers.groq:GroqProvider"),
+    "google-gla": ("pydantic_ai.models.gemini:GeminiModel", "pydantic_ai.providers.google_gla:GoogleGLAProvider"),
+}
+
+
+def _load(path: str) -> Any:
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def build_model(model: Any, http_clients: HttpClientPool) -> Union[Any, str]:
+    """Construit le modèle pydantic-ai d'un nom "fournisseur:modèle" avec le client partagé du fournisseur.
+
+    Les modèles déjà instanciés et les fournisseurs non pris en charge sont retournés tels quels
+    (pydantic-ai les résout avec son propre client).
+    """
+    if not isinstance(model, str) or ":" not in model:
+        return model
+
+    provider, model_name = model.split(":", 1)
+    classes = _PROVIDER_MODELS.get(provider)
+    if classes is None:
+        return model
+
+    model_class, provider_class = (_load(path) for path in classes)
+    return model_class(model_name, provider=provider_class(http_client=http_clients.client(provider)))
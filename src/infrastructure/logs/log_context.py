@@ -0,0 +1,31 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Mapping
+
+# Champs de corrélation de la tâche courante (run_id, node_id, branch...), hérités par les sous-tâches
+_log_fields: ContextVar[Mapping[str, Any]] = ContextVar("log_fields", default={})
+
+
+@contextmanager
+def bind(**fields: Any) -> Iterator[None]:
+    """Ajoute des champs de corrélation à tous les logs émis dans le bloc"""
+    token = _log_fields.set({**_log_fields.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_fields.reset(token)
+
+
+def current_fields() -> Dict[str, Any]:
+    return dict(_log_fields.get())
+
+
+class ContextFilter(logging.Filter):
+    """Copie les champs de corrélation sur chaque record, dans la tâche qui l'émet"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_fields.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
@@ -0,0 +1,82 @@
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Optional, Union
+
+from .json_formatter import JsonFormatter
+from .log_context import ContextFilter
+from .logger import ROOT_LOGGER
+from .sampling_filter import RunSamplingFilter
+
+TEXT_FORMAT = "%(message)s"
+
+
+class _RunQueueHandler(QueueHandler):
+    """Met les records en file ; le formatage et l'écriture ont lieu dans le thread du QueueListener"""
+
+    listener: Optional[QueueListener] = None
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Seuls le message et la trace d'exception sont calculés ici (les arguments peuvent être
+        # modifiés après l'appel) ; les champs structurés restent sur le record
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO,
+    json_format: bool = False,
+    stream: Optional[IO[str]] = None,
+    sample_rate: float = 1.0,
+    text_format: str = TEXT_FORMAT,
+) -> QueueListener:
+    """Active les logs du projet (mode CLI ou application) ; par défaut ils sont silencieux.
+
+    Les records sont mis en file dans la boucle d'événements puis formatés et écrits par un
+    thread dédié. `sample_rate` ne garde les logs sous WARNING que pour une fraction des
+    exécutions. Un nouvel appel remplace la configuration précédente.
+    """
+    root = logging.getLogger(ROOT_LOGGER)
+    shutdown_logging()
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(text_format))
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _RunQueueHandler(records)
+    queue_handler.addFilter(ContextFilter())
+    if sample_rate < 1:
+        queue_handler.addFilter(RunSamplingFilter(sample_rate))
+
+    listener = QueueListener(records, handler)
+    queue_handler.listener = listener
+    listener.start()
+
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    # Les logs configurés ici ne remontent pas aux handlers de l'application hôte
+    root.propagate = False
+    return listener
+
+
+def shutdown_logging() -> None:
+    """Vide la file, arrête le thread d'écriture et rend les logs à nouveau silencieux"""
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        if isinstance(handler, _RunQueueHandler):
+            root.removeHandler(handler)
+            if handler.listener is not None:
+                handler.listener.stop()
+                handler.listener = None
+    root.setLevel(logging.WARNING)
+    root.propagate = True
+
+
+atexit.register(shutdown_logging)
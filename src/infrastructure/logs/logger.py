@@ -0,0 +1,16 @@
+import logging
+
+# Logger parent de tous les modules du projet ("src")
+ROOT_LOGGER = __name__.partition(".")[0]
+
+# Mode service : silencieux tant que configure_logging n'est pas appelé. Le niveau WARNING
+# court-circuite les appels info/debug dès `isEnabledFor`, même si l'application hôte
+# configure le logger racine plus bas.
+_root = logging.getLogger(ROOT_LOGGER)
+_root.addHandler(logging.NullHandler())
+_root.setLevel(logging.WARNING)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger d'un module du projet (`get_logger(__name__)`)"""
+    return logging.getLogger(name)
@@ -0,0 +1,26 @@
+import logging
+import zlib
+
+
+class RunSamplingFilter(logging.Filter):
+    """Ne garde les logs de niveau inférieur à `min_level` que pour une fraction des exécutions.
+
+    L'échantillonnage se fait par `run_id` : les logs d'une exécution retenue sont complets.
+    Les logs sans run_id et ceux de niveau `min_level` ou plus sont toujours conservés.
+    """
+
+    def __init__(self, rate: float, min_level: int = logging.WARNING):
+        super().__init__()
+        if not 0 <= rate <= 1:
+            raise ValueError("Sampling rate must be between 0 and 1")
+        self.rate = rate
+        self.min_level = min_level
+        self._threshold = int(rate * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.min_level:
+            return True
+        run_id = getattr(record, "run_id", None)
+        if run_id is None:
+            return True
+        return zlib.crc32(run_id.encode()) <= self._threshold
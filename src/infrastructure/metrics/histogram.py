@@ -0,0 +1,58 @@
+import bisect
+import math
+from typing import Dict, Optional, Sequence, Tuple
+
+# Bornes supérieures des buckets de latence, en secondes
+LATENCY_BUCKETS_S = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+TOKEN_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+
+class Histogram:
+    """Histogramme à buckets cumulatifs, au format Prometheus"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS_S):
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        # Un compteur par bucket, plus le bucket +Inf
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Tuple[Tuple[float, int], ...]:
+        """Paires (borne supérieure, nombre d'observations inférieures ou égales), +Inf en dernier"""
+        total, buckets = 0, []
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return tuple(buckets)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimation par interpolation linéaire dans le bucket, comme histogram_quantile()"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        lower, previous = 0.0, 0
+        for bound, cumulative in self.cumulative():
+            if cumulative >= rank:
+                if math.isinf(bound):
+                    return lower
+                in_bucket = cumulative - previous
+                return lower + (bound - lower) * ((rank - previous) / in_bucket if in_bucket else 0.0)
+            lower, previous = bound, cumulative
+        return lower
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
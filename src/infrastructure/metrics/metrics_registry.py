@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .histogram import LATENCY_BUCKETS_S, Histogram
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """Compteurs, jauges et histogrammes étiquetés, agrégés en mémoire"""
+
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+    def __init__(self):
+        # nom -> (type, description)
+        self._families: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._buckets: Dict[str, Sequence[float]] = {}
+
+    def counter(self, name: str, description: str) -> None:
+        self._families[name] = (self.COUNTER, description)
+        self._counters.setdefault(name, {})
+
+    def gauge(self, name: str, description: str) -> None:
+        # Les jauges partagent le stockage des compteurs : une valeur par série
+        self._families[name] = (self.GAUGE, description)
+        self._counters.setdefault(name, {})
+
+    def histogram(self, name: str, description: str, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> None:
+        self._families[name] = (self.HISTOGRAM, description)
+        self._histograms.setdefault(name, {})
+        self._buckets[name] = buckets
+
+    def inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        series = self._counters[name]
+        series[labels] = series.get(labels, 0) + value
+
+    def set(self, name: str, labels: Labels, value: float) -> None:
+        self._counters[name][labels] = value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms[name]
+        histogram = series.get(labels)
+        if histogram is None:
+            histogram = series[labels] = Histogram(self._buckets[name])
+        histogram.observe(value)
+
+    def families(self):
+        """(nom, type, description, séries) pour chaque métrique déclarée"""
+        for name, (kind, description) in self._families.items():
+            series = self._histograms[name] if kind == self.HISTOGRAM else self._counters[name]
+            yield name, kind, description, series
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        snapshot = {}
+        for name, kind, _, series in self.families():
+            if kind != self.HISTOGRAM:
+                snapshot[name] = [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+            else:
+                snapshot[name] = [{"labels": dict(labels), **histogram.summary()} for labels, histogram in series.items()]
+        return snapshot
@@ -0,0 +1,89 @@
+import asyncio
+import math
+import os
+from typing import Optional
+
+from .metrics_registry import MetricsRegistry
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels, extra=()) -> str:
+    pairs = tuple(labels) + tuple(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class PrometheusExporter:
+    """Exporte un registre de métriques au format texte Prometheus : fichier local ou petit endpoint HTTP"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def render(self) -> str:
+        lines = []
+        for name, kind, description, series in self.registry.families():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in series.items():
+                if kind != MetricsRegistry.HISTOGRAM:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(metric)}")
+                    continue
+                for bound, cumulative in metric.cumulative():
+                    lines.append(f"{name}_bucket{_format_labels(labels, (('le', _format_value(bound)),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(metric.sum)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_file(self, path: str) -> None:
+        """Écriture atomique, pour le collecteur textfile de node_exporter par exemple"""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(temporary_path, path)
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 9464) -> asyncio.AbstractServer:
+        """Démarre un endpoint HTTP minimal qui répond à GET /metrics"""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            # Ignorer les en-têtes de la requête
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, content_type, body = "200 OK", self.CONTENT_TYPE, self.render().encode("utf-8")
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"Not found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode(
+                    "latin-1"
+                )
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Mapping
+
+from .histogram import TOKEN_BUCKETS
+from .metrics_registry import MetricsRegistry
+
+
+class WorkflowMetrics:
+    """Métriques d'exécution des workflows, agrégées par workflow et par nœud"""
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or MetricsRegistry()
+        registry = self.registry
+        registry.histogram("workflow_run_duration_seconds", "Durée totale des exécutions")
+        registry.counter("workflow_runs_total", "Exécutions terminées, par issue")
+        registry.histogram("workflow_node_duration_seconds", "Durée d'exécution des nœuds")
+        registry.histogram("workflow_node_model_seconds", "Temps passé dans les requêtes au modèle, par exécution de nœud")
+        registry.histogram("workflow_node_tool_seconds", "Temps passé dans les appels d'outils, par exécution de nœud")
+        registry.histogram("workflow_node_tokens", "Tokens consommés par exécution de nœud", TOKEN_BUCKETS)
+        registry.counter("workflow_node_tokens_total", "Tokens consommés, par type")
+        registry.counter("workflow_node_model_requests_total", "Requêtes envoyées au modèle")
+        registry.counter("workflow_node_errors_total", "Exécutions de nœud en échec")
+        registry.counter("workflow_node_retries_total", "Nouvelles tentatives d'appel au modèle")
+        registry.counter("workflow_node_parse_failures_total", "Réponses de décision non parsables")
+        registry.counter("workflow_edge_transitions_total", "Transitions empruntées")
+        registry.counter("workflow_node_cascade_total", "Réponses des modèles de cascade, par modèle et par issue")
+        registry.counter("workflow_node_early_routes_total", "Edges choisis avant la fin du streaming de la décision")
+
+    def run_finished(self, workflow: str, duration_s: float, outcome: str) -> None:
+        labels = (("workflow", workflow),)
+        self.registry.observe("workflow_run_duration_seconds", labels, duration_s)
+        self.registry.inc("workflow_runs_total", labels + (("outcome", outcome),))
+
+    def node_finished(self, workflow: str, node_id: str, duration_s: float) -> None:
+        self.registry.observe("workflow_node_duration_seconds", (("workflow", workflow), ("node", node_id)), duration_s)
+
+    def node_failed(self, workflow: str, node_id: str, error: BaseException) -> None:
+        self.registry.inc("workflow_node_errors_total", (("workflow", workflow), ("node", node_id), ("error", type(error).__name__)))
+
+    def agent_run(self, workflow: str, node_id: str, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        labels = (("workflow", workflow), ("node", node_id))
+        self.registry.observe("workflow_node_model_seconds", labels, model_s)
+        self.registry.observe("workflow_node_tool_seconds", labels, tools_s)
+        self.registry.observe("workflow_node_tokens", labels, usage.get("request_tokens", 0) + usage.get("response_tokens", 0))
+        self.registry.inc("workflow_node_tokens_total", labels + (("type", "request"),), usage.get("request_tokens", 0))
+        self.registry.inc("workflow_node_tokens_total", labels + (("type", "response"),), usage.get("response_tokens", 0))
+        self.registry.inc("workflow_node_model_requests_total", labels, usage.get("requests", 0))
+
+    def retry(self, workflow: str, node_id: str) -> None:
+        self.registry.inc("workflow_node_retries_total", (("workflow", workflow), ("node", node_id)))
+
+    def parse_failure(self, workflow: str, node_id: str) -> None:
+        self.registry.inc("workflow_node_parse_failures_total", (("workflow", workflow), ("node", node_id)))
+
+    def cascade(self, workflow: str, node_id: str, model: str, outcome: str) -> None:
+        self.registry.inc("workflow_node_cascade_total", (("workflow", workflow), ("node", node_id), ("model", model), ("outcome", outcome)))
+
+    def early_route(self, workflow: str, node_id: str, to_node: str) -> None:
+        self.registry.inc("workflow_node_early_routes_total", (("workflow", workflow), ("node", node_id), ("to", to_node)))
+
+    def edge_taken(self, workflow: str, from_node: str, to_node: str) -> None:
+        self.registry.inc("workflow_edge_transitions_total", (("workflow", workflow), ("from", from_node), ("to", to_node)))
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        return self.registry.snapshot()
@@ -0,0 +1,72 @@
+import time
+from typing import Any, Dict
+
+
+class CircuitOpenError(RuntimeError):
+    """Le circuit du modèle est ouvert : l'appel est refusé sans solliciter le fournisseur"""
+
+    def __init__(self, model: str, retry_in_s: float):
+        super().__init__(f"Circuit open for model {model}, retry in {retry_in_s:.1f}s")
+        self.model = model
+        self.retry_in_s = retry_in_s
+
+
+class CircuitBreaker:
+    """Disjoncteur par modèle : fermé, ouvert après `failure_threshold` échecs consécutifs, puis semi-ouvert.
+
+    Une fois `reset_timeout_s` écoulé, un seul appel d'essai est autorisé : son succès
+    referme le circuit, son échec le rouvre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, model: str, failure_threshold: int = 5, reset_timeout_s: float = 30.0):
+        if failure_threshold < 1:
+            raise ValueError("circuit_breaker.failure_threshold must be >= 1")
+        self.model = model
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_count = 0
+        self.rejected_count = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """Lève CircuitOpenError si l'appel doit être refusé"""
+        if self.state == self.CLOSED:
+            return
+
+        retry_in_s = self._opened_at + self.reset_timeout_s - time.monotonic()
+        if self.state == self.OPEN and retry_in_s <= 0:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+
+        self.rejected_count += 1
+        raise CircuitOpenError(self.model, max(retry_in_s, 0.0))
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.opened_count += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Appel abandonné (annulation, erreur non imputable au fournisseur) : libère l'essai éventuel"""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "opened": self.opened_count, "rejected": self.rejected_count}
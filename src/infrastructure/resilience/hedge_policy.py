@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from .latency_tracker import LatencyTracker
+
+
+@dataclass(frozen=True, slots=True)
+class HedgePolicy:
+    """Requête dupliquée lancée quand la première dépasse le percentile de latence observé.
+
+    Tant que moins de `min_samples` latences sont connues, `delay_s` sert de délai
+    (pas de duplication s'il est absent).
+    """
+
+    percentile: float = 95.0
+    min_samples: int = 20
+    delay_s: Optional[float] = None
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> Optional["HedgePolicy"]:
+        if not config:
+            return None
+        policy = cls(**config)
+        if not 0 < policy.percentile <= 100:
+            raise ValueError("hedge.percentile must be in ]0, 100]")
+        return policy
+
+    def delay(self, latencies: LatencyTracker) -> Optional[float]:
+        if len(latencies) >= self.min_samples:
+            return latencies.percentile(self.percentile)
+        return self.delay_s
@@ -0,0 +1,22 @@
+from collections import deque
+from typing import Deque, Optional
+
+
+class LatencyTracker:
+    """Fenêtre glissante des latences des derniers appels réussis"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, duration_s: float) -> None:
+        self._samples.append(duration_s)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, round(percentile / 100 * len(ordered)) - 1))
+        return ordered[index]
@@ -0,0 +1,44 @@
+from collections import Counter
+from typing import Any, Dict, Mapping, Optional
+
+from .circuit_breaker import CircuitBreaker
+from .latency_tracker import LatencyTracker
+
+
+def model_key(model: Any) -> str:
+    """Identifiant stable d'un modèle, qu'il soit donné par son nom ou par une instance"""
+    return model if isinstance(model, str) else getattr(model, "model_name", repr(model))
+
+
+class ModelHealthRegistry:
+    """État partagé par toutes les exécutions : disjoncteurs et latences observées par modèle"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, LatencyTracker] = {}
+        # Compteurs par modèle : retries, hedges, hedge_wins, fallbacks
+        self._counters: Dict[str, Counter] = {}
+
+    def breaker(self, model: str, config: Optional[Mapping[str, Any]] = None) -> CircuitBreaker:
+        """Disjoncteur du modèle, créé avec la configuration du premier nœud qui l'utilise"""
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(model, **(config or {}))
+        return breaker
+
+    def latencies(self, model: str) -> LatencyTracker:
+        tracker = self._latencies.get(model)
+        if tracker is None:
+            tracker = self._latencies[model] = LatencyTracker()
+        return tracker
+
+    def count(self, model: str, counter: str) -> None:
+        self._counters.setdefault(model, Counter())[counter] += 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {model: breaker.stats() for model, breaker in self._breakers.items()}
+        for model, counters in self._counters.items():
+            stats.setdefault(model, {}).update(counters)
+        for model, tracker in self._latencies.items():
+            stats.setdefault(model, {}).update(samples=len(tracker), p50_s=tracker.percentile(50), p95_s=tracker.percentile(95))
+        return stats
@@ -0,0 +1,294 @@
+import asyncio
+import heapq
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from ..metrics.metrics_registry import MetricsRegistry
+from .model_health import model_key
+
+# (flux, priorité, exécution) des appels au modèle de la tâche courante, hérités par les sous-tâches
+_scope: ContextVar[Tuple[str, int, Optional[str]]] = ContextVar("rate_limit_scope", default=("default", 0, None))
+
+
+@contextmanager
+def rate_limit_scope(flow: str, priority: int = 0, run_id: Optional[str] = None) -> Iterator[None]:
+    """Rattache les appels au modèle du bloc à un flux (le workflow), à une priorité et à une exécution"""
+    token = _scope.set((flow, priority, run_id))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def _prefetch_owner() -> str:
+    """Titulaire des réservations anticipées : l'exécution courante, à défaut le flux"""
+    flow, _, run_id = _scope.get()
+    return run_id if run_id is not None else flow
+
+
+class TokenBucket:
+    """Seau à jetons rechargé en continu : `per_minute` jetons par minute, au plus `capacity` en réserve"""
+
+    __slots__ = ("capacity", "rate_per_s", "level", "updated_at")
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        if per_minute <= 0:
+            raise ValueError("rate limit per minute must be > 0")
+        self.capacity = capacity if capacity is not None else per_minute
+        self.rate_per_s = per_minute / 60
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate_per_s)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Délai avant de disposer de `amount` jetons (plafonné à la capacité du seau)"""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate_per_s if missing > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        # Le niveau peut devenir négatif (consommation réelle supérieure à l'estimation) : la dette se rembourse en attente
+        self.level = min(self.capacity, self.level - amount)
+
+
+class RateLimiter:
+    """Quotas RPM/TPM d'un modèle ou d'un fournisseur, partagés par toutes les exécutions.
+
+    Un appel réserve une requête et son estimation de tokens. Quand les seaux sont vides, il
+    attend dans une file ordonnée par priorité puis, à priorité égale, par tour de rôle entre
+    flux (fair queueing) : un workflow qui lance cent appels ne bloque pas les autres.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        output_tokens_estimate: int = 256,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        if requests_per_minute is None and tokens_per_minute is None:
+            raise ValueError(f"Rate limit '{key}' requires requests_per_minute or tokens_per_minute")
+        self.key = key
+        self.output_tokens_estimate = output_tokens_estimate
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute is not None else None
+        self.metrics = metrics
+        self._labels = (("limit", key),)
+        # Entrées (-priorité, tour du flux, ordre d'arrivée, tokens, future)
+        self._queue: List[Tuple[int, float, int, int, asyncio.Future]] = []
+        self._sequence = 0
+        self._virtual_time = 0.0
+        self._flow_tags: Dict[str, float] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        # Quotas réservés à l'avance (tokens estimés) et réservations en cours, par exécution
+        self._prefetched: Dict[str, Deque[int]] = {}
+        self._prefetching: Dict[str, Set[asyncio.Task]] = {}
+        self.calls = 0
+        self.delayed = 0
+        self.total_wait_s = 0.0
+        self.max_queue_depth = 0
+
+    @classmethod
+    def from_config(cls, key: str, config: Mapping[str, Any], metrics: Optional[MetricsRegistry] = None) -> "RateLimiter":
+        return cls(key, metrics=metrics, **config)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    async def acquire(self, tokens: int) -> float:
+        """Attend que le quota permette l'appel puis le consomme ; retourne le temps d'attente"""
+        owner = _prefetch_owner()
+        pending = self._prefetching.get(owner)
+        if pending and not self._prefetched.get(owner):
+            # Une réservation anticipée de l'exécution est en file : elle servira cet appel
+            started_at = time.monotonic()
+            await asyncio.wait(set(pending), return_when=asyncio.FIRST_COMPLETED)
+            if self._prefetched.get(owner):
+                self._use_prefetched(owner, tokens)
+                return time.monotonic() - started_at
+        if self._prefetched.get(owner):
+            self._use_prefetched(owner, tokens)
+            return 0.0
+        return await self._acquire(tokens)
+
+    async def _acquire(self, tokens: int) -> float:
+        flow, priority, _ = _scope.get()
+        if not self._queue and self._wait_time(tokens, time.monotonic()) == 0:
+            self._take(tokens)
+            self._record(0.0)
+            return 0.0
+
+        started_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        tag = max(self._virtual_time, self._flow_tags.get(flow, 0.0)) + 1
+        self._flow_tags[flow] = tag
+        self._sequence += 1
+        heapq.heappush(self._queue, (-priority, tag, self._sequence, tokens, future))
+        self._queue_changed()
+        self._wake()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Quota accordé mais appel abandonné : il est rendu
+                self._take(-tokens, requests=-1)
+            else:
+                future.cancel()
+                self._queue[:] = [entry for entry in self._queue if entry[4] is not future]
+                heapq.heapify(self._queue)
+            raise
+        finally:
+            self._queue_changed()
+
+        wait_s = time.monotonic() - started_at
+        self._record(wait_s)
+        return wait_s
+
+    def prefetch(self, tokens: int) -> None:
+        """Réserve en tâche de fond le quota d'un appel imminent ; le prochain `acquire` de l'exécution l'utilise"""
+        owner = _prefetch_owner()
+        pending = self._prefetching.setdefault(owner, set())
+        task = asyncio.create_task(self._prefetch(owner, tokens))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    async def _prefetch(self, owner: str, tokens: int) -> None:
+        await self._acquire(tokens)
+        self._prefetched.setdefault(owner, deque()).append(tokens)
+
+    def _use_prefetched(self, owner: str, tokens: int) -> None:
+        # Seul l'écart avec l'estimation de la réservation reste à consommer
+        grants = self._prefetched[owner]
+        self._take(tokens - grants.popleft(), requests=0)
+        if not grants:
+            del self._prefetched[owner]
+
+    def release(self, run_id: str) -> None:
+        """Annule les réservations anticipées de l'exécution et rend le quota de celles déjà accordées"""
+        for task in self._prefetching.pop(run_id, ()):
+            task.cancel()
+        for tokens in self._prefetched.pop(run_id, ()):
+            self._take(-tokens, requests=-1)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int, requests: int = 1) -> None:
+        """Corrige les seaux avec la consommation réelle de l'appel (requêtes et tokens)"""
+        self._take(actual_tokens - estimated_tokens, requests=requests - 1)
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        wait_s = 0.0
+        if self.requests is not None:
+            wait_s = self.requests.wait_time(1, now)
+        if self.tokens is not None:
+            wait_s = max(wait_s, self.tokens.wait_time(tokens, now))
+        return wait_s
+
+    def _take(self, tokens: int, requests: int = 1) -> None:
+        if self.requests is not None and requests:
+            self.requests.take(requests)
+        if self.tokens is not None and tokens:
+            self.tokens.take(tokens)
+
+    def _wake(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        else:
+            self._wakeup.set()
+
+    async def _dispatch(self) -> None:
+        """Libère les appels en file dans l'ordre, dès que les seaux le permettent"""
+        queue = self._queue
+        while queue:
+            _, tag, _, tokens, future = queue[0]
+            if future.done():
+                # Appel annulé pendant l'attente
+                heapq.heappop(queue)
+                continue
+
+            delay = self._wait_time(tokens, time.monotonic())
+            if delay > 0:
+                # Une arrivée plus prioritaire réveille la boucle avant l'échéance
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(queue)
+            self._take(tokens)
+            self._virtual_time = tag
+            future.set_result(None)
+
+    def _queue_changed(self) -> None:
+        depth = len(self._queue)
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        if self.metrics is not None:
+            self.metrics.set("model_rate_limit_queue_depth", self._labels, depth)
+
+    def _record(self, wait_s: float) -> None:
+        self.calls += 1
+        if wait_s > 0:
+            self.delayed += 1
+            self.total_wait_s += wait_s
+        if self.metrics is not None:
+            self.metrics.observe("model_rate_limit_wait_seconds", self._labels, wait_s)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "delayed": self.delayed,
+            "total_wait_s": self.total_wait_s,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "prefetched": sum(len(grants) for grants in self._prefetched.values()),
+        }
+
+
+class RateLimiterRegistry:
+    """Quotas par modèle ("openai:gpt-4o") ou par fournisseur ("openai"), partagés par toutes les exécutions.
+
+    Un appel est soumis à la règle la plus spécifique : celle du modèle, sinon celle de son
+    fournisseur (un seul limiteur pour tous les modèles de ce fournisseur).
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, Mapping[str, Any]]] = None, metrics: Optional[MetricsRegistry] = None):
+        self.metrics = metrics
+        if metrics is not None and limits:
+            metrics.gauge("model_rate_limit_queue_depth", "Appels au modèle en attente de quota")
+            metrics.histogram("model_rate_limit_wait_seconds", "Attente de quota avant un appel au modèle")
+        self._limiters: Dict[str, RateLimiter] = {
+            key: RateLimiter.from_config(key, config, metrics) for key, config in (limits or {}).items()
+        }
+        self._resolved: Dict[str, Optional[RateLimiter]] = {}
+
+    def limiter(self, model: Any) -> Optional[RateLimiter]:
+        """Limiteur applicable au modèle, ou None s'il n'a aucun quota"""
+        key = model_key(model)
+        if key not in self._resolved:
+            limiter = self._limiters.get(key)
+            if limiter is None and ":" in key:
+                limiter = self._limiters.get(key.split(":", 1)[0])
+            self._resolved[key] = limiter
+        return self._resolved[key]
+
+    def release(self, run_id: str) -> None:
+        """Rend le quota réservé à l'avance pour l'exécution (fin de l'exécution, routage anticipé démenti)"""
+        for limiter in self._limiters.values():
+            limiter.release(run_id)
+
+    def __len__(self) -> int:
+        return len(self._limiters)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {key: limiter.stats() for key, limiter in self._limiters.items()}
@@ -0,0 +1,52 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+import httpx
+from pydantic_ai.exceptions import ModelHTTPError
+
+try:
+    from openai import APIConnectionError as _OpenAIConnectionError
+except ImportError:  # fournisseur OpenAI non installé
+    _OpenAIConnectionError = None
+
+# Codes HTTP signalant une erreur transitoire du fournisseur
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 529})
+
+_TRANSIENT_ERRORS = tuple(
+    error for error in (httpx.TransportError, ConnectionError, asyncio.TimeoutError, _OpenAIConnectionError) if error is not None
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Erreur transitoire du fournisseur (réseau, surcharge, limite de débit)"""
+    if isinstance(error, ModelHTTPError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, _TRANSIENT_ERRORS)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Nouvelles tentatives avec backoff exponentiel (et jitter) sur les erreurs transitoires"""
+
+    max_attempts: int = 3
+    initial_delay_s: float = 0.5
+    max_delay_s: float = 10.0
+    multiplier: float = 2.0
+    jitter: bool = True
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> Optional["RetryPolicy"]:
+        if not config:
+            return None
+        policy = cls(**config)
+        if policy.max_attempts < 1:
+            raise ValueError("retry.max_attempts must be >= 1")
+        return policy
+
+    def delay(self, attempt: int) -> float:
+        """Attente avant la tentative suivante (attempt = numéro de la tentative échouée, à partir de 1)"""
+        delay = min(self.max_delay_s, self.initial_delay_s * self.multiplier ** (attempt - 1))
+        # Full jitter : évite que les exécutions concurrentes réessaient toutes au même instant
+        return random.uniform(0, delay) if self.jitter else delay
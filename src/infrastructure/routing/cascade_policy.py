@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class CascadePolicy:
+    """Modèles moins coûteux essayés avant celui du nœud, et règle d'acceptation de leur réponse.
+
+    Une réponse est acceptée si elle a été parsée en objet, contient les `required_fields` et,
+    si `min_confidence` est défini, un champ `confidence_field` au moins égal à ce seuil.
+    """
+
+    models: Tuple[Any, ...]
+    required_fields: Tuple[str, ...] = ()
+    min_confidence: Optional[float] = None
+    confidence_field: str = "confidence"
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> Optional["CascadePolicy"]:
+        if not config:
+            return None
+        models = config.get("models")
+        if not models or isinstance(models, str):
+            raise ValueError("cascade.models must be a non-empty list of models")
+        return cls(**{**config, "models": tuple(models), "required_fields": tuple(config.get("required_fields", ()))})
+
+    def rejection(self, output: Any) -> Optional[str]:
+        """Motif de rejet de la réponse, ou None si elle est acceptée"""
+        if not isinstance(output, dict) or output.get("error") == "parsing_failed":
+            return "parse_failure"
+        if any(field not in output for field in self.required_fields):
+            return "missing_field"
+        if self.min_confidence is not None:
+            try:
+                confidence = float(output[self.confidence_field])
+            except (KeyError, TypeError, ValueError):
+                return "low_confidence"
+            if confidence < self.min_confidence:
+                return "low_confidence"
+        return None
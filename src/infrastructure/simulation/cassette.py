@@ -0,0 +1,170 @@
+import asyncio
+import copy
+import json
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import IO, Any, AsyncIterator, Dict, List, Optional
+
+from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter, ModelResponse
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.models.wrapper import WrapperModel
+from pydantic_ai.settings import ModelSettings
+
+from ..resilience.model_health import model_key
+from .model_exchange import request_fingerprint
+from .simulated_model import ScriptedStreamedResponse, response_chunks
+
+
+class CassetteMissError(LookupError):
+    """Requête au modèle absente de la cassette rejouée"""
+
+
+class Cassette:
+    """Échanges avec les modèles enregistrés dans un fichier JSONL, puis rejoués sans réseau.
+
+    En `record`, chaque réponse du modèle réel est ajoutée au fichier avec l'empreinte de sa
+    requête. En `replay`, une requête reçoit la réponse enregistrée pour la même empreinte
+    (contenu, consommation et horodatage identiques) ; les réponses d'une même requête sont
+    rejouées dans l'ordre puis en boucle, si bien qu'une exécution enregistrée peut être rejouée
+    par un nombre quelconque d'exécutions concurrentes. `replay_latency` reproduit la durée
+    mesurée de chaque appel.
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, path: str, mode: str = "replay", replay_latency: bool = False, chunk_chars: int = 16):
+        if mode not in self.MODES:
+            raise ValueError(f"Cassette mode '{mode}' not supported, expected one of {self.MODES}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.chunk_chars = chunk_chars
+        self.recorded = 0
+        self.replayed = 0
+        self._file: Optional[IO[str]] = None
+        # Réponses enregistrées par empreinte de requête, et prochaine réponse à rejouer
+        self._responses: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._positions: Dict[str, int] = defaultdict(int)
+        if mode == "replay":
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def wrap(self, model: Any, name: Optional[str] = None) -> Model:
+        """Modèle qui enregistre ses échanges, ou qui les rejoue (sans construire le modèle réel)"""
+        name = name or model_key(model)
+        if self.recording:
+            return RecordingModel(model, self, name)
+        return ReplayModel(name, self)
+
+    def record(self, fingerprint: str, model_name: str, response: ModelResponse, elapsed_s: float) -> None:
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+        entry = {
+            "request": fingerprint,
+            "model": model_name,
+            "elapsed_s": round(elapsed_s, 6),
+            "response": ModelMessagesTypeAdapter.dump_python([response], mode="json")[0],
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.recorded += 1
+
+    def replay(self, fingerprint: str, model_name: str) -> Dict[str, Any]:
+        """Prochaine réponse enregistrée pour la requête : {"response": ModelResponse, "elapsed_s": ...}"""
+        responses = self._responses.get(fingerprint)
+        if not responses:
+            raise CassetteMissError(f"No recorded response in cassette '{self.path}' for request {fingerprint} to {model_name}")
+        position = self._positions[fingerprint]
+        self._positions[fingerprint] = position + 1
+        self.replayed += 1
+        entry = responses[position % len(responses)]
+        # Copie : l'historique de l'exécution ne doit pas partager les parts d'une autre
+        return {"response": copy.deepcopy(entry["response"]), "elapsed_s": entry["elapsed_s"]}
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = ModelMessagesTypeAdapter.validate_python([entry["response"]])[0]
+                self._responses[entry["request"]].append({"response": response, "elapsed_s": entry.get("elapsed_s", 0.0)})
+
+
+class RecordingModel(WrapperModel):
+    """Modèle réel dont les réponses (streamées ou non) sont ajoutées à la cassette"""
+
+    def __init__(self, wrapped: Any, cassette: Cassette, name: str):
+        super().__init__(wrapped)
+        self.cassette = cassette
+        self.name = name
+
+    async def request(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> ModelResponse:
+        started_at = time.perf_counter()
+        response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+        fingerprint = request_fingerprint(self.name, messages, model_request_parameters)
+        self.cassette.record(fingerprint, self.name, response, time.perf_counter() - started_at)
+        return response
+
+    @asynccontextmanager
+    async def request_stream(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> AsyncIterator[StreamedResponse]:
+        started_at = time.perf_counter()
+        async with self.wrapped.request_stream(messages, model_settings, model_request_parameters) as stream:
+            yield stream
+        # Le stream a été consommé : sa réponse est complète
+        fingerprint = request_fingerprint(self.name, messages, model_request_parameters)
+        self.cassette.record(fingerprint, self.name, stream.get(), time.perf_counter() - started_at)
+
+
+class ReplayModel(Model):
+    """Modèle qui répond à partir de la cassette, sans réseau ni clé d'API"""
+
+    def __init__(self, name: str, cassette: Cassette):
+        self.name = name
+        self.cassette = cassette
+
+    @property
+    def model_name(self) -> str:
+        return self.name
+
+    @property
+    def system(self) -> str:
+        return "replay"
+
+    async def request(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> ModelResponse:
+        entry = await self._replay(messages, model_request_parameters)
+        return entry["response"]
+
+    @asynccontextmanager
+    async def request_stream(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> AsyncIterator[StreamedResponse]:
+        entry = await self._replay(messages, model_request_parameters)
+        response: ModelResponse = entry["response"]
+        yield ScriptedStreamedResponse(
+            response.model_name or self.name,
+            response_chunks(response.parts, self.cassette.chunk_chars),
+            response.usage,
+            _timestamp=response.timestamp,
+        )
+
+    async def _replay(self, messages: List[ModelMessage], parameters: ModelRequestParameters) -> Dict[str, Any]:
+        entry = self.cassette.replay(request_fingerprint(self.name, messages, parameters), self.name)
+        if self.cassette.replay_latency:
+            await asyncio.sleep(entry["elapsed_s"])
+        return entry
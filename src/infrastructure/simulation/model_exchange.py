@@ -0,0 +1,77 @@
+import hashlib
+import json
+from typing import Any, List, Optional
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    RetryPromptPart,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import ModelRequestParameters
+
+from ...core.token_counter import TokenCounter
+
+
+def request_fingerprint(model_name: str, messages: List[ModelMessage], parameters: ModelRequestParameters) -> str:
+    """Empreinte stable d'une requête au modèle : modèle, outils et contenu des messages.
+
+    Les horodatages, identifiants d'appels d'outils et retours d'outils sont ignorés : ils changent
+    d'une exécution à l'autre (heure courante, réponses réseau) sans changer la requête rejouée.
+    """
+    canonical: List[Any] = [
+        model_name,
+        sorted(tool.name for tool in parameters.function_tools),
+        sorted(tool.name for tool in parameters.output_tools),
+    ]
+    for message in messages:
+        for part in message.parts:
+            if isinstance(part, (SystemPromptPart, UserPromptPart, TextPart)):
+                canonical.append((part.part_kind, part.content))
+            elif isinstance(part, ToolCallPart):
+                canonical.append((part.part_kind, part.tool_name, part.args_as_json_str()))
+            elif isinstance(part, ToolReturnPart):
+                canonical.append((part.part_kind, part.tool_name))
+            elif isinstance(part, RetryPromptPart):
+                canonical.append((part.part_kind, part.tool_name, part.model_response()))
+    payload = json.dumps(canonical, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def last_prompt(messages: List[ModelMessage]) -> str:
+    """Dernier prompt utilisateur de la conversation"""
+    for message in reversed(messages):
+        if isinstance(message, ModelRequest):
+            for part in reversed(message.parts):
+                if isinstance(part, UserPromptPart):
+                    return part.content if isinstance(part.content, str) else str(part.content)
+    return ""
+
+
+def system_prompt(messages: List[ModelMessage]) -> Optional[str]:
+    for message in messages:
+        if isinstance(message, ModelRequest):
+            for part in message.parts:
+                if isinstance(part, SystemPromptPart):
+                    return part.content
+    return None
+
+
+def count_tokens(messages: List[ModelMessage]) -> int:
+    """Tokens estimés du contenu des messages (prompts, réponses, appels et retours d'outils)"""
+    tokens = 0
+    for message in messages:
+        for part in message.parts:
+            if isinstance(part, (SystemPromptPart, UserPromptPart, TextPart)):
+                tokens += TokenCounter.count_value(part.content)
+            elif isinstance(part, ToolCallPart):
+                tokens += TokenCounter.count(part.args_as_json_str())
+            elif isinstance(part, ToolReturnPart):
+                tokens += TokenCounter.count(part.model_response_str())
+            elif isinstance(part, RetryPromptPart):
+                tokens += TokenCounter.count(part.model_response())
+    return tokens
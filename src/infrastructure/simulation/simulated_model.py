@@ -0,0 +1,309 @@
+import asyncio
+import json
+import random
+import re
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
+
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelMessage, ModelResponse, ModelResponsePart, ModelResponseStreamEvent, TextPart, ToolCallPart
+from pydantic_ai.models import Model, ModelRequestParameters, StreamedResponse
+from pydantic_ai.settings import ModelSettings
+from pydantic_ai.tools import ToolDefinition
+from pydantic_ai.usage import Usage
+
+from ...core.run_context import current_run_id
+from ...core.token_counter import TokenCounter, compact_json
+from .model_exchange import count_tokens, last_prompt, request_fingerprint, system_prompt
+from .simulation_profile import SimulationProfile
+
+_JSON_DECODER = json.JSONDecoder()
+# Membre "clé": valeur d'un exemple de réponse, une ligne par membre
+_EXAMPLE_MEMBER = re.compile(r'^\s*"(\w+)"\s*:\s*(.+?),?\s*$', re.MULTILINE)
+
+_WORDS = (
+    "analyse", "réponse", "modèle", "simulé", "agent", "workflow", "contenu", "résultat", "étape", "données",
+    "proposition", "synthèse", "contexte", "objectif", "critère", "version", "détail", "exemple", "point", "suite",
+)  # fmt: skip
+
+
+@dataclass(slots=True)
+class _RunCalls:
+    """Appels reçus pendant une exécution : rang de l'appel et occurrences de chaque requête"""
+
+    calls: int = 0
+    seen: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ScriptedStreamedResponse(StreamedResponse):
+    """Réponse streamée à partir de fragments connus d'avance, émis à intervalle régulier"""
+
+    _model_name: str
+    _chunks: List[Tuple[int, ModelResponsePart, Any]]
+    _final_usage: Usage
+    _interval_s: float = 0.0
+    _timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
+        started = set()
+        for position, (index, part, delta) in enumerate(self._chunks):
+            if self._interval_s and position:
+                await asyncio.sleep(self._interval_s)
+            if isinstance(part, TextPart):
+                yield self._parts_manager.handle_text_delta(vendor_part_id=index, content=delta)
+                continue
+            if not isinstance(delta, str):
+                yield self._parts_manager.handle_tool_call_part(
+                    vendor_part_id=index, tool_name=part.tool_name, args=delta, tool_call_id=part.tool_call_id
+                )
+                continue
+            # Le nom et l'identifiant de l'appel d'outil arrivent avec son premier fragment
+            first = index not in started
+            started.add(index)
+            event = self._parts_manager.handle_tool_call_delta(
+                vendor_part_id=index,
+                tool_name=part.tool_name if first else None,
+                args=delta,
+                tool_call_id=part.tool_call_id if first else None,
+            )
+            if event is not None:
+                yield event
+        self._usage = self._final_usage
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+
+def response_chunks(parts: List[ModelResponsePart], chunk_chars: int) -> List[Tuple[int, ModelResponsePart, Any]]:
+    """Découpe les parts d'une réponse en fragments de streaming (index de la part, part, fragment)"""
+    chunks: List[Tuple[int, ModelResponsePart, Any]] = []
+    for index, part in enumerate(parts):
+        if isinstance(part, TextPart):
+            text = part.content
+        elif isinstance(part, ToolCallPart) and isinstance(part.args, str):
+            text = part.args
+        elif isinstance(part, ToolCallPart):
+            # Arguments déjà décodés : transmis d'un bloc
+            chunks.append((index, part, part.args))
+            continue
+        else:
+            continue
+        for start in range(0, max(len(text), 1), chunk_chars):
+            chunks.append((index, part, text[start : start + chunk_chars]))
+    return chunks
+
+
+class SimulatedModel(Model):
+    """Modèle local et déterministe ("sim:<nom>"), sans réseau ni clé d'API.
+
+    Le comportement (réponses, latence, streaming, appels d'outils, défaillances) est décrit par
+    un SimulationProfile. Le tirage aléatoire d'un appel dépend de la graine, du contenu de la
+    requête et du nombre de fois où elle a déjà été vue dans l'exécution courante (`run_scope`
+    ouvert par l'exécuteur) : deux exécutions identiques produisent les mêmes réponses, y compris
+    en parallèle et quel que soit le nombre d'exécutions passées par le même modèle.
+    """
+
+    PREFIX = "sim:"
+    # Exécutions dont les appels sont suivis (les plus anciennes sont oubliées)
+    max_runs = 4096
+
+    def __init__(self, name: str, profile: Optional[SimulationProfile] = None):
+        self._model_name = name
+        self.simulation = profile or SimulationProfile()
+        # Par run_id (None hors exécution de workflow)
+        self._runs: "OrderedDict[Optional[str], _RunCalls]" = OrderedDict()
+
+    @classmethod
+    def handles(cls, model: Any) -> bool:
+        return isinstance(model, str) and model.startswith(cls.PREFIX)
+
+    @classmethod
+    def from_config(cls, model: str, config: Optional[Mapping[str, Any]] = None) -> "SimulatedModel":
+        return cls(model, SimulationProfile.from_config(config))
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def system(self) -> str:
+        return "simulation"
+
+    async def request(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> ModelResponse:
+        rng, parts = self._respond(messages, model_request_parameters)
+        await self._wait(rng)
+        return ModelResponse(parts=parts, model_name=self._model_name, usage=self._usage(messages, parts))
+
+    @asynccontextmanager
+    async def request_stream(
+        self, messages: List[ModelMessage], model_settings: Optional[ModelSettings], model_request_parameters: ModelRequestParameters
+    ) -> AsyncIterator[StreamedResponse]:
+        rng, parts = self._respond(messages, model_request_parameters)
+        await self._wait(rng)
+        simulation = self.simulation
+        yield ScriptedStreamedResponse(
+            self._model_name,
+            response_chunks(parts, simulation.chunk_chars),
+            self._usage(messages, parts),
+            1 / simulation.chunks_per_s if simulation.chunks_per_s else 0.0,
+        )
+
+    async def _wait(self, rng: random.Random) -> None:
+        """Latence de la réponse, puis défaillance éventuelle"""
+        simulation = self.simulation
+        await asyncio.sleep(simulation.latency.sample(rng))
+        if simulation.failure_rate and rng.random() < simulation.failure_rate:
+            if simulation.failure == "hang":
+                await asyncio.Event().wait()
+            if simulation.failure == "timeout":
+                raise asyncio.TimeoutError(f"simulated timeout of {self._model_name}")
+            if simulation.failure_status_code is not None:
+                raise ModelHTTPError(simulation.failure_status_code, self._model_name, {"error": "simulated failure"})
+
+    def _respond(self, messages: List[ModelMessage], parameters: ModelRequestParameters) -> Tuple[random.Random, List[ModelResponsePart]]:
+        fingerprint = request_fingerprint(self._model_name, messages, parameters)
+        run = self._run_calls()
+        occurrence = run.seen.get(fingerprint, 0)
+        run.seen[fingerprint] = occurrence + 1
+        rng = random.Random(f"{self.simulation.seed}:{fingerprint}:{occurrence}")
+        call = run.calls
+        run.calls += 1
+
+        simulation = self.simulation
+        if simulation.failure == "invalid_output" and simulation.failure_rate and rng.random() < simulation.failure_rate:
+            return rng, [TextPart("<simulated invalid output>")]
+
+        tool_calls = self._tool_calls(messages, parameters.function_tools)
+        if tool_calls:
+            return rng, tool_calls
+
+        value = self._scripted(last_prompt(messages), call)
+        if parameters.output_tools:
+            output_tool = parameters.output_tools[0]
+            if isinstance(value, str):
+                value = _json_object(value)
+            if not isinstance(value, dict):
+                value = _example(output_tool.parameters_json_schema, _prompt_example(system_prompt(messages)))
+            return rng, [ToolCallPart(output_tool.name, value, tool_call_id=f"sim-output-{call}")]
+
+        if value is None:
+            value = _prompt_example(system_prompt(messages))
+        if value is None:
+            value = " ".join(rng.choice(_WORDS) for _ in range(simulation.response_tokens))
+        return rng, [TextPart(value if isinstance(value, str) else compact_json(value))]
+
+    def _run_calls(self) -> _RunCalls:
+        run_id = current_run_id()
+        run = self._runs.get(run_id)
+        if run is None:
+            run = self._runs[run_id] = _RunCalls()
+            if len(self._runs) > self.max_runs:
+                self._runs.popitem(last=False)
+        else:
+            self._runs.move_to_end(run_id)
+        return run
+
+    def _scripted(self, prompt: str, call: int) -> Any:
+        for rule in self.simulation.rules:
+            if re.search(rule["match"], prompt):
+                return rule["response"]
+        responses = self.simulation.responses
+        return responses[call % len(responses)] if responses else None
+
+    def _tool_calls(self, messages: List[ModelMessage], tools: List[ToolDefinition]) -> List[ModelResponsePart]:
+        """Appels d'outils de la première requête de la conversation"""
+        wanted = self.simulation.tool_calls
+        if not wanted or any(part.part_kind == "tool-return" for message in messages for part in message.parts):
+            return []
+        return [
+            ToolCallPart(tool.name, _example(tool.parameters_json_schema), tool_call_id=f"sim-tool-{index}")
+            for index, tool in enumerate(tools)
+            if wanted == "all" or tool.name in wanted
+        ]
+
+    def _usage(self, messages: List[ModelMessage], parts: List[ModelResponsePart]) -> Usage:
+        request_tokens = count_tokens(messages)
+        response_tokens = sum(
+            TokenCounter.count(part.content if isinstance(part, TextPart) else part.args_as_json_str()) for part in parts
+        )
+        return Usage(requests=1, request_tokens=request_tokens, response_tokens=response_tokens, total_tokens=request_tokens + response_tokens)
+
+
+def _json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Premier objet JSON du texte (réponse d'exemple d'un prompt système)"""
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            value = None
+        if isinstance(value, dict):
+            return value
+        start = text.find("{", start + 1)
+    return None
+
+
+def _prompt_example(prompt: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Réponse d'exemple d'un prompt système : objet JSON, ou gabarit ("approved": true/false, "score": 0-100)"""
+    if not prompt:
+        return None
+    example = _json_object(prompt)
+    if example is not None:
+        return example
+    start, end = prompt.find("{"), prompt.rfind("}")
+    if start == -1 or end < start:
+        return None
+    # Première alternative de chaque valeur du gabarit
+    example = {key: _template_value(value) for key, value in _EXAMPLE_MEMBER.findall(prompt[start + 1 : end])}
+    return example or None
+
+
+def _template_value(text: str) -> Any:
+    for candidate in (text, text.split("/")[0], text.split("-")[0]):
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return text.strip('"<> ')
+
+
+def _example(schema: Mapping[str, Any], hint: Any = None, name: str = "value", root: Optional[Mapping[str, Any]] = None) -> Any:
+    """Valeur conforme au schéma JSON, reprise de `hint` quand il a le bon type"""
+    root = root or schema
+    if "$ref" in schema:
+        schema = root.get("$defs", {}).get(schema["$ref"].rsplit("/", 1)[-1], {})
+    if "anyOf" in schema:
+        # Champ optionnel : sa valeur par défaut, sinon une valeur du premier type non nul
+        if hint is None and "default" in schema:
+            return schema["default"]
+        variant = next((variant for variant in schema["anyOf"] if variant.get("type") != "null"), {})
+        return _example(variant, hint, name, root)
+
+    if "enum" in schema:
+        return hint if hint in schema["enum"] else schema["enum"][0]
+    schema_type = schema.get("type")
+    if schema_type == "object" or "properties" in schema:
+        hints = hint if isinstance(hint, dict) else {}
+        return {key: _example(value, hints.get(key), key, root) for key, value in schema.get("properties", {}).items()}
+    if schema_type == "array":
+        return hint if isinstance(hint, list) else [_example(schema.get("items", {}), None, name, root)]
+    if schema_type == "boolean":
+        return hint if isinstance(hint, bool) else True
+    if schema_type == "integer":
+        return hint if isinstance(hint, int) and not isinstance(hint, bool) else 1
+    if schema_type == "number":
+        return hint if isinstance(hint, (int, float)) and not isinstance(hint, bool) else 1.0
+    if schema_type == "string":
+        return hint if isinstance(hint, str) else f"simulated {name}"
+    return hint if hint is not None else schema.get("default")
@@ -0,0 +1,35 @@
+import copy
+from typing import Any, Dict, Mapping, Optional
+
+from ..resilience.model_health import model_key
+from .simulated_model import SimulatedModel
+
+# Nœuds exécutés sans agent (cf. AGENTLESS_NODE_TYPES)
+_AGENTLESS_TYPES = frozenset({"end", "sync", "map", "parallel"})
+_DEFAULT_MODEL = "openai:gpt-4o-mini"
+
+
+def simulate_workflow(json_definition: Mapping[str, Any], simulation: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Copie de la définition dont tous les modèles (repli et cascade compris) sont simulés.
+
+    "openai:gpt-4o-mini" devient "sim:openai:gpt-4o-mini" : les quotas et métriques par modèle
+    restent lisibles. `simulation` complète le profil de simulation déclaré par chaque nœud.
+    """
+    definition = copy.deepcopy(dict(json_definition))
+    for node in definition.get("nodes", ()):
+        config = node.get("agent_config")
+        if node.get("type") in _AGENTLESS_TYPES or not config:
+            continue
+        config["model"] = _simulated(config.get("model", _DEFAULT_MODEL))
+        if config.get("fallback_model"):
+            config["fallback_model"] = _simulated(config["fallback_model"])
+        if config.get("cascade"):
+            config["cascade"] = {**config["cascade"], "models": [_simulated(model) for model in config["cascade"]["models"]]}
+        if simulation:
+            config["simulation"] = {**simulation, **config.get("simulation", {})}
+    return definition
+
+
+def _simulated(model: Any) -> str:
+    name = model_key(model)
+    return name if SimulatedModel.handles(name) else f"{SimulatedModel.PREFIX}{name}"
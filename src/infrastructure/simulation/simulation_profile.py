@@ -0,0 +1,102 @@
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple, Union
+
+# Défaillances injectables : "http_<code>" (ModelHTTPError), "timeout", "invalid_output", "hang"
+FAILURE_KINDS = ("timeout", "invalid_output", "hang")
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyDistribution:
+    """Distribution du délai avant la réponse (ou son premier fragment), en secondes.
+
+    - `fixed` : `s` ;
+    - `uniform` : entre `min_s` et `max_s` ;
+    - `normal` : `mean_s` et `stddev_s` (tronquée à 0) ;
+    - `lognormal` : médiane `median_s` et écart type du logarithme `sigma` (queue longue des fournisseurs).
+    """
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    distribution: str = "fixed"
+    s: float = 0.0
+    min_s: float = 0.0
+    max_s: float = 0.0
+    mean_s: float = 0.0
+    stddev_s: float = 0.0
+    median_s: float = 0.0
+    sigma: float = 0.0
+
+    @classmethod
+    def from_config(cls, config: Union[None, float, Mapping[str, Any]]) -> "LatencyDistribution":
+        if config is None:
+            return cls()
+        if isinstance(config, (int, float)):
+            return cls(s=float(config))
+        latency = cls(**config)
+        if latency.distribution not in cls.DISTRIBUTIONS:
+            raise ValueError(f"latency distribution '{latency.distribution}' not supported, expected one of {cls.DISTRIBUTIONS}")
+        return latency
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            return rng.uniform(self.min_s, self.max_s)
+        if self.distribution == "normal":
+            return max(0.0, rng.gauss(self.mean_s, self.stddev_s))
+        if self.distribution == "lognormal":
+            return self.median_s * math.exp(rng.gauss(0.0, self.sigma)) if self.median_s > 0 else 0.0
+        return self.s
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationProfile:
+    """Comportement d'un modèle simulé ("sim:...") : réponses, latence, streaming, outils et défaillances.
+
+    Les réponses viennent, dans l'ordre de priorité, de la première règle (`rules`) dont le motif
+    apparaît dans le dernier prompt, de la liste `responses` (parcourue en boucle, dans l'ordre des
+    appels de l'exécution), ou sont générées : arguments conformes au schéma de sortie typée, objet JSON d'exemple
+    du prompt système pour un nœud de décision, texte de `response_tokens` mots sinon.
+    """
+
+    latency: LatencyDistribution = LatencyDistribution()
+    # Streaming : taille des fragments et débit (None : fragments émis sans délai)
+    chunk_chars: int = 16
+    chunks_per_s: Optional[float] = None
+    responses: Tuple[Any, ...] = ()
+    rules: Tuple[Mapping[str, Any], ...] = ()
+    response_tokens: int = 40
+    # Outils appelés (une fois, avant la réponse) : noms, ou "all" pour tous les outils du nœud
+    tool_calls: Union[str, Tuple[str, ...]] = ()
+    failure_rate: float = 0.0
+    failure: str = "http_503"
+    seed: int = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> "SimulationProfile":
+        if not config:
+            return cls()
+        tool_calls = config.get("tool_calls", ())
+        profile = cls(
+            **{
+                **config,
+                "latency": LatencyDistribution.from_config(config.get("latency")),
+                "responses": tuple(config.get("responses", ())),
+                "rules": tuple(config.get("rules", ())),
+                "tool_calls": tool_calls if isinstance(tool_calls, str) else tuple(tool_calls),
+            }
+        )
+        if not 0.0 <= profile.failure_rate <= 1.0:
+            raise ValueError("simulation.failure_rate must be between 0 and 1")
+        if profile.failure not in FAILURE_KINDS and not profile.failure_status_code:
+            raise ValueError(f"simulation.failure '{profile.failure}' not supported, expected http_<code> or one of {FAILURE_KINDS}")
+        if profile.chunk_chars < 1 or (profile.chunks_per_s is not None and profile.chunks_per_s <= 0):
+            raise ValueError("simulation.chunk_chars must be >= 1 and chunks_per_s > 0")
+        if any("match" not in rule or "response" not in rule for rule in profile.rules):
+            raise ValueError("simulation.rules entries require 'match' and 'response'")
+        return profile
+
+    @property
+    def failure_status_code(self) -> Optional[int]:
+        prefix, _, code = self.failure.partition("_")
+        return int(code) if prefix == "http" and code.isdigit() else None
@@ -3,6 +3,10 @@ from pathlib import Path
 
 import httpx
 
+from ..logs.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 def register_base_tools(registry):
     """Enregistre les outils système de base"""
@@ -45,6 +49,7 @@ def register_base_tools(registry):
         """Returns the current date and time"""
         from datetime import datetime
 
-        print(f"   [BaseTools] 🕒 Current time tool registered: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}")
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        logger.debug("   [BaseTools] 🕒 Current time: %s", now)
 
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return now
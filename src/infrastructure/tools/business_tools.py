@@ -1,6 +1,10 @@
 import re
 from datetime import datetime
 
+from ..logs.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 def register_business_tools(registry):
     """Enregistre les outils métier génériques"""
@@ -17,7 +21,7 @@ def register_business_tools(registry):
         """Compte les mots dans un texte"""
         words = len(text.split())
         chars = len(text)
-        print(f"   [BusinessTools] 📝 Nombre de mots: {words}, Nombre de caractères: {chars}")
+        logger.debug("   [BusinessTools] 📝 Nombre de mots: %d, Nombre de caractères: %d", words, chars)
         return f"Mots: {words}, Caractères: {chars}"
 
     @registry.register_tool("current_time", "Retourne la date et heure actuelles")
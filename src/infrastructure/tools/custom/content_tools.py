@@ -1,3 +1,8 @@
+from ...logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
 def register_content_tools(registry):
     """Outils spécifiques à la création de contenu"""
 
@@ -27,7 +32,7 @@ def register_content_tools(registry):
         if len([s for s in text.split(".") if len(s.strip()) > 100]) == 0:
             issues.append("Phrases trop courtes ou trop longues")
 
-        print(f"   [ContentTools] 📝 Vérification grammaticale: {len(issues)} problèmes détectés")
+        logger.debug("   [ContentTools] 📝 Vérification grammaticale: %d problèmes détectés", len(issues))
 
         return f"Issues trouvées: {'; '.join(issues) if issues else 'Aucune'}"
 
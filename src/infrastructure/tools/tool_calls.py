@@ -0,0 +1,86 @@
+import asyncio
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional, Set
+
+from ..tracing.span import Span, current_span
+from ..tracing.tracer import use_span
+
+# Appels d'outils async en cours pour l'exécution d'agent courante
+_running_tool_calls: ContextVar[Optional[Set[asyncio.Task]]] = ContextVar("running_tool_calls", default=None)
+
+
+def cancellable(func: Callable) -> Callable:
+    """Rattache chaque appel d'un outil async à l'exécution d'agent qui l'a déclenché.
+
+    pydantic-ai exécute les outils dans des tâches séparées qu'il n'annule pas quand
+    l'exécution de l'agent est interrompue ; elles sont annulées par `cancel_tool_calls_on_exit`.
+    Les outils synchrones tournent dans un thread et ne peuvent pas être interrompus.
+    """
+    if not inspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        running = _running_tool_calls.get()
+        task = asyncio.current_task()
+        if running is None or task is None:
+            return await func(*args, **kwargs)
+
+        running.add(task)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            running.discard(task)
+
+    return wrapper
+
+
+def traced(tool_name: str, func: Callable) -> Callable:
+    """Trace chaque appel de l'outil dans un span `tool.call`, enfant du span actif.
+
+    Sans span actif (tracing désactivé), l'appel est direct.
+    """
+
+    def start_span(kwargs) -> Optional[Span]:
+        parent = current_span()
+        if parent is None:
+            return None
+        return parent.child("tool.call", {"tool.name": tool_name, "tool.args": sorted(kwargs)})
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            span = start_span(kwargs)
+            if span is None:
+                return await func(*args, **kwargs)
+            with use_span(span):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        span = start_span(kwargs)
+        if span is None:
+            return func(*args, **kwargs)
+        with use_span(span):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def cancel_tool_calls_on_exit():
+    """Annule les appels d'outils encore en cours à la sortie du bloc (timeout, annulation, erreur)"""
+    running: Set[asyncio.Task] = set()
+    token = _running_tool_calls.set(running)
+    try:
+        yield
+    finally:
+        _running_tool_calls.reset(token)
+        for task in running:
+            task.cancel()
@@ -2,10 +2,14 @@ from typing import Dict, List
 
 from pydantic_ai.tools import Tool
 
+from ..logs.logger import get_logger
 from .base_tools import register_base_tools
 from .business_tools import register_business_tools
+from .tool_calls import cancellable, traced
 from .custom.content_tools import register_content_tools
 
+logger = get_logger(__name__)
+
 
 class ToolRegistry:
     """Registre centralisé des outils disponibles"""
@@ -29,7 +33,7 @@ class ToolRegistry:
         """Décorateur pour enregistrer un outil"""
 
         def decorator(func):
-            tool = Tool(func, description=description)
+            tool = Tool(cancellable(traced(name, func)), description=description)
             self._tools[name] = tool
             return func
 
@@ -42,7 +46,7 @@ class ToolRegistry:
             if name in self._tools:
                 tools.append(self._tools[name])
             else:
-                print(f"⚠️  Outil '{name}' non trouvé dans le registre")
+                logger.warning("⚠️  Outil '%s' non trouvé dans le registre", name)
         return tools
 
     def list_available_tools(self) -> Dict[str, str]:
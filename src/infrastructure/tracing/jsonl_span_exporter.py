@@ -0,0 +1,26 @@
+import json
+
+from ...domain.interfaces.i_span_exporter import ISpanExporter
+from .span import Span
+
+
+class JsonlSpanExporter(ISpanExporter):
+    """Ajoute chaque span terminé comme une ligne JSON dans un fichier.
+
+    Les écritures passent par le tampon du fichier : appeler `flush()` ou `close()` pour
+    les rendre visibles. Les attributs non sérialisables sont écrits sous forme de chaîne.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    async def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
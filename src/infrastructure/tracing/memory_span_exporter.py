@@ -0,0 +1,23 @@
+from collections import deque
+from typing import Deque, List, Optional
+
+from ...domain.interfaces.i_span_exporter import ISpanExporter
+from .span import Span
+
+
+class MemorySpanExporter(ISpanExporter):
+    """Conserve les spans terminés en mémoire (les plus récents avec `max_spans`)"""
+
+    def __init__(self, max_spans: Optional[int] = None):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def get_finished_spans(self, trace_id: Optional[int] = None) -> List[Span]:
+        if trace_id is None:
+            return list(self._spans)
+        return [span for span in self._spans if span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self._spans.clear()
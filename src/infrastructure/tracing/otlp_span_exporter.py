@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
+
+from ...domain.interfaces.i_span_exporter import ISpanExporter
+from .span import Span
+
+
+class OtlpSpanExporter(ISpanExporter):
+    """Adaptateur vers un collecteur OpenTelemetry (OTLP/HTTP).
+
+    Dépendances optionnelles : `opentelemetry-sdk` et `opentelemetry-exporter-otlp-proto-http`.
+    Les spans sont convertis en conservant leurs identifiants et envoyés par lots dans un
+    thread dédié, hors de la boucle d'événements. `exporter` accepte tout SpanExporter du SDK.
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        service_name: str = "dynamic-agent-workflows",
+        batch_size: int = 128,
+        exporter: Any = None,
+    ):
+        try:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import Event, ReadableSpan
+            from opentelemetry.trace import SpanContext, Status, StatusCode, TraceFlags
+        except ImportError as error:
+            raise ImportError("OtlpSpanExporter requires the 'opentelemetry-sdk' package") from error
+
+        if exporter is None:
+            try:
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            except ImportError as error:
+                raise ImportError("OtlpSpanExporter requires the 'opentelemetry-exporter-otlp-proto-http' package") from error
+            exporter = OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
+
+        self._readable_span = ReadableSpan
+        self._event = Event
+        self._span_context = SpanContext
+        self._status = Status
+        self._status_code = StatusCode
+        self._sampled = TraceFlags(TraceFlags.SAMPLED)
+        self._resource = Resource.create({"service.name": service_name})
+        self._exporter = exporter
+        self.batch_size = batch_size
+        self._batch: List[Any] = []
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="otlp-export")
+
+    def export(self, span: Span) -> None:
+        self._batch.append(self._convert(span))
+        if len(self._batch) >= self.batch_size:
+            self._send()
+
+    def _convert(self, span: Span) -> Any:
+        parent = None
+        if span.parent_id is not None:
+            parent = self._span_context(span.trace_id, span.parent_id, is_remote=False, trace_flags=self._sampled)
+        if span.status == "error":
+            status = self._status(self._status_code.ERROR, span.error)
+        else:
+            status = self._status(self._status_code.OK)
+        return self._readable_span(
+            name=span.name,
+            context=self._span_context(span.trace_id, span.span_id, is_remote=False, trace_flags=self._sampled),
+            parent=parent,
+            resource=self._resource,
+            attributes=self._attributes(span.attributes),
+            events=[self._event(event["name"], self._attributes(event["attributes"]), event["timestamp_ns"]) for event in span.events],
+            start_time=span.start_ns,
+            end_time=span.end_ns,
+            status=status,
+        )
+
+    @staticmethod
+    def _attributes(attributes: dict) -> dict:
+        # OTLP n'accepte que des valeurs primitives
+        return {key: value if isinstance(value, (str, bool, int, float)) else str(value) for key, value in attributes.items()}
+
+    def _send(self) -> Any:
+        batch, self._batch = self._batch, []
+        return self._pool.submit(self._exporter.export, batch)
+
+    async def close(self) -> None:
+        if self._batch:
+            await asyncio.wrap_future(self._send())
+        await asyncio.to_thread(self._pool.shutdown)
+        self._exporter.shutdown()
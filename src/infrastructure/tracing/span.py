@@ -0,0 +1,77 @@
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+# Span actif de la tâche courante ; None quand le tracing est désactivé
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional["Span"]:
+    return _current_span.get()
+
+
+class Span:
+    """Opération chronométrée d'une trace, sur le modèle des spans OpenTelemetry.
+
+    Les identifiants sont des entiers (128 bits pour la trace, 64 bits pour le span) et les
+    horodatages des nanosecondes depuis l'epoch.
+    """
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "events", "status", "error")
+
+    def __init__(self, tracer: Any, name: str, parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else random.getrandbits(128)
+        self.span_id = random.getrandbits(64)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes if attributes is not None else {}
+        self.events: List[Dict[str, Any]] = []
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    @property
+    def duration_s(self) -> Optional[float]:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def child(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> "Span":
+        """Démarre un span enfant (sans l'activer)"""
+        return Span(self.tracer, name, self, attributes)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> None:
+        self.events.append({"name": name, "timestamp_ns": time.time_ns(), "attributes": attributes or {}})
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_id": f"{self.parent_id:016x}" if self.parent_id is not None else None,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_s": self.duration_s,
+            "attributes": self.attributes,
+            "events": self.events,
+            "status": self.status,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, span_id={self.span_id:016x}, status={self.status!r})"
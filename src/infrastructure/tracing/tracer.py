@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from ...domain.interfaces.i_span_exporter import ISpanExporter
+from .span import Span, _current_span, current_span
+
+
+@contextmanager
+def use_span(span: Span) -> Iterator[Span]:
+    """Active le span pour le bloc (les spans créés dedans en deviennent les enfants), puis le termine.
+
+    Une exception qui traverse le bloc marque le span en erreur.
+    """
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as error:
+        span.record_error(error)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+class Tracer:
+    """Crée les spans d'une exécution et transmet les spans terminés à l'exporteur.
+
+    Le parent d'un nouveau span est le span actif de la tâche courante : les agents et les
+    outils, qui ne connaissent pas le Tracer, créent leurs spans enfants via `current_span()`.
+    """
+
+    def __init__(self, exporter: ISpanExporter):
+        self.exporter = exporter
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Span:
+        return Span(self, name, current_span(), attributes)
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        """Context manager : crée, active et termine un span enfant du span actif"""
+        return use_span(self.start_span(name, attributes))
+
+    def export(self, span: Span) -> None:
+        self.exporter.export(span)
+
+    async def close(self) -> None:
+        await self.exporter.close()
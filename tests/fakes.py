@@ -0,0 +1,108 @@
+"""Agents et fabrique d'agents de test : l'exécuteur tourne sans modèle"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Union
+from unittest import mock
+
+from src.core.compiled_workflow import CompiledNode, CompiledWorkflow
+from src.domain.entities.workflow_definition import WorkflowDefinition
+from src.domain.interfaces.i_agent import IAgent
+from src.domain.interfaces.i_agent_observer import IAgentObserver
+from src.infrastructure.executors.workflow_executor import WorkflowExecutor
+from src.infrastructure.resilience.rate_limiter import RateLimiterRegistry
+
+# Sortie fixe, ou calculée à partir de l'entrée du nœud
+Response = Union[Any, Callable[[Any], Any]]
+Delay = Union[float, Callable[[Any], float]]
+
+
+class NodeAgent(IAgent):
+    """Agent de test : répond après `delay_s`, ou lève `error` ; suit les appels en cours"""
+
+    def __init__(self, response: Response = "ok", delay_s: Delay = 0.0, error: Optional[BaseException] = None):
+        self.response = response
+        self.delay_s = delay_s
+        self.error = error
+        self.inputs: List[Any] = []
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = 0
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.execute_stream(input_data, context, IAgentObserver())
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        self.inputs.append(input_data)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay_s(input_data) if callable(self.delay_s) else self.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+        if self.error is not None:
+            raise self.error
+        return self.response(input_data) if callable(self.response) else self.response
+
+    @property
+    def calls(self) -> int:
+        return len(self.inputs)
+
+    def get_name(self) -> str:
+        return "node-agent"
+
+
+class FakeAgentFactory:
+    """Remplace l'AgentFactory de l'exécuteur : un agent de test par nœud"""
+
+    def __init__(self, agents: Mapping[str, IAgent]):
+        self.agents = dict(agents)
+        self.rate_limiter = RateLimiterRegistry()
+
+    def get_agent(self, node: CompiledNode) -> IAgent:
+        return self.agents[node.id]
+
+
+class VirtualClock:
+    """Horloge de test : quand la boucle n'a plus rien à exécuter, le temps saute à la prochaine échéance"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    @contextmanager
+    def patch_loop(self) -> Iterator[None]:
+        """Fait tourner la boucle courante (sleep, timeouts) sur cette horloge"""
+        loop = asyncio.get_running_loop()
+        select = loop._selector.select
+
+        def virtual_select(timeout: Optional[float] = None):
+            if timeout is None:
+                return select(None)
+            self.now += timeout
+            return select(0)
+
+        with mock.patch.object(loop, "time", self.monotonic), mock.patch.object(loop._selector, "select", virtual_select):
+            yield
+
+
+def node(node_id: str, type: str = "process", **fields: Any) -> Dict[str, Any]:
+    return {"id": node_id, "name": node_id, "type": type, "agent_config": {}, **fields}
+
+
+def edge(from_node: str, to_node: str, condition: Optional[str] = None) -> Dict[str, Any]:
+    return {"from_node": from_node, "to_node": to_node, "condition": condition}
+
+
+def compile_workflow(nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], **options: Any) -> CompiledWorkflow:
+    definition = {"name": "test", "description": "", "start_node": nodes[0]["id"], "nodes": nodes, "edges": edges, **options}
+    return CompiledWorkflow.from_definition(WorkflowDefinition(**definition), source=definition)
+
+
+def executor(agents: Mapping[str, IAgent], **options: Any) -> WorkflowExecutor:
+    return WorkflowExecutor(FakeAgentFactory(agents), **options)
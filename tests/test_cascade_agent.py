@@ -0,0 +1,73 @@
+from typing import Any, Dict, List, Tuple
+
+from src.domain.interfaces.i_agent import IAgent
+from src.domain.interfaces.i_agent_observer import IAgentObserver
+from src.infrastructure.agents.cascade_agent import CascadeAgent
+from src.infrastructure.routing.cascade_policy import CascadePolicy
+
+
+class ToolUsingAgent(IAgent):
+    """Appelle un outil, streame sa réponse puis la retourne"""
+
+    def __init__(self, name: str, output: Any):
+        self.name = name
+        self.output = output
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.execute_stream(input_data, context, IAgentObserver())
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        observer.on_token(f"{self.name} thinks ")
+        observer.on_tool_call("search", {"by": self.name})
+        observer.on_token(f"{self.name} answers")
+        return self.output
+
+    def get_name(self) -> str:
+        return self.name
+
+
+class RecordingObserver(IAgentObserver):
+    stream_tokens = True
+
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+
+    def on_token(self, delta: str) -> None:
+        self.events.append(("token", delta))
+
+    def on_tool_call(self, tool_name: str, args: Any) -> None:
+        self.events.append(("tool", args["by"]))
+
+    def on_cascade(self, model: str, outcome: str) -> None:
+        self.events.append(("cascade", f"{model} {outcome}"))
+
+
+def cascade() -> CascadeAgent:
+    tiers = [("cheap", ToolUsingAgent("cheap", {"text": "no decision"})), ("mid", ToolUsingAgent("mid", {"approved": True}))]
+    policy = CascadePolicy(models=("cheap", "mid"), required_fields=("approved",))
+    return CascadeAgent(ToolUsingAgent("large", {"approved": False}), tiers, policy, "large")
+
+
+async def test_only_the_accepted_tier_events_are_relayed_in_order():
+    observer = RecordingObserver()
+
+    assert await cascade().execute_stream("input", {}, observer) == {"approved": True}
+
+    # Les tokens et appels d'outils du palier rejeté ne sont jamais relayés
+    assert observer.events == [
+        ("cascade", "cheap missing_field"),
+        ("token", "mid thinks "),
+        ("tool", "mid"),
+        ("token", "mid answers"),
+        ("cascade", "mid accepted"),
+    ]
+
+
+async def test_final_model_streams_directly():
+    agent = cascade()
+    agent.tiers[1] = ("mid", ToolUsingAgent("mid", {"text": "no decision"}))
+    observer = RecordingObserver()
+
+    assert await agent.execute_stream("input", {}, observer) == {"approved": False}
+
+    assert observer.events[2:] == [("token", "large thinks "), ("tool", "large"), ("token", "large answers"), ("cascade", "large final")]
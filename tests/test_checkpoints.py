@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from typing import Dict, Tuple
+
+import pytest
+
+from src.core.execution_events import NodeStarted
+from src.domain.entities.workflow_checkpoint import WorkflowCheckpoint
+from src.infrastructure.checkpoints.file_checkpoint_store import FileCheckpointStore
+from src.infrastructure.checkpoints.sqlite_checkpoint_store import SQLiteCheckpointStore
+from tests.fakes import NodeAgent, compile_workflow, edge, executor, node
+
+
+class GatedFileCheckpointStore(FileCheckpointStore):
+    """Store dont les écritures attendent `release` : un chargement peut tomber pendant l'écriture"""
+
+    def __init__(self, directory: str, **kwargs):
+        super().__init__(directory, **kwargs)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def _write_many(self, records: Dict[str, Tuple[WorkflowCheckpoint, bytes]]) -> None:
+        self.writing.set()
+        self.release.wait(5)
+        super()._write_many(records)
+
+
+def checkpoint(total_iterations: int, node_id: str, delta: bool) -> WorkflowCheckpoint:
+    return WorkflowCheckpoint(
+        run_id="run",
+        workflow_name="test",
+        next_node_id=node_id,
+        total_iterations=total_iterations,
+        execution_history=[{"node_id": f"step {total_iterations}"}],
+        history_start=total_iterations - 1,
+        history_delta=delta,
+        updated_at="2026-01-01T00:00:00",
+    )
+
+
+@pytest.fixture(params=["file", "sqlite"])
+async def store(request, tmp_path):
+    store = FileCheckpointStore(str(tmp_path)) if request.param == "file" else SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    yield store
+    await store.close()
+
+
+async def test_resumes_a_crashed_run_after_its_last_completed_node(store):
+    workflow = compile_workflow(
+        [node("a"), node("b"), node("c"), node("end", "end")],
+        [edge("a", "b"), edge("b", "c"), edge("c", "end")],
+    )
+    agents = {"a": NodeAgent("A"), "b": NodeAgent(lambda data: f"{data}B"), "c": NodeAgent(error=RuntimeError("crash"))}
+    run_ids = set()
+    with pytest.raises(RuntimeError, match="crash"):
+        async for event in executor(agents, checkpoint_store=store).execute_stream(workflow, "input"):
+            if isinstance(event, NodeStarted):
+                run_ids.add(event.run_id)
+    (run_id,) = run_ids
+
+    saved = await store.load(run_id)
+    assert saved.next_node_id == "c"
+    assert saved.current_data == "AB"
+    assert [step["node_id"] for step in saved.execution_history] == ["a", "b"]
+
+    agents["c"] = NodeAgent(lambda data: f"{data}C")
+    result = await executor(agents, checkpoint_store=store).resume(workflow, saved)
+
+    # Les nœuds déjà terminés ne sont pas ré-exécutés
+    assert agents["a"].calls == agents["b"].calls == 1
+    assert result["run_id"] == run_id
+    assert result["final_result"] == "ABC"
+    assert [step["node_id"] for step in result["execution_history"]] == ["a", "b", "c", "end"]
+    assert result["node_iterations"] == {"a": 1, "b": 1, "c": 1, "end": 1}
+
+    completed = await store.load(run_id)
+    assert completed.completed
+    assert [step["node_id"] for step in completed.execution_history] == ["a", "b", "c", "end"]
+
+
+async def test_load_during_a_flush_sees_the_batch_being_written(tmp_path):
+    store = GatedFileCheckpointStore(str(tmp_path), batch_size=10)
+    await store.save(checkpoint(1, "b", delta=False))
+    await store.flush()
+
+    store.writing.clear()
+    store.release.clear()
+    await store.save(checkpoint(2, "c", delta=True))
+    flush = asyncio.create_task(store.flush())
+    await asyncio.to_thread(store.writing.wait, 5)
+
+    load = asyncio.create_task(store.load("run"))
+    await asyncio.sleep(0.02)
+    # Le chargement attend la fin de l'écriture plutôt que de lire un checkpoint périmé
+    assert not load.done()
+    store.release.set()
+    await flush
+    loaded = await load
+
+    assert loaded.next_node_id == "c"
+    assert loaded.total_iterations == 2
+    assert [step["node_id"] for step in loaded.execution_history] == ["step 1", "step 2"]
+    await store.close()
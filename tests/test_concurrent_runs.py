@@ -0,0 +1,91 @@
+import asyncio
+import copy
+import json
+import random
+import re
+from typing import Any, AsyncIterator, Dict, List
+
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+from src.application.services.workflow_service import WorkflowService
+from src.blueprints import WRITER_REVIEWER_WORKFLOW
+
+RUNS = 100
+TOPIC = re.compile(r"(STRICT )?article \d+")
+
+
+def topic(index: int) -> str:
+    """Les sujets "STRICT" sont rejetés une fois : la boucle writer → reviewer dépend de l'exécution"""
+    return f"STRICT article {index}" if index % 2 else f"article {index}"
+
+
+def last_prompt(messages: List[ModelMessage]) -> str:
+    prompts = [part.content for message in messages for part in message.parts if part.part_kind == "user-prompt"]
+    return str(prompts[-1]) if prompts else ""
+
+
+def fake_model(role: str) -> FunctionModel:
+    """Modèle local qui répond d'après le sujet trouvé dans le prompt, après une latence aléatoire"""
+
+    async def answer(messages: List[ModelMessage]) -> Any:
+        # Les étapes des exécutions concurrentes s'entrelacent
+        await asyncio.sleep(random.uniform(0.0, 0.003))
+        subject = TOPIC.search(last_prompt(messages)).group()
+        if role == "reviewer":
+            return {"approved": not subject.startswith("STRICT"), "feedback": f"rewrite {subject.removeprefix('STRICT ')}"}
+        return f"{role}: {subject}"
+
+    async def respond(messages: List[ModelMessage], info: AgentInfo) -> ModelResponse:
+        value = await answer(messages)
+        if info.output_tools:
+            return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, value)])
+        return ModelResponse(parts=[TextPart(value if isinstance(value, str) else json.dumps(value))])
+
+    async def stream(messages: List[ModelMessage], info: AgentInfo) -> AsyncIterator[Any]:
+        value = await answer(messages)
+        if info.output_tools:
+            yield {0: DeltaToolCall(name=info.output_tools[0].name, json_args=json.dumps(value))}
+        else:
+            yield value if isinstance(value, str) else json.dumps(value)
+
+    return FunctionModel(respond, stream_function=stream, model_name=f"fake-{role}")
+
+
+def writer_reviewer() -> Dict[str, Any]:
+    definition = copy.deepcopy(WRITER_REVIEWER_WORKFLOW)
+    for node in definition["nodes"]:
+        if node["type"] != "end":
+            node["agent_config"]["model"] = fake_model(node["id"])
+    return definition
+
+
+async def run_concurrently() -> List[Dict[str, Any]]:
+    service = WorkflowService()
+    definition = writer_reviewer()
+    return await asyncio.gather(*(service.execute_workflow_from_json(definition, topic(index)) for index in range(RUNS)))
+
+
+def test_overlapping_runs_keep_their_own_history():
+    results = asyncio.run(run_concurrently())
+
+    assert len({result["run_id"] for result in results}) == RUNS
+    for index, result in enumerate(results):
+        loops = 2 if index % 2 else 1
+        history = result["execution_history"]
+        assert [step["node_id"] for step in history] == ["manager_initial"] + ["writer", "reviewer"] * loops + ["manager_final", "end"]
+        assert history[0]["input"] == topic(index)
+        # Aucune étape ne voit les données d'une autre exécution
+        for step in history:
+            assert re.search(rf"article {index}\b", str(step["output"]))
+
+
+def test_iteration_counters_are_per_run():
+    results = asyncio.run(run_concurrently())
+
+    for index, result in enumerate(results):
+        loops = 2 if index % 2 else 1
+        assert result["node_iterations"] == {"manager_initial": 1, "writer": loops, "reviewer": loops, "manager_final": 1, "end": 1}
+        assert result["total_iterations"] == 3 + 2 * loops
+        # Chaque étape est numérotée d'après les itérations de sa propre exécution
+        assert [step["iteration"] for step in result["execution_history"] if step["node_id"] == "writer"] == list(range(1, loops + 1))
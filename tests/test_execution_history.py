@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from src.infrastructure.history.jsonl_history_store import JsonlHistoryStore
+from src.infrastructure.history.memory_history_store import MemoryHistoryStore
+from tests.fakes import NodeAgent, compile_workflow, edge, executor, node
+
+
+@pytest.fixture(params=["memory", "jsonl"])
+async def history_store(request, tmp_path):
+    store = MemoryHistoryStore() if request.param == "memory" else JsonlHistoryStore(str(tmp_path / "history.jsonl"))
+    yield store
+    if request.param == "jsonl":
+        await store.close()
+
+
+async def test_result_history_is_a_list_of_plain_steps(history_store):
+    workflow = compile_workflow([node("a"), node("b"), node("end", "end")], [edge("a", "b"), edge("b", "end")])
+    agents = {"a": NodeAgent({"draft": 1}), "b": NodeAgent(lambda data: {**data, "reviewed": True})}
+
+    result = await executor(agents, history_store=history_store).execute(workflow, "input")
+
+    history = result["execution_history"]
+    assert type(history) is list
+    assert all(type(step) is dict for step in history)
+    assert [(step["node_id"], step["iteration"], step["input"], step["output"]) for step in history] == [
+        ("a", 1, "input", {"draft": 1}),
+        ("b", 1, {"draft": 1}, {"draft": 1, "reviewed": True}),
+        ("end", 1, {"draft": 1, "reviewed": True}, {"draft": 1, "reviewed": True}),
+    ]
+    # Sérialisable tel quel
+    assert json.loads(json.dumps(history)) == history
@@ -0,0 +1,103 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.core.run_limits import ItemLimitExceeded
+from tests.fakes import NodeAgent, compile_workflow, edge, executor, node
+
+
+def mapped(on_error: str, loop: bool = False, max_iterations: Optional[int] = None, **options: Any):
+    """each → end, où each exécute `work` pour chaque élément de `items` ; `loop` reboucle work tant qu'il est incomplet"""
+    nodes = [
+        node("each", "map", map={"items_path": "items", "node": "work", "on_error": on_error}),
+        node("work", max_iterations=max_iterations),
+        node("end", "end"),
+    ]
+    edges = [edge("each", "end")] + ([edge("work", "work", "incomplete")] if loop else [])
+    return compile_workflow(nodes, edges, **options)
+
+
+def double(item: int) -> int:
+    if item == 2:
+        raise ValueError("bad item")
+    return item * 2
+
+
+def countdown(data: Any) -> Dict[str, Any]:
+    """Un élément n demande n passages"""
+    left = (data if isinstance(data, int) else data["left"]) - 1
+    return {"left": left, "complete": left <= 0}
+
+
+DONE = {"left": 0, "complete": True}
+
+
+async def test_map_runs_the_sub_node_for_each_item_in_order():
+    agent = NodeAgent(lambda item: item * 2, delay_s=lambda item: 0.01 * (5 - item))
+
+    result = await executor({"work": agent}).execute(mapped("fail_fast"), {"items": [1, 3, 5]})
+
+    assert result["final_result"] == [2, 6, 10]
+    assert result["node_iterations"] == {"each": 1, "work": 3, "end": 1}
+    # Les éléments ne consomment pas le budget d'itérations de l'exécution
+    assert result["total_iterations"] == 2
+
+
+async def test_fail_fast_cancels_the_other_items():
+    agent = NodeAgent(double, delay_s=lambda item: 0.0 if item == 2 else 5.0)
+
+    with pytest.raises(ValueError, match="bad item"):
+        await asyncio.wait_for(executor({"work": agent}).execute(mapped("fail_fast"), {"items": [1, 2, 3]}), 1.0)
+
+    assert agent.cancelled == 2
+    assert agent.running == 0
+
+
+@pytest.mark.parametrize(
+    "on_error, expected",
+    [
+        ("skip", [2, 6]),
+        ("collect", [2, {"error": "ValueError: bad item", "index": 1}, 6]),
+    ],
+)
+async def test_failed_items_are_skipped_or_collected(on_error: str, expected: List[Any]):
+    result = await executor({"work": NodeAgent(double)}).execute(mapped(on_error), {"items": [1, 2, 3]})
+
+    assert result["final_result"] == expected
+    assert result["stop_reason"] == "completed"
+
+
+async def test_each_item_counts_its_own_node_iterations():
+    # 1 + 3 passages dépasseraient un compteur partagé : chaque élément a droit à ses 3 passages
+    workflow = mapped("collect", loop=True, max_iterations=3)
+
+    result = await executor({"work": NodeAgent(countdown)}).execute(workflow, {"items": [1, 3, 5]})
+
+    assert result["final_result"] == [
+        DONE,
+        DONE,
+        {"error": "ItemLimitExceeded: Node 'work' stopped: max_iterations (3) reached in map item", "index": 2},
+    ]
+    assert result["stop_reason"] == "completed"
+    assert result["node_iterations"] == {"each": 1, "work": 7, "end": 1}
+
+
+async def test_item_cycles_are_bounded_by_max_total_iterations():
+    workflow = mapped("skip", loop=True, max_total_iterations=4)
+
+    result = await executor({"work": NodeAgent(countdown)}).execute(workflow, {"items": [1, 3, 5]})
+
+    # L'élément 5 dépasse 4 étapes ; les 1 + 3 + 4 étapes des éléments ne comptent pas dans celles de l'exécution
+    assert result["final_result"] == [DONE, DONE]
+    assert result["stop_reason"] == "completed"
+    assert result["total_iterations"] == 2
+
+
+async def test_item_limit_fails_a_fail_fast_map():
+    workflow = mapped("fail_fast", loop=True, max_iterations=3)
+
+    with pytest.raises(ItemLimitExceeded, match="max_iterations") as failure:
+        await executor({"work": NodeAgent(countdown)}).execute(workflow, {"items": [1, 5]})
+
+    assert failure.value.node_id == "work"
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from tests.fakes import NodeAgent, compile_workflow, edge, executor, node
+
+
+def fan_out(branches: List[str], merge_strategy: str = "by_branch", **parallel: Any):
+    nodes = [node("fan", "parallel", **parallel)] + [node(branch) for branch in branches]
+    nodes += [node("join", "sync", merge_strategy=merge_strategy), node("end", "end")]
+    edges = [edge("fan", branch) for branch in branches] + [edge(branch, "join") for branch in branches] + [edge("join", "end")]
+    return compile_workflow(nodes, edges)
+
+
+async def test_branches_run_concurrently():
+    # Un même agent pour les deux branches : ses appels se chevauchent
+    shared = NodeAgent(lambda data: f"done {data}", delay_s=0.05)
+
+    result = await executor({"a": shared, "b": shared}).execute(fan_out(["a", "b"]), "input")
+
+    assert shared.max_running == 2
+    assert result["final_result"] == {"a": "done input", "b": "done input"}
+    assert result["node_iterations"] == {"fan": 1, "a": 1, "b": 1, "join": 1, "end": 1}
+    assert [step["node_id"] for step in result["execution_history"]][-2:] == ["join", "end"]
+
+
+@pytest.mark.parametrize(
+    "strategy, expected",
+    [
+        ("by_branch", {"a": {"x": 1, "y": 1}, "b": {"y": 2}, "c": "text"}),
+        ("list", [{"x": 1, "y": 1}, {"y": 2}, "text"]),
+        # La dernière branche l'emporte ; une sortie non dict est rangée sous sa branche
+        ("merge_dicts", {"x": 1, "y": 2, "c": "text"}),
+        ("concat", "{'x': 1, 'y': 1}\n\n{'y': 2}\n\ntext"),
+    ],
+)
+async def test_sync_node_merges_branch_outputs(strategy: str, expected: Any):
+    agents = {"a": NodeAgent({"x": 1, "y": 1}, delay_s=0.02), "b": NodeAgent({"y": 2}), "c": NodeAgent("text", delay_s=0.01)}
+
+    result = await executor(agents).execute(fan_out(["a", "b", "c"], strategy), "input")
+
+    # Ordre de déclaration des branches, quel que soit leur ordre de fin
+    assert result["final_result"] == expected
+
+
+async def test_max_concurrency_bounds_running_branches():
+    shared = NodeAgent(delay_s=0.02)
+    branches = ["a", "b", "c", "d", "e"]
+
+    result = await executor(dict.fromkeys(branches, shared)).execute(fan_out(branches, "list", max_concurrency=2), "input")
+
+    assert shared.max_running == 2
+    assert shared.calls == len(branches)
+    assert result["final_result"] == ["ok"] * len(branches)
+
+
+async def test_failing_branch_cancels_its_siblings():
+    slow = NodeAgent(delay_s=5.0)
+    agents: Dict[str, NodeAgent] = {"a": NodeAgent(error=RuntimeError("branch failed"), delay_s=0.01), "b": slow}
+
+    with pytest.raises(RuntimeError, match="branch failed"):
+        await asyncio.wait_for(executor(agents).execute(fan_out(["a", "b"]), "input"), 1.0)
+
+    assert slow.cancelled == 1
+    assert slow.running == 0
@@ -0,0 +1,165 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from src.infrastructure.resilience import rate_limiter
+from src.infrastructure.resilience.rate_limiter import RateLimiter, RateLimiterRegistry, rate_limit_scope
+from tests.fakes import VirtualClock
+
+
+@pytest.fixture
+async def clock(monkeypatch):
+    clock = VirtualClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    with clock.patch_loop():
+        yield clock
+
+
+async def acquire_in(limiter: RateLimiter, flow: str, served: List[str], name: str, priority: int = 0, run_id: Optional[str] = None) -> float:
+    with rate_limit_scope(flow, priority, run_id):
+        wait_s = await limiter.acquire(10)
+    served.append(name)
+    return wait_s
+
+
+async def test_requests_per_minute(clock):
+    limiter = RateLimiter("model", requests_per_minute=2)
+
+    waits = [await limiter.acquire(10) for _ in range(4)]
+
+    # Deux requêtes en réserve, puis une toutes les 30 s
+    assert waits == pytest.approx([0.0, 0.0, 30.0, 30.0])
+    assert clock.now == pytest.approx(60.0)
+    assert limiter.stats()["delayed"] == 2
+
+
+async def test_tokens_per_minute(clock):
+    limiter = RateLimiter("model", tokens_per_minute=600)
+
+    assert await limiter.acquire(500) == 0.0
+    # 10 tokens par seconde : il manque 100 tokens
+    assert await limiter.acquire(200) == pytest.approx(10.0)
+    # Une estimation supérieure à la capacité n'attend que le seau plein
+    assert await limiter.acquire(1000) == pytest.approx(60.0)
+
+
+async def test_waiting_calls_take_turns_between_flows(clock):
+    limiter = RateLimiter("model", requests_per_minute=1)
+    served: List[str] = []
+    await acquire_in(limiter, "a", served, "a1")
+
+    calls = [asyncio.create_task(acquire_in(limiter, "a", served, name)) for name in ("a2", "a3", "a4")]
+    await asyncio.sleep(0)
+    calls.append(asyncio.create_task(acquire_in(limiter, "b", served, "b1")))
+    await asyncio.gather(*calls)
+
+    # b1, arrivé après toute la rafale de a, passe dès le tour suivant
+    assert served == ["a1", "a2", "b1", "a3", "a4"]
+    assert limiter.stats()["max_queue_depth"] == 4
+
+
+async def test_higher_priority_calls_go_first(clock):
+    limiter = RateLimiter("model", requests_per_minute=1)
+    served: List[str] = []
+    await acquire_in(limiter, "a", served, "first")
+
+    calls = [asyncio.create_task(acquire_in(limiter, "a", served, name)) for name in ("low 1", "low 2")]
+    await asyncio.sleep(0)
+    calls.append(asyncio.create_task(acquire_in(limiter, "b", served, "urgent", priority=1)))
+    await asyncio.gather(*calls)
+
+    assert served == ["first", "urgent", "low 1", "low 2"]
+
+
+async def test_cancelled_waiting_call_consumes_no_quota(clock):
+    limiter = RateLimiter("model", requests_per_minute=1)
+    await limiter.acquire(10)
+
+    waiting = asyncio.create_task(limiter.acquire(10))
+    await asyncio.sleep(10)
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+
+    assert limiter.queue_depth == 0
+    # Le quota regagné depuis revient entièrement à l'appel suivant
+    assert await limiter.acquire(10) == pytest.approx(50.0)
+
+
+async def test_settle_corrects_the_estimate_with_real_usage(clock):
+    limiter = RateLimiter("model", requests_per_minute=10, tokens_per_minute=600)
+
+    await limiter.acquire(100)
+    limiter.settle(100, 250, requests=3)
+
+    assert limiter.tokens.level == pytest.approx(350)
+    assert limiter.requests.level == pytest.approx(7)
+    # Une consommation surestimée rend la différence
+    limiter.settle(100, 40)
+    assert limiter.tokens.level == pytest.approx(410)
+
+
+async def test_prefetched_quota_serves_the_next_call_of_its_run(clock):
+    limiter = RateLimiter("model", requests_per_minute=2, tokens_per_minute=600)
+    with rate_limit_scope("flow", run_id="run"):
+        limiter.prefetch(100)
+        await asyncio.sleep(0)
+        assert limiter.stats()["prefetched"] == 1
+
+        # Seul l'écart avec l'estimation réservée est consommé, sans requête supplémentaire
+        assert await limiter.acquire(150) == 0.0
+
+    assert limiter.stats()["prefetched"] == 0
+    assert limiter.requests.level == pytest.approx(1)
+    assert limiter.tokens.level == pytest.approx(450)
+
+
+async def test_call_waits_for_the_prefetch_already_queued_for_its_run(clock):
+    limiter = RateLimiter("model", requests_per_minute=1)
+    await limiter.acquire(10)
+    with rate_limit_scope("flow", run_id="run"):
+        limiter.prefetch(10)
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        assert await limiter.acquire(10) == pytest.approx(60.0)
+
+    # Une seule requête décomptée pour la réservation et l'appel qu'elle sert
+    assert limiter.queue_depth == 0
+    assert limiter.requests.level == pytest.approx(0)
+
+
+async def test_release_refunds_the_unused_prefetches_of_a_run(clock):
+    registry = RateLimiterRegistry({"openai": {"requests_per_minute": 2, "tokens_per_minute": 600}})
+    limiter = registry.limiter("openai:gpt-4o")
+    with rate_limit_scope("flow", run_id="run"):
+        limiter.prefetch(100)
+        await asyncio.sleep(0)
+    with rate_limit_scope("flow", run_id="other"):
+        limiter.prefetch(100)
+        await asyncio.sleep(0)
+    assert limiter.tokens.level == pytest.approx(400)
+
+    registry.release("run")
+
+    # Seules les réservations de l'exécution libérée sont rendues
+    assert limiter.stats()["prefetched"] == 1
+    assert limiter.requests.level == pytest.approx(1)
+    assert limiter.tokens.level == pytest.approx(500)
+
+
+async def test_release_cancels_a_queued_prefetch(clock):
+    limiter = RateLimiter("model", requests_per_minute=1)
+    await limiter.acquire(10)
+    with rate_limit_scope("flow", run_id="run"):
+        limiter.prefetch(10)
+        await asyncio.sleep(0)
+
+    limiter.release("run")
+    await asyncio.sleep(0)
+
+    assert limiter.queue_depth == 0
+    await asyncio.sleep(60)
+    assert limiter.stats()["prefetched"] == 0
+    # La requête regagnée n'a pas été prise par la réservation annulée
+    assert await limiter.acquire(10) == 0.0
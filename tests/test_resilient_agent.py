@@ -0,0 +1,260 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import pytest
+from pydantic_ai.exceptions import ModelHTTPError
+
+from src.domain.interfaces.i_agent import IAgent
+from src.domain.interfaces.i_agent_observer import IAgentObserver
+from src.infrastructure.agents import resilient_agent
+from src.infrastructure.agents.resilient_agent import ResilientAgent
+from src.infrastructure.resilience.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.infrastructure.resilience.model_health import ModelHealthRegistry
+
+MODEL = "sim:primary"
+FALLBACK = "sim:fallback"
+# Non remplacé par la fixture `sleeps`
+_sleep = asyncio.sleep
+
+
+@dataclass
+class Step:
+    """Comportement d'un appel : tokens émis, puis erreur ou résultat après `delay_s`"""
+
+    result: Any = "ok"
+    tokens: Sequence[str] = ()
+    error: Optional[BaseException] = None
+    delay_s: float = 0.0
+    usage: Optional[Mapping[str, int]] = None
+
+
+class ScriptedAgent(IAgent):
+    """Agent de test : chaque appel joue l'étape suivante du script (la dernière se répète)"""
+
+    def __init__(self, *steps: Step):
+        self.steps = steps or (Step(),)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.execute_stream(input_data, context, IAgentObserver())
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        step = self.steps[min(self.calls, len(self.steps) - 1)]
+        self.calls += 1
+        for token in step.tokens:
+            observer.on_token(token)
+        try:
+            await _sleep(step.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if step.error is not None:
+            raise step.error
+        observer.on_agent_run(step.delay_s, 0.0, step.usage or {"requests": 1, "request_tokens": 10, "response_tokens": 5})
+        return step.result
+
+    def get_name(self) -> str:
+        return "scripted"
+
+
+class RecordingObserver(IAgentObserver):
+    stream_tokens = True
+
+    def __init__(self):
+        self.tokens: List[str] = []
+        self.usages: List[Mapping[str, int]] = []
+        self.retries: List[BaseException] = []
+
+    def on_token(self, delta: str) -> None:
+        self.tokens.append(delta)
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        self.usages.append(usage)
+
+    def on_retry(self, error: BaseException) -> None:
+        self.retries.append(error)
+
+
+def unavailable() -> ModelHTTPError:
+    return ModelHTTPError(503, MODEL, {"error": "overloaded"})
+
+
+def resilient(
+    agent: IAgent, health: Optional[ModelHealthRegistry] = None, fallback: Optional[IAgent] = None, **config: Any
+) -> ResilientAgent:
+    fallback_factory = (lambda: fallback) if fallback is not None else None
+    if fallback is not None:
+        config["fallback_model"] = FALLBACK
+    return ResilientAgent(agent, {"model": MODEL, **config}, health or ModelHealthRegistry(), fallback_factory)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> List[float]:
+    """Délais de backoff demandés par l'agent (l'attente elle-même est court-circuitée)"""
+    delays: List[float] = []
+
+    async def record(delay: float, *args: Any) -> None:
+        delays.append(delay)
+        await _sleep(0)
+
+    monkeypatch.setattr(resilient_agent.asyncio, "sleep", record)
+    return delays
+
+
+async def test_retries_transient_errors_with_exponential_backoff(sleeps):
+    agent = ScriptedAgent(Step(error=unavailable()), Step(error=unavailable()), Step(result="done"))
+    health = ModelHealthRegistry()
+    retry = {"max_attempts": 3, "initial_delay_s": 0.1, "multiplier": 2.0, "jitter": False}
+
+    assert await resilient(agent, health, retry=retry).execute("input", {}) == "done"
+    assert agent.calls == 3
+    assert sleeps == [0.1, 0.2]
+    assert health.stats()[MODEL]["retries"] == 2
+
+
+async def test_does_not_retry_non_transient_errors(sleeps):
+    agent = ScriptedAgent(Step(error=ValueError("invalid prompt")))
+
+    with pytest.raises(ValueError):
+        await resilient(agent, retry={"max_attempts": 3, "jitter": False}).execute("input", {})
+    assert agent.calls == 1
+
+
+async def test_gives_up_after_max_attempts(sleeps):
+    agent = ScriptedAgent(Step(error=unavailable()))
+
+    with pytest.raises(ModelHTTPError):
+        await resilient(agent, retry={"max_attempts": 2, "initial_delay_s": 0.01, "jitter": False}).execute("input", {})
+    assert agent.calls == 2
+
+
+async def test_stream_forwards_only_tokens_of_the_successful_attempt(sleeps):
+    agent = ScriptedAgent(Step(tokens=("Bon", "jour"), error=unavailable()), Step(tokens=("Hello",), result="Hello"))
+    observer = RecordingObserver()
+
+    result = await resilient(agent, retry={"max_attempts": 2, "jitter": False}).execute_stream("input", {}, observer)
+
+    assert result == "Hello"
+    assert observer.tokens == ["Hello"]
+    assert len(observer.retries) == 1
+    assert len(observer.usages) == 1
+
+
+async def test_stream_is_live_with_a_single_attempt():
+    agent = ScriptedAgent(Step(tokens=("a", "b"), delay_s=0.05))
+    observer = RecordingObserver()
+
+    call = asyncio.create_task(resilient(agent, circuit_breaker={"failure_threshold": 3}).execute_stream("input", {}, observer))
+    await asyncio.sleep(0.01)
+    assert observer.tokens == ["a", "b"]
+    await call
+
+
+async def test_hedged_request_wins_and_slow_request_is_cancelled():
+    usage = {"requests": 1, "request_tokens": 7, "response_tokens": 3}
+    agent = ScriptedAgent(Step(tokens=("slow",), result="slow", delay_s=5.0), Step(tokens=("fast",), result="fast", usage=usage))
+    health = ModelHealthRegistry()
+    observer = RecordingObserver()
+
+    result = await asyncio.wait_for(resilient(agent, health, hedge={"delay_s": 0.01}).execute_stream("input", {}, observer), 1.0)
+
+    assert result == "fast"
+    assert agent.calls == 2
+    # La requête lente est annulée dès que la dupliquée l'emporte
+    await _sleep(0)
+    assert agent.cancelled == 1
+    # Flux et consommation de la requête dupliquée, qui l'a emporté
+    assert observer.tokens == ["fast"]
+    assert observer.usages == [usage]
+    assert health.stats()[MODEL]["hedges"] == 1
+    assert health.stats()[MODEL]["hedge_wins"] == 1
+
+
+async def test_no_hedge_when_first_request_answers_in_time():
+    agent = ScriptedAgent(Step(result="first"))
+    health = ModelHealthRegistry()
+
+    assert await resilient(agent, health, hedge={"delay_s": 1.0}).execute("input", {}) == "first"
+    assert agent.calls == 1
+    assert "hedges" not in health.stats()[MODEL]
+
+
+async def test_circuit_opens_after_consecutive_failures_then_half_opens():
+    health = ModelHealthRegistry()
+    breaker_config = {"failure_threshold": 2, "reset_timeout_s": 0.05}
+    failing = ScriptedAgent(Step(error=unavailable()))
+    agent = resilient(failing, health, circuit_breaker=breaker_config)
+
+    for _ in range(2):
+        with pytest.raises(ModelHTTPError):
+            await agent.execute("input", {})
+    breaker = health.breaker(MODEL)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Circuit ouvert : l'appel est refusé sans solliciter le modèle
+    with pytest.raises(CircuitOpenError):
+        await agent.execute("input", {})
+    assert failing.calls == 2
+
+    # Après le délai, un appel d'essai est autorisé ; son échec rouvre le circuit
+    await asyncio.sleep(0.06)
+    with pytest.raises(ModelHTTPError):
+        await agent.execute("input", {})
+    assert failing.calls == 3
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Un essai réussi referme le circuit
+    await asyncio.sleep(0.06)
+    recovered = resilient(ScriptedAgent(Step(result="back")), health, circuit_breaker=breaker_config)
+    assert await recovered.execute("input", {}) == "back"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_half_open_circuit_allows_a_single_probe():
+    health = ModelHealthRegistry()
+    breaker = health.breaker(MODEL, {"failure_threshold": 1, "reset_timeout_s": 0.0})
+    breaker.record_failure()
+    probe = ScriptedAgent(Step(result="probe", delay_s=0.05))
+    agent = resilient(probe, health, circuit_breaker={})
+
+    first = asyncio.create_task(agent.execute("input", {}))
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await agent.execute("input", {})
+    assert await first == "probe"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_falls_back_when_retries_are_exhausted(sleeps):
+    health = ModelHealthRegistry()
+    primary, fallback = ScriptedAgent(Step(error=unavailable())), ScriptedAgent(Step(result="fallback"))
+
+    result = await resilient(primary, health, fallback, retry={"max_attempts": 2, "jitter": False}).execute("input", {})
+
+    assert result == "fallback"
+    assert primary.calls == 2
+    assert fallback.calls == 1
+    assert health.stats()[MODEL]["fallbacks"] == 1
+
+
+async def test_falls_back_without_calling_model_when_circuit_is_open():
+    health = ModelHealthRegistry()
+    health.breaker(MODEL, {"failure_threshold": 1, "reset_timeout_s": 60}).record_failure()
+    primary, fallback = ScriptedAgent(), ScriptedAgent(Step(tokens=("repli",), result="fallback"))
+    observer = RecordingObserver()
+
+    result = await resilient(primary, health, fallback, circuit_breaker={}).execute_stream("input", {}, observer)
+
+    assert result == "fallback"
+    assert primary.calls == 0
+    assert observer.tokens == ["repli"]
+
+
+async def test_non_transient_errors_do_not_fall_back():
+    primary, fallback = ScriptedAgent(Step(error=ValueError("bad output"))), ScriptedAgent()
+
+    with pytest.raises(ValueError):
+        await resilient(primary, fallback=fallback).execute("input", {})
+    assert fallback.calls == 0
@@ -0,0 +1,187 @@
+import asyncio
+import gc
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from src.domain.interfaces.i_agent import IAgent
+from src.domain.interfaces.i_agent_observer import IAgentObserver
+from src.infrastructure.agents.cached_agent import CachedAgent
+from src.infrastructure.cache.result_cache import ResultCache
+
+
+class Computation:
+    """Calcul partagé de test : terminé par `done`, ou en échec avec `error`"""
+
+    def __init__(self, value: Any = None, error: BaseException = None):
+        self.value = value if value is not None else {"items": [1, 2]}
+        self.error = error
+        self.done = asyncio.Event()
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> Any:
+        self.calls += 1
+        try:
+            await self.done.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class StreamingAgent(IAgent):
+    """Émet un token, attend `go`, puis un second token et rapporte sa consommation"""
+
+    def __init__(self):
+        self.go = asyncio.Event()
+        self.calls = 0
+
+    async def execute(self, input_data: Any, context: Dict[str, Any]) -> Any:
+        return await self.execute_stream(input_data, context, IAgentObserver())
+
+    async def execute_stream(self, input_data: Any, context: Dict[str, Any], observer: IAgentObserver) -> Any:
+        self.calls += 1
+        observer.on_token("first ")
+        await self.go.wait()
+        observer.on_token("second")
+        observer.on_agent_run(0.1, 0.0, {"requests": 1, "request_tokens": 10, "response_tokens": 2})
+        return "first second"
+
+    def get_name(self) -> str:
+        return "streaming"
+
+
+class RecordingObserver(IAgentObserver):
+    stream_tokens = True
+
+    def __init__(self):
+        self.tokens: List[str] = []
+        self.usages: List[Mapping[str, int]] = []
+
+    def on_token(self, delta: str) -> None:
+        self.tokens.append(delta)
+
+    def on_agent_run(self, model_s: float, tools_s: float, usage: Mapping[str, int]) -> None:
+        self.usages.append(usage)
+
+
+async def test_concurrent_calls_share_one_computation():
+    cache, compute = ResultCache(), Computation()
+    callers = [asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(5)]
+    await asyncio.sleep(0)
+    compute.done.set()
+    results = await asyncio.gather(*callers)
+
+    assert compute.calls == 1
+    assert all(result == {"items": [1, 2]} for result in results)
+    # Chaque appelant reçoit sa copie
+    results[1]["items"].append(3)
+    assert results[0] == {"items": [1, 2]}
+    assert cache.stats()["coalesced"] == 4
+
+    assert await cache.get_or_compute("key", compute) == {"items": [1, 2]}
+    assert compute.calls == 1
+    assert cache.stats()["hits"] == 1
+
+
+async def test_computation_survives_while_a_caller_still_waits():
+    cache, compute = ResultCache(), Computation("value")
+    first = asyncio.create_task(cache.get_or_compute("key", compute))
+    second = asyncio.create_task(cache.get_or_compute("key", compute))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    compute.done.set()
+
+    assert await second == "value"
+    assert compute.cancelled == 0
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_computation_is_cancelled_when_every_caller_leaves():
+    cache, compute = ResultCache(), Computation("value")
+    callers = [asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert compute.cancelled == 1
+    # Un nouvel appel relance le calcul au lieu de rejoindre celui qui a été abandonné
+    compute.done.set()
+    assert await asyncio.wait_for(cache.get_or_compute("key", compute), 1.0) == "value"
+    assert compute.calls == 2
+
+
+async def test_timeout_of_the_only_caller_aborts_the_computation():
+    cache, compute = ResultCache(), Computation()
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(cache.get_or_compute("key", compute), 0.01)
+    await asyncio.sleep(0)
+
+    assert compute.cancelled == 1
+
+
+async def test_errors_reach_every_caller_and_are_not_cached():
+    cache, compute = ResultCache(), Computation(error=RuntimeError("provider down"))
+    callers = [asyncio.create_task(cache.get_or_compute("key", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    compute.done.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    compute.error = None
+    assert await cache.get_or_compute("key", compute) == {"items": [1, 2]}
+    assert compute.calls == 2
+
+
+async def test_error_of_an_abandoned_computation_is_retrieved():
+    reported = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: reported.append(context))
+
+    async def failing() -> Any:
+        try:
+            await asyncio.sleep(1)
+        finally:
+            raise RuntimeError("failed while cancelled")
+
+    cache = ResultCache()
+    caller = asyncio.create_task(cache.get_or_compute("key", failing))
+    await asyncio.sleep(0)
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.sleep(0)
+    gc.collect()
+    assert reported == []
+
+
+async def test_stream_events_reach_every_live_caller():
+    agent = StreamingAgent()
+    cached = CachedAgent(agent, ResultCache(), {"model": "sim:test"})
+    first, second, third = RecordingObserver(), RecordingObserver(), RecordingObserver()
+
+    calls = [asyncio.create_task(cached.execute_stream("input", {}, first))]
+    await asyncio.sleep(0)
+    calls += [asyncio.create_task(cached.execute_stream("input", {}, observer)) for observer in (second, third)]
+    await asyncio.sleep(0)
+    # Le premier appelant part : il ne reçoit plus rien, les autres continuent de recevoir le flux
+    calls[0].cancel()
+    await asyncio.sleep(0)
+    agent.go.set()
+
+    assert await calls[1] == await calls[2] == "first second"
+    assert agent.calls == 1
+    assert first.tokens == ["first "]
+    assert second.tokens == third.tokens == ["second"]
+    # Un seul appel au fournisseur : sa consommation n'est rapportée qu'une fois
+    assert len(second.usages) + len(third.usages) == 1
+    assert first.usages == []
@@ -0,0 +1,84 @@
+import pytest
+
+from src.infrastructure.checkpoints.file_checkpoint_store import FileCheckpointStore
+from tests.fakes import NodeAgent, compile_workflow, edge, executor, node
+
+
+@pytest.fixture
+async def store(tmp_path):
+    store = FileCheckpointStore(str(tmp_path))
+    yield store
+    await store.close()
+
+
+def loop(**options):
+    """a → a indéfiniment"""
+    return compile_workflow([node("a", max_iterations=options.pop("max_iterations", None))], [edge("a", "a")], **options)
+
+
+async def test_node_timeout_stops_the_run_and_stays_resumable(store):
+    # Le timeout tombe sur la dernière étape autorisée : la raison d'arrêt reste celle du timeout
+    workflow = compile_workflow([node("a"), node("b", timeout_s=0.01)], [edge("a", "b")], max_total_iterations=2)
+    agents = {"a": NodeAgent("A"), "b": NodeAgent(delay_s=5.0)}
+
+    result = await executor(agents, checkpoint_store=store).execute(workflow, "input")
+
+    assert result["stop_reason"] == "node_timeout"
+    assert result["stopped_at"] == "b"
+    assert result["final_result"] == "A"
+    assert agents["b"].cancelled == 1
+
+    saved = await store.load(result["run_id"])
+    assert not saved.completed
+    assert saved.next_node_id == "b"
+
+    agents["b"] = NodeAgent(lambda data: f"{data}B")
+    resumed = await executor(agents, checkpoint_store=store).resume(workflow, saved)
+    assert resumed["stop_reason"] == "completed"
+    assert resumed["final_result"] == "AB"
+
+
+async def test_run_deadline_stops_the_run_and_stays_resumable(store):
+    workflow = compile_workflow([node("a"), node("b"), node("end", "end")], [edge("a", "b"), edge("b", "end")], timeout_s=0.05)
+    agents = {"a": NodeAgent("A"), "b": NodeAgent(delay_s=5.0)}
+
+    result = await executor(agents, checkpoint_store=store).execute(workflow, "input")
+
+    assert result["stop_reason"] == "run_deadline"
+    assert result["stopped_at"] == "b"
+    assert result["final_result"] == "A"
+    assert not (await store.load(result["run_id"])).completed
+
+
+async def test_node_max_iterations_stops_the_run(store):
+    # Le cap du nœud est atteint à la dernière étape autorisée par le workflow
+    agent = NodeAgent(lambda data: data + 1)
+
+    result = await executor({"a": agent}, checkpoint_store=store).execute(loop(max_iterations=2, max_total_iterations=3), 0)
+
+    assert result["stop_reason"] == "max_iterations"
+    assert result["stopped_at"] == "a"
+    assert result["final_result"] == 2
+    assert result["node_iterations"] == {"a": 2}
+    assert (await store.load(result["run_id"])).completed
+
+
+async def test_max_total_iterations_stops_the_run(store):
+    agent = NodeAgent(lambda data: data + 1)
+
+    result = await executor({"a": agent}, checkpoint_store=store).execute(loop(max_total_iterations=3), 0)
+
+    assert result["stop_reason"] == "max_total_iterations"
+    assert result["stopped_at"] == "a"
+    assert result["final_result"] == 3
+    assert result["total_iterations"] == 3
+    assert (await store.load(result["run_id"])).completed
+
+
+async def test_run_without_limits_completes():
+    workflow = compile_workflow([node("a"), node("end", "end")], [edge("a", "end")])
+
+    result = await executor({"a": NodeAgent("A")}).execute(workflow, "input")
+
+    assert result["stop_reason"] == "completed"
+    assert result["stopped_at"] is None
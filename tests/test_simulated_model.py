@@ -0,0 +1,33 @@
+from typing import List
+
+from pydantic_ai import Agent
+
+from src.core.run_context import run_scope
+from src.infrastructure.logs.log_context import bind
+from src.infrastructure.simulation.simulated_model import SimulatedModel
+from src.infrastructure.simulation.simulation_profile import SimulationProfile
+
+
+async def answers(agent: Agent, count: int) -> List[str]:
+    return [(await agent.run("prompt")).output for _ in range(count)]
+
+
+async def test_responses_restart_for_each_run():
+    agent = Agent(SimulatedModel("test", SimulationProfile(responses=("first", "second", "third"))))
+
+    with run_scope("a"):
+        assert await answers(agent, 2) == ["first", "second"]
+    with run_scope("b"):
+        assert await answers(agent, 2) == ["first", "second"]
+    with run_scope("a"):
+        assert await answers(agent, 1) == ["third"]
+
+
+async def test_runs_are_told_apart_by_their_scope_not_by_log_fields():
+    agent = Agent(SimulatedModel("test", SimulationProfile(responses=("first", "second", "third"))))
+
+    with run_scope("a"):
+        assert await answers(agent, 2) == ["first", "second"]
+    # Les champs de logs peuvent être liés librement sans décaler les réponses d'une exécution
+    with run_scope("b"), bind(run_id="a"):
+        assert await answers(agent, 2) == ["first", "second"]
@@ -0,0 +1,81 @@
+import copy
+from typing import Any, Dict
+
+import pytest
+
+from src.application.services.workflow_service import WorkflowService
+from src.blueprints import MONO_AGENT_WITH_TOOLS, WRITER_REVIEWER_WORKFLOW
+
+
+@pytest.fixture
+async def service():
+    service = WorkflowService(simulation={})
+    yield service
+    await service.aclose()
+
+
+def definition(**changes: Any) -> Dict[str, Any]:
+    return {**copy.deepcopy(WRITER_REVIEWER_WORKFLOW), **changes}
+
+
+def test_rejects_edge_to_unknown_node(service):
+    broken = definition()
+    broken["edges"].append({"from_node": "reviewer", "to_node": "publisher", "condition": "approved"})
+
+    with pytest.raises(ValueError, match="unknown node 'publisher'"):
+        service.compile_workflow(broken)
+
+
+def test_rejects_edge_from_unknown_node(service):
+    broken = definition()
+    broken["edges"].append({"from_node": "publisher", "to_node": "end"})
+
+    with pytest.raises(ValueError, match="edge from unknown node 'publisher'"):
+        service.compile_workflow(broken)
+
+
+def test_rejects_duplicate_node_ids(service):
+    broken = definition()
+    broken["nodes"].append(copy.deepcopy(broken["nodes"][1]))
+
+    with pytest.raises(ValueError, match="duplicate node ids"):
+        service.compile_workflow(broken)
+
+
+def test_rejects_missing_start_node(service):
+    with pytest.raises(ValueError, match="start node 'intake' not found"):
+        service.compile_workflow(definition(start_node="intake"))
+
+
+def test_compiles_each_definition_once(service, monkeypatch):
+    compiled = service.compile_workflow(WRITER_REVIEWER_WORKFLOW)
+    # Une définition déjà compilée n'est plus resérialisée
+    monkeypatch.setattr("src.application.services.workflow_service.json.dumps", pytest.fail)
+
+    assert service.compile_workflow(WRITER_REVIEWER_WORKFLOW) is compiled
+
+
+def test_equal_definitions_share_their_plan(service):
+    compiled = service.compile_workflow(WRITER_REVIEWER_WORKFLOW)
+
+    assert service.compile_workflow(copy.deepcopy(WRITER_REVIEWER_WORKFLOW)) is compiled
+    assert service.compile_workflow(definition(name="Other")) is not compiled
+
+
+def test_least_recently_used_plans_are_evicted_with_their_agents(service):
+    service.max_compiled_workflows = 2
+    writer = service.compile_workflow(WRITER_REVIEWER_WORKFLOW)
+    mono = service.compile_workflow(MONO_AGENT_WITH_TOOLS)
+    writer_agents = len(service.agent_factory) - 1
+
+    # Le plan writer est le moins récemment utilisé : il est oublié au profit d'une copie renommée,
+    # dont les agents (mêmes configurations) restent construits
+    service.compile_workflow(definition(name="Copy"))
+    assert service.compile_workflow(MONO_AGENT_WITH_TOOLS) is mono
+    assert len(service.agent_factory) == writer_agents + 1
+
+    # Les agents d'un plan oublié qu'aucun autre plan n'utilise sont libérés
+    service.compile_workflow(definition(name="Other copy"))
+    service.compile_workflow(definition(name="Copy"))
+    assert len(service.agent_factory) == writer_agents
+    assert service.compile_workflow(WRITER_REVIEWER_WORKFLOW) is not writer